@@ -0,0 +1,168 @@
+"""Shared list/watch caches for frequently polled list tools.
+
+Enable with MCP_INFORMERS_ENABLED=true. Each (context, list function, args)
+gets a background thread that lists once, then applies watch events to an
+in-memory store, so repeat tool calls are served without a LIST against the
+API server. When disabled (the default), in stateless mode, or before the
+first sync completes, callers fall back to listing directly.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+from .k8s_config import is_stateless_mode, on_config_change
+
+logger = logging.getLogger("mcp-server")
+
+INFORMERS_ENABLED = os.environ.get("MCP_INFORMERS_ENABLED", "").lower() in ("1", "true", "yes")
+
+# Seconds a tool call waits for an informer's initial list before falling back
+INFORMER_SYNC_TIMEOUT = 10
+
+# Most informers kept running; the least recently used one is stopped beyond this
+MAX_INFORMERS = 16
+
+# Page size for the initial and recovery lists
+_LIST_PAGE_SIZE = 500
+
+# Seconds to wait before re-listing after an unexpected watch failure
+_RETRY_DELAY = 5
+
+
+class Informer:
+    """Keep a {uid: object} store of one resource list current via watch."""
+
+    def __init__(self, list_fn: Callable[..., Any], *args: Any):
+        self._list_fn = list_fn
+        self._args = args
+        self._store: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watch: Optional[watch.Watch] = None
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name=f"informer-{list_fn.__name__}"
+        )
+
+    def start(self):
+        """Start the list/watch thread."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop the list/watch thread."""
+        self._stopped.set()
+        if self._watch is not None:
+            self._watch.stop()
+
+    def items(self, timeout: float = 0) -> Optional[List[Any]]:
+        """Return a snapshot of the store, or None if it has not synced in time.
+
+        Items are ordered by namespace and name like a LIST response. They
+        are shared with other callers, so treat them as read-only.
+        """
+        if not self._synced.wait(timeout):
+            return None
+        with self._lock:
+            items = list(self._store.values())
+        items.sort(key=lambda obj: (obj.metadata.namespace or "", obj.metadata.name))
+        return items
+
+    def _relist(self) -> str:
+        """Replace the store with a fresh list and return its resourceVersion."""
+        store = {}
+        token = None
+        while True:
+            resp = self._list_fn(*self._args, limit=_LIST_PAGE_SIZE, _continue=token)
+            for obj in resp.items or []:
+                store[obj.metadata.uid] = obj
+            token = resp.metadata._continue
+            if not token:
+                break
+        with self._lock:
+            self._store = store
+        self._synced.set()
+        return resp.metadata.resource_version
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                resource_version = self._relist()
+                self._watch = watch.Watch()
+                for event in self._watch.stream(
+                    self._list_fn, *self._args,
+                    resource_version=resource_version,
+                    allow_watch_bookmarks=True,
+                ):
+                    event_type = event["type"]
+                    if event_type == "BOOKMARK":
+                        continue
+                    obj = event["object"]
+                    with self._lock:
+                        if event_type == "DELETED":
+                            self._store.pop(obj.metadata.uid, None)
+                        else:
+                            self._store[obj.metadata.uid] = obj
+            except ApiException as e:
+                if e.status != 410:
+                    logger.warning(f"Informer for {self._list_fn.__name__} failed: {e}")
+                    self._stopped.wait(_RETRY_DELAY)
+            except Exception as e:
+                logger.warning(f"Informer for {self._list_fn.__name__} failed: {e}")
+                self._stopped.wait(_RETRY_DELAY)
+
+
+_informers: "OrderedDict[tuple, Informer]" = OrderedDict()
+_informers_lock = threading.Lock()
+_callback_registered = False
+
+
+def stop_informers():
+    """Stop and forget every running informer."""
+    with _informers_lock:
+        informers = list(_informers.values())
+        _informers.clear()
+    for informer in informers:
+        informer.stop()
+
+
+def cached_list(context: str, list_fn: Callable[..., Any], *args: Any) -> Optional[List[Any]]:
+    """Return the items of list_fn(*args) from a shared informer.
+
+    Returns None when informers are disabled, in stateless mode, or when the
+    informer has not completed its initial list; the caller should list
+    directly in that case. Only the call that starts an informer waits for
+    its initial list (up to INFORMER_SYNC_TIMEOUT). At most MAX_INFORMERS
+    are kept; starting another stops the least recently used one.
+    """
+    global _callback_registered
+
+    if not INFORMERS_ENABLED or is_stateless_mode():
+        return None
+
+    key = (context or "default", list_fn.__name__, args)
+    timeout = 0
+    evicted = None
+    with _informers_lock:
+        informer = _informers.get(key)
+        if informer is None:
+            if not _callback_registered:
+                on_config_change(stop_informers)
+                _callback_registered = True
+            informer = Informer(list_fn, *args)
+            _informers[key] = informer
+            informer.start()
+            timeout = INFORMER_SYNC_TIMEOUT
+            if len(_informers) > MAX_INFORMERS:
+                _, evicted = _informers.popitem(last=False)
+        else:
+            _informers.move_to_end(key)
+
+    if evicted is not None:
+        evicted.stop()
+    return informer.items(timeout)
@@ -31,6 +31,12 @@ _kubeconfig_watcher: Optional["KubeconfigWatcher"] = None
 _kubeconfig_last_mtime: Dict[str, float] = {}
 _config_change_callbacks: List[Callable[[], None]] = []
 
+# Typed API handles (CoreV1Api, RbacAuthorizationV1Api, ...) keyed by (context, class)
+_api_handle_cache: Dict[tuple, Any] = {}
+
+# Lower bound for urllib3 pool size so concurrent tool calls share keep-alive sockets
+_MIN_CONNECTION_POOL_SIZE = 20
+
 
 class KubeconfigWatcher:
     """Watch kubeconfig files for changes and trigger reloads.
@@ -109,6 +115,7 @@ class KubeconfigWatcher:
         """Handle kubeconfig file change - invalidate caches."""
         global _config_loaded
         _config_loaded = False
+        _api_handle_cache.clear()
 
         if _HAS_PROVIDER:
             try:
@@ -193,6 +200,7 @@ def set_stateless_mode(enabled: bool):
     """
     global _stateless_mode
     _stateless_mode = enabled
+    _api_handle_cache.clear()
     if enabled:
         logger.info("Stateless mode enabled - API clients will not be cached")
     else:
@@ -305,6 +313,24 @@ def patch_kubernetes_config():
 patch_kubernetes_config()
 
 
+def _size_connection_pool(api_config: Any) -> Any:
+    """Raise the urllib3 pool size of a client Configuration before use."""
+    api_config.connection_pool_maxsize = max(
+        api_config.connection_pool_maxsize or 0, _MIN_CONNECTION_POOL_SIZE
+    )
+    return api_config
+
+
+def _accept_gzip(api_client: Any) -> Any:
+    """Ask the API server for gzip-compressed responses.
+
+    urllib3 decodes the body transparently, including for raw
+    (_preload_content=False) responses, so callers see plain JSON.
+    """
+    api_client.set_default_header("Accept-Encoding", "gzip")
+    return api_client
+
+
 def _load_config_for_context(context: str = "") -> Any:
     """
     Load kubernetes config for a specific context and return ApiClient.
@@ -325,7 +351,7 @@ def _load_config_for_context(context: str = "") -> Any:
     if not _stateless_mode and _HAS_PROVIDER:
         try:
             provider = get_provider()
-            return provider.get_api_client(context)
+            return _accept_gzip(provider.get_api_client(context))
         except UnknownContextError:
             raise
         except Exception as e:
@@ -336,14 +362,15 @@ def _load_config_for_context(context: str = "") -> Any:
 
     try:
         config.load_incluster_config()
-        return client.ApiClient()
+        api_config = _size_connection_pool(client.Configuration.get_default_copy())
+        return _accept_gzip(client.ApiClient(configuration=api_config))
     except ConfigException:
         pass
 
     kubeconfig_path = os.environ.get('KUBECONFIG', '~/.kube/config')
     kubeconfig_path = os.path.expanduser(kubeconfig_path)
 
-    api_config = client.Configuration()
+    api_config = _size_connection_pool(client.Configuration())
 
     if context:
         config.load_kube_config(
@@ -357,18 +384,31 @@ def _load_config_for_context(context: str = "") -> Any:
             client_configuration=api_config
         )
 
-    return client.ApiClient(configuration=api_config)
+    return _accept_gzip(client.ApiClient(configuration=api_config))
 
 
 def _get_client(context: str, client_class):
-    """Helper to create a configured Kubernetes API client."""
-    from kubernetes import client
+    """Helper to create a configured Kubernetes API client.
+
+    Handles are reused across tool calls unless stateless mode is enabled,
+    so every call for a context shares one ApiClient and its connection pool.
+    """
+    key = (context, client_class)
+    if not _stateless_mode:
+        cached = _api_handle_cache.get(key)
+        if cached is not None:
+            return cached
+
     try:
         api_client = _load_config_for_context(context)
-        return client_class(api_client=api_client)
+        handle = client_class(api_client=api_client)
     except Exception as e:
         raise RuntimeError(f"Invalid kube-config. Context: {context or 'default'}. Error: {e}")
 
+    if not _stateless_mode:
+        _api_handle_cache[key] = handle
+    return handle
+
 
 def get_k8s_client(context: str = ""):
     """Get a configured Kubernetes Core API client."""
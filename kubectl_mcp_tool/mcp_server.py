@@ -23,7 +23,9 @@ import logging
 import asyncio
 import os
 import platform
+import re
 import signal
+import warnings
 from pathlib import Path
 from typing import List, Optional, Any, Dict
 
@@ -99,6 +101,7 @@ from kubectl_mcp_tool.tools import (
 from kubectl_mcp_tool.resources import register_resources
 from kubectl_mcp_tool.prompts import register_prompts
 from kubectl_mcp_tool.auth import get_auth_config, create_auth_verifier
+from kubectl_mcp_tool.utils.helpers import check_tool_on_path
 
 if platform.system() == "Windows":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
@@ -152,6 +155,39 @@ except ImportError:
         logger.error(f"Failed to install FastMCP: {e}")
         raise
 
+# Optional: orjson encodes large tool results several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# FastMCP 3 deprecates tool_serializer (and the per-tool serializer it passes
+# on) but still honours it; only these notices are silenced
+_SERIALIZER_DEPRECATION = r"The `(tool_)?serializer` parameter is deprecated"
+
+
+def _serialize_tool_result(data: Any) -> str:
+    """Serialize a non-string tool result to JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=str)
+
+
+# Patterns used by MCPServer._mask_secrets, compiled once. Only horizontal
+# whitespace may precede the first newline after "data:" so blank runs are
+# not re-split on backtracking, which made long ones take quadratic time
+_SECRET_DATA_RE = re.compile(r'(data:[^\S\n]*\n(?:\s+\w+:\s*)[A-Za-z0-9+/=]{16,})')
+_SECRET_DATA_VALUE_RE = re.compile(r':\s*[A-Za-z0-9+/=]{16,}')
+_PASSWORD_RE = re.compile(r'(password|passwd|secret|credential)(\s*[=:]\s*)["\']?[^"\'\s]+["\']?', re.IGNORECASE)
+_TOKEN_RE = re.compile(r'(token|api[_-]?key|auth[_-]?key)(\s*[=:]\s*)["\']?[^"\'\s]+["\']?', re.IGNORECASE)
+_BEARER_RE = re.compile(r'(Bearer\s+)[A-Za-z0-9._-]+')
+_JWT_RE = re.compile(r'eyJ[A-Za-z0-9_-]*\.eyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*')
+
+
+def _mask_data_values(match: "re.Match") -> str:
+    return _SECRET_DATA_VALUE_RE.sub(': [MASKED]', match.group(0))
+
 
 class MCPServer:
     """MCP server implementation."""
@@ -207,14 +243,29 @@ class MCPServer:
         self.auth_config = get_auth_config()
         auth_verifier = self._setup_auth()
 
+        # Encode dict/list tool results with orjson when it is installed
+        server_kwargs: Dict[str, Any] = {}
+        if orjson is not None:
+            server_kwargs["tool_serializer"] = _serialize_tool_result
+
         # Initialize FastMCP with optional authentication
+        fastmcp_kwargs: Dict[str, Any] = {"name": name}
         if auth_verifier:
             logger.info("Initializing MCP server with authentication enabled")
-            self.server = FastMCP(name=name, auth=auth_verifier)
-        else:
-            self.server = FastMCP(name=name)
+            fastmcp_kwargs["auth"] = auth_verifier
 
-        self.setup_tools()
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message=_SERIALIZER_DEPRECATION, category=DeprecationWarning)
+            try:
+                self.server = FastMCP(**fastmcp_kwargs, **server_kwargs)
+            except TypeError:
+                if not server_kwargs:
+                    raise
+                logger.warning("FastMCP does not accept tool_serializer; using its default serializer")
+                self.server = FastMCP(**fastmcp_kwargs)
+
+            # Every tool registered below inherits the server's serializer
+            self.setup_tools()
         self.setup_resources()
         self.setup_prompts()
 
@@ -402,12 +453,12 @@ class MCPServer:
             return False
 
     def _check_kubectl_availability(self) -> bool:
-        """Check if kubectl is available."""
-        return self._check_tool_availability("kubectl")
+        """Check if kubectl is on PATH."""
+        return check_tool_on_path("kubectl")
 
     def _check_helm_availability(self) -> bool:
-        """Check if helm is available."""
-        return self._check_tool_availability("helm")
+        """Check if helm is on PATH."""
+        return check_tool_on_path("helm")
 
     def _check_destructive(self):
         """Check if destructive operations are allowed.
@@ -423,45 +474,21 @@ class MCPServer:
 
         Masks base64-encoded secrets, passwords, tokens, and API keys.
         """
-        import re
-
         # Mask base64-encoded data (common in Kubernetes secrets)
         # Match data fields with base64 values (at least 16 chars)
-        text = re.sub(
-            r'(data:\s*\n(?:\s+\w+:\s*)[A-Za-z0-9+/=]{16,})',
-            lambda m: re.sub(r':\s*[A-Za-z0-9+/=]{16,}', ': [MASKED]', m.group(0)),
-            text
-        )
+        text = _SECRET_DATA_RE.sub(_mask_data_values, text)
 
         # Mask password fields
-        text = re.sub(
-            r'(password|passwd|secret|credential)(\s*[=:]\s*)["\']?[^"\'\s]+["\']?',
-            r'\1\2[MASKED]',
-            text,
-            flags=re.IGNORECASE
-        )
+        text = _PASSWORD_RE.sub(r'\1\2[MASKED]', text)
 
         # Mask token fields
-        text = re.sub(
-            r'(token|api[_-]?key|auth[_-]?key)(\s*[=:]\s*)["\']?[^"\'\s]+["\']?',
-            r'\1\2[MASKED]',
-            text,
-            flags=re.IGNORECASE
-        )
+        text = _TOKEN_RE.sub(r'\1\2[MASKED]', text)
 
         # Mask Bearer tokens
-        text = re.sub(
-            r'(Bearer\s+)[A-Za-z0-9._-]+',
-            r'\1[MASKED]',
-            text
-        )
+        text = _BEARER_RE.sub(r'\1[MASKED]', text)
 
         # Mask JWT tokens (three base64 sections separated by dots)
-        text = re.sub(
-            r'eyJ[A-Za-z0-9_-]*\.eyJ[A-Za-z0-9_-]*\.[A-Za-z0-9_-]*',
-            '[MASKED]',
-            text
-        )
+        text = _JWT_RE.sub('[MASKED]', text)
 
         return text
 
@@ -644,7 +671,7 @@ class MCPServer:
                     if hasattr(self.server, '_tool_manager'):
                         try:
                             tool_result = await self.server._tool_manager.call_tool(tool_name, tool_args)
-                            result = {"content": [{"type": "text", "text": json.dumps(tool_result)}]}
+                            result = {"content": [{"type": "text", "text": _serialize_tool_result(tool_result)}]}
                         except Exception as e:
                             result = {"content": [{"type": "text", "text": f"Error: {str(e)}"}], "isError": True}
                     else:
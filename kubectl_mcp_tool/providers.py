@@ -304,7 +304,7 @@ class KubernetesProvider:
             return self._api_clients[resolved_context]
 
         if self._in_cluster:
-            api_client = client.ApiClient()
+            api_config = client.Configuration.get_default_copy()
         else:
             api_config = client.Configuration()
             config.load_kube_config(
@@ -312,7 +312,9 @@ class KubernetesProvider:
                 context=resolved_context,
                 client_configuration=api_config
             )
-            api_client = client.ApiClient(configuration=api_config)
+        # Let concurrent tool calls share keep-alive connections
+        api_config.connection_pool_maxsize = max(api_config.connection_pool_maxsize or 0, 20)
+        api_client = client.ApiClient(configuration=api_config)
 
         self._api_clients[resolved_context] = api_client
 
@@ -1,8 +1,9 @@
 """Argo Rollouts and Flagger progressive delivery toolset for kubectl-mcp-server."""
 
+import asyncio
 import subprocess
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 try:
@@ -36,6 +37,30 @@ def _argo_rollouts_cli_available() -> bool:
         return False
 
 
+async def _run_cli_async(cmd: List[str], timeout: int = 30) -> Dict[str, Any]:
+    """Run a CLI command without blocking the event loop."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        # Same text subprocess.run(timeout=...) produced
+        return {"success": False, "error": str(subprocess.TimeoutExpired(cmd, timeout))}
+
+    if proc.returncode == 0:
+        return {"success": True, "output": stdout.decode(errors="replace")}
+    return {"success": False, "error": stderr.decode(errors="replace")}
+
+
 def rollouts_list(
     namespace: str = "",
     context: str = "",
@@ -213,127 +238,124 @@ def rollout_status(
     }
 
 
-def rollout_promote(
+# Merge patches used when the kubectl-argo-rollouts plugin is not installed
+_PROMOTE_PATCH = json.dumps({"status": {"pauseConditions": None}})
+_PROMOTE_FULL_PATCH = json.dumps({"status": {"pauseConditions": None, "promoteFull": True}})
+_ABORT_PATCH = json.dumps({"status": {"abort": True}})
+_RETRY_PATCH = json.dumps({"status": {"abort": False}})
+
+
+async def _run_rollout_action(
     name: str,
     namespace: str,
-    full: bool = False,
-    context: str = ""
+    context: str,
+    verb: str,
+    patch: str,
+    message: str,
+    cli_extra_args: Tuple[str, ...] = (),
+    patch_message: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Promote a paused Argo Rollout.
+    """Run an Argo Rollouts action via the CLI plugin, falling back to a merge patch.
 
     Args:
         name: Name of the Rollout
         namespace: Namespace of the Rollout
-        full: Promote to full healthy state (skip remaining steps)
-        context: Kubernetes context to use (optional)
+        context: Kubernetes context to use
+        verb: kubectl-argo-rollouts subcommand (promote, abort, ...)
+        patch: JSON merge patch applied when the plugin is unavailable
+        message: Success message for the result
+        cli_extra_args: Extra arguments passed to the plugin only
+        patch_message: Success message when the patch was used (default: message)
 
     Returns:
-        Promotion result
+        Action result
     """
-    if not crd_exists(ARGO_ROLLOUT_CRD, context):
+    # Both probes run subprocesses, so they stay off the event loop
+    if not await asyncio.to_thread(crd_exists, ARGO_ROLLOUT_CRD, context):
         return {"success": False, "error": "Argo Rollouts is not installed"}
 
-    # Use kubectl plugin if available
-    if _argo_rollouts_cli_available():
-        cmd = ["kubectl", "argo", "rollouts", "promote", name, "-n", namespace]
-        if full:
-            cmd.append("--full")
+    if await asyncio.to_thread(_argo_rollouts_cli_available):
+        cmd = ["kubectl", "argo", "rollouts", verb, name, "-n", namespace, *cli_extra_args]
         if context:
             cmd.extend(["--context", context])
 
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "context": context or "current",
-                    "message": f"Promoted rollout {name}" + (" (full)" if full else ""),
-                    "output": result.stdout,
-                }
-            return {"success": False, "error": result.stderr}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-
-    # Fallback to patching
-    patch = {"status": {"pauseConditions": None}}
-    if full:
-        patch["status"]["promoteFull"] = True  # Full promotion to end
+        result = await _run_cli_async(cmd)
+        if result["success"]:
+            return {
+                "success": True,
+                "context": context or "current",
+                "message": message,
+                "output": result["output"],
+            }
+        return {"success": False, "error": result["error"]}
 
     args = [
         "patch", "rollouts.argoproj.io", name,
         "-n", namespace,
         "--type=merge",
-        "-p", json.dumps(patch)
+        "-p", patch
     ]
-    result = run_kubectl(args, context)
+    result = await asyncio.to_thread(run_kubectl, args, context)
 
     if result["success"]:
         return {
             "success": True,
             "context": context or "current",
-            "message": f"Promoted rollout {name}",
+            "message": message if patch_message is None else patch_message,
         }
 
-    return {"success": False, "error": result.get("error", "Failed to promote")}
+    return {"success": False, "error": result.get("error", f"Failed to {verb}")}
 
 
-def rollout_abort(
+async def rollout_promote(
     name: str,
     namespace: str,
+    full: bool = False,
     context: str = ""
 ) -> Dict[str, Any]:
-    """Abort an Argo Rollout.
+    """Promote a paused Argo Rollout.
 
     Args:
         name: Name of the Rollout
         namespace: Namespace of the Rollout
+        full: Promote to full healthy state (skip remaining steps)
         context: Kubernetes context to use (optional)
 
     Returns:
-        Abort result
+        Promotion result
     """
-    if not crd_exists(ARGO_ROLLOUT_CRD, context):
-        return {"success": False, "error": "Argo Rollouts is not installed"}
-
-    if _argo_rollouts_cli_available():
-        cmd = ["kubectl", "argo", "rollouts", "abort", name, "-n", namespace]
-        if context:
-            cmd.extend(["--context", context])
+    if full:
+        return await _run_rollout_action(
+            name, namespace, context, "promote", _PROMOTE_FULL_PATCH,
+            f"Promoted rollout {name} (full)", ("--full",),
+            patch_message=f"Promoted rollout {name}",
+        )
+    return await _run_rollout_action(
+        name, namespace, context, "promote", _PROMOTE_PATCH, f"Promoted rollout {name}",
+    )
 
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "context": context or "current",
-                    "message": f"Aborted rollout {name}",
-                    "output": result.stdout,
-                }
-            return {"success": False, "error": result.stderr}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
 
-    # Fallback to patching
-    patch = {"status": {"abort": True}}
-    args = [
-        "patch", "rollouts.argoproj.io", name,
-        "-n", namespace,
-        "--type=merge",
-        "-p", json.dumps(patch)
-    ]
-    result = run_kubectl(args, context)
+async def rollout_abort(
+    name: str,
+    namespace: str,
+    context: str = ""
+) -> Dict[str, Any]:
+    """Abort an Argo Rollout.
 
-    if result["success"]:
-        return {
-            "success": True,
-            "context": context or "current",
-            "message": f"Aborted rollout {name}",
-        }
+    Args:
+        name: Name of the Rollout
+        namespace: Namespace of the Rollout
+        context: Kubernetes context to use (optional)
 
-    return {"success": False, "error": result.get("error", "Failed to abort")}
+    Returns:
+        Abort result
+    """
+    return await _run_rollout_action(
+        name, namespace, context, "abort", _ABORT_PATCH, f"Aborted rollout {name}",
+    )
 
 
-def rollout_retry(
+async def rollout_retry(
     name: str,
     namespace: str,
     context: str = ""
@@ -348,48 +370,12 @@ def rollout_retry(
     Returns:
         Retry result
     """
-    if not crd_exists(ARGO_ROLLOUT_CRD, context):
-        return {"success": False, "error": "Argo Rollouts is not installed"}
+    return await _run_rollout_action(
+        name, namespace, context, "retry", _RETRY_PATCH, f"Retried rollout {name}",
+    )
 
-    if _argo_rollouts_cli_available():
-        cmd = ["kubectl", "argo", "rollouts", "retry", name, "-n", namespace]
-        if context:
-            cmd.extend(["--context", context])
-
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "context": context or "current",
-                    "message": f"Retried rollout {name}",
-                    "output": result.stdout,
-                }
-            return {"success": False, "error": result.stderr}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-
-    # Fallback to patching (clear abort status)
-    patch = {"status": {"abort": False}}
-    args = [
-        "patch", "rollouts.argoproj.io", name,
-        "-n", namespace,
-        "--type=merge",
-        "-p", json.dumps(patch)
-    ]
-    result = run_kubectl(args, context)
-
-    if result["success"]:
-        return {
-            "success": True,
-            "context": context or "current",
-            "message": f"Retried rollout {name}",
-        }
 
-    return {"success": False, "error": result.get("error", "Failed to retry")}
-
-
-def rollout_restart(
+async def rollout_restart(
     name: str,
     namespace: str,
     context: str = ""
@@ -404,50 +390,11 @@ def rollout_restart(
     Returns:
         Restart result
     """
-    if not crd_exists(ARGO_ROLLOUT_CRD, context):
-        return {"success": False, "error": "Argo Rollouts is not installed"}
-
-    if _argo_rollouts_cli_available():
-        cmd = ["kubectl", "argo", "rollouts", "restart", name, "-n", namespace]
-        if context:
-            cmd.extend(["--context", context])
-
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "context": context or "current",
-                    "message": f"Restarted rollout {name}",
-                    "output": result.stdout,
-                }
-            return {"success": False, "error": result.stderr}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-
-    # Fallback: patch the template to trigger restart
     timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    patch = {
-        "spec": {
-            "restartAt": timestamp
-        }
-    }
-    args = [
-        "patch", "rollouts.argoproj.io", name,
-        "-n", namespace,
-        "--type=merge",
-        "-p", json.dumps(patch)
-    ]
-    result = run_kubectl(args, context)
-
-    if result["success"]:
-        return {
-            "success": True,
-            "context": context or "current",
-            "message": f"Restarted rollout {name}",
-        }
-
-    return {"success": False, "error": result.get("error", "Failed to restart")}
+    patch = json.dumps({"spec": {"restartAt": timestamp}})
+    return await _run_rollout_action(
+        name, namespace, context, "restart", patch, f"Restarted rollout {name}",
+    )
 
 
 def analysis_runs_list(
@@ -659,7 +606,7 @@ def register_rollouts_tools(mcp: FastMCP, non_destructive: bool = False):
         return json.dumps(rollout_status(name, namespace, context), indent=2)
 
     @mcp.tool()
-    def rollout_promote_tool(
+    async def rollout_promote_tool(
         name: str,
         namespace: str,
         full: bool = False,
@@ -668,10 +615,10 @@ def register_rollouts_tools(mcp: FastMCP, non_destructive: bool = False):
         """Promote a paused Argo Rollout to the next step or full."""
         if non_destructive:
             return json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
-        return json.dumps(rollout_promote(name, namespace, full, context), indent=2)
+        return json.dumps(await rollout_promote(name, namespace, full, context), indent=2)
 
     @mcp.tool()
-    def rollout_abort_tool(
+    async def rollout_abort_tool(
         name: str,
         namespace: str,
         context: str = ""
@@ -679,10 +626,10 @@ def register_rollouts_tools(mcp: FastMCP, non_destructive: bool = False):
         """Abort an Argo Rollout."""
         if non_destructive:
             return json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
-        return json.dumps(rollout_abort(name, namespace, context), indent=2)
+        return json.dumps(await rollout_abort(name, namespace, context), indent=2)
 
     @mcp.tool()
-    def rollout_retry_tool(
+    async def rollout_retry_tool(
         name: str,
         namespace: str,
         context: str = ""
@@ -690,10 +637,10 @@ def register_rollouts_tools(mcp: FastMCP, non_destructive: bool = False):
         """Retry an aborted Argo Rollout."""
         if non_destructive:
             return json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
-        return json.dumps(rollout_retry(name, namespace, context), indent=2)
+        return json.dumps(await rollout_retry(name, namespace, context), indent=2)
 
     @mcp.tool()
-    def rollout_restart_tool(
+    async def rollout_restart_tool(
         name: str,
         namespace: str,
         context: str = ""
@@ -701,7 +648,7 @@ def register_rollouts_tools(mcp: FastMCP, non_destructive: bool = False):
         """Restart an Argo Rollout."""
         if non_destructive:
             return json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
-        return json.dumps(rollout_restart(name, namespace, context), indent=2)
+        return json.dumps(await rollout_restart(name, namespace, context), indent=2)
 
     @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
     def analysis_runs_list_tool(
@@ -1,5 +1,9 @@
+import concurrent.futures
+import itertools
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 from mcp.types import ToolAnnotations
 
@@ -8,9 +12,97 @@ from ..k8s_config import (
     get_rbac_client,
     get_networking_client,
 )
+from .utils import LIST_PAGE_SIZE, iter_list_items, to_jsonl
 
 logger = logging.getLogger("mcp-server")
 
+# Maximum findings returned by the pod and secret scans; listing stops there
+_ISSUE_CAP = 50
+
+# Server-side filters: finished pods and service account tokens never produce findings
+_ACTIVE_POD_SELECTOR = "status.phase!=Succeeded,status.phase!=Failed"
+_NON_SA_TOKEN_SELECTOR = "type!=kubernetes.io/service-account-token"
+
+# Namespaces that are not expected to carry network policies
+_SYSTEM_NS = frozenset({"kube-system", "kube-public", "kube-node-lease"})
+
+
+# Ask for metadata-only objects; servers without support fall back to full JSON
+_PARTIAL_METADATA_LIST = {
+    "Accept": "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+}
+_PARTIAL_METADATA = {
+    "Accept": "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1,application/json"
+}
+
+
+class _Permission(NamedTuple):
+    """One subject-to-role grant found by audit_rbac_permissions."""
+
+    subject: str
+    subjectKind: str
+    roleRef: str
+    scope: Optional[str]
+    bindingName: str
+
+
+def _read_namespace_metadata(v1, namespace: str) -> Dict[str, Any]:
+    """Read a single namespace as a metadata-only dict."""
+    resp = v1.read_namespace(namespace, _preload_content=False, _headers=_PARTIAL_METADATA)
+    return json.loads(resp.data)
+
+
+_namespace_cache: Dict[str, Tuple[Dict[str, Any], ...]] = {}
+_namespace_cache_timestamp: Dict[str, float] = {}
+NAMESPACE_CACHE_TTL = 5
+
+
+def _list_namespace_metadata(v1, context: str = "") -> Tuple[Dict[str, Any], ...]:
+    """List all namespaces as metadata-only dicts.
+
+    Results are shared across tool calls for NAMESPACE_CACHE_TTL seconds so
+    bursts of security tools hit the API server once. Treat them as read-only.
+    """
+    cache_key = context or "default"
+    if cache_key in _namespace_cache:
+        if time.time() - _namespace_cache_timestamp.get(cache_key, 0) < NAMESPACE_CACHE_TTL:
+            return _namespace_cache[cache_key]
+
+    namespaces = tuple(iter_list_items(
+        v1.list_namespace, page_size=LIST_PAGE_SIZE, _headers=_PARTIAL_METADATA_LIST
+    ))
+    _namespace_cache[cache_key] = namespaces
+    _namespace_cache_timestamp[cache_key] = time.time()
+    return namespaces
+
+
+def _summarize_rules(rules) -> List[Dict[str, Any]]:
+    """Reduce RBAC rule dicts to their apiGroups/resources/verbs."""
+    summaries = []
+    append = summaries.append
+    for rule in rules:
+        get = rule.get
+        append({
+            "apiGroups": get("apiGroups"),
+            "resources": get("resources"),
+            "verbs": get("verbs")
+        })
+    return summaries
+
+
+def _parallel(*calls: Callable[[], Any]) -> List[Any]:
+    """Run independent API calls concurrently and return their results in order."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+
+def _first_page(items: Iterator[Any]) -> Iterator[Any]:
+    """Fetch the first page of a lazy listing now; later pages stay on demand."""
+    for item in items:
+        return itertools.chain((item,), items)
+    return iter(())
+
 
 def register_security_tools(server, non_destructive: bool):
     """Register RBAC and security-related tools."""
@@ -35,28 +127,24 @@ def register_security_tools(server, non_destructive: bool):
             rbac = get_rbac_client(context)
 
             if namespace:
-                roles = rbac.list_namespaced_role(namespace)
+                roles = iter_list_items(rbac.list_namespaced_role, namespace, page_size=LIST_PAGE_SIZE)
             else:
-                roles = rbac.list_role_for_all_namespaces()
+                roles = iter_list_items(rbac.list_role_for_all_namespaces, page_size=LIST_PAGE_SIZE)
+
+            role_summaries = []
+            append = role_summaries.append
+            for role in roles:
+                metadata = role["metadata"]
+                append({
+                    "name": metadata["name"],
+                    "namespace": metadata.get("namespace"),
+                    "rules": _summarize_rules(role.get("rules") or [])
+                })
 
             return {
                 "success": True,
                 "context": context or "current",
-                "roles": [
-                    {
-                        "name": role.metadata.name,
-                        "namespace": role.metadata.namespace,
-                        "rules": [
-                            {
-                                "apiGroups": rule.api_groups,
-                                "resources": rule.resources,
-                                "verbs": rule.verbs
-                            }
-                            for rule in (role.rules or [])
-                        ]
-                    }
-                    for role in roles.items
-                ]
+                "roles": role_summaries
             }
         except Exception as e:
             logger.error(f"Error getting RBAC roles: {e}")
@@ -76,25 +164,20 @@ def register_security_tools(server, non_destructive: bool):
         """
         try:
             rbac = get_rbac_client(context)
-            roles = rbac.list_cluster_role()
+            roles = iter_list_items(rbac.list_cluster_role, page_size=20)
+
+            cluster_roles = []
+            append = cluster_roles.append
+            for role in itertools.islice(roles, 20):
+                append({
+                    "name": role["metadata"]["name"],
+                    "rules": _summarize_rules((role.get("rules") or [])[:5])
+                })
 
             return {
                 "success": True,
                 "context": context or "current",
-                "clusterRoles": [
-                    {
-                        "name": role.metadata.name,
-                        "rules": [
-                            {
-                                "apiGroups": rule.api_groups,
-                                "resources": rule.resources,
-                                "verbs": rule.verbs
-                            }
-                            for rule in (role.rules or [])
-                        ][:5]
-                    }
-                    for role in roles.items[:20]
-                ]
+                "clusterRoles": cluster_roles
             }
         except Exception as e:
             logger.error(f"Error getting cluster roles: {e}")
@@ -108,58 +191,83 @@ def register_security_tools(server, non_destructive: bool):
     )
     def analyze_pod_security(
         namespace: Optional[str] = None,
-        context: str = ""
-    ) -> Dict[str, Any]:
+        context: str = "",
+        jsonl: bool = False
+    ) -> Union[Dict[str, Any], str]:
         """Analyze pod security configurations.
 
+        Completed (Succeeded/Failed) pods are skipped. Scanning stops once
+        50 pods with issues are found (issuesTruncated).
+
         Args:
             namespace: Namespace to analyze pods in (all namespaces if not specified)
             context: Kubernetes context to use (uses current context if not specified)
+            jsonl: Return newline-delimited JSON: an envelope line, then one line per pod issue
         """
         try:
             v1 = get_k8s_client(context)
 
             if namespace:
-                pods = v1.list_namespaced_pod(namespace)
+                pods = iter_list_items(
+                    v1.list_namespaced_pod, namespace,
+                    page_size=LIST_PAGE_SIZE, field_selector=_ACTIVE_POD_SELECTOR
+                )
             else:
-                pods = v1.list_pod_for_all_namespaces()
+                pods = iter_list_items(
+                    v1.list_pod_for_all_namespaces,
+                    page_size=LIST_PAGE_SIZE, field_selector=_ACTIVE_POD_SELECTOR
+                )
 
             issues = []
-            for pod in pods.items:
+            total_pods = 0
+            truncated = False
+            for pod in pods:
+                if len(issues) >= _ISSUE_CAP:
+                    # Only truncated if a pod is left unscanned
+                    truncated = True
+                    break
+                total_pods += 1
                 pod_issues = []
-                spec = pod.spec
+                spec = pod.get("spec") or {}
 
-                if spec.host_network:
+                if spec.get("hostNetwork"):
                     pod_issues.append("hostNetwork enabled")
-                if spec.host_pid:
+                if spec.get("hostPID"):
                     pod_issues.append("hostPID enabled")
-                if spec.host_ipc:
+                if spec.get("hostIPC"):
                     pod_issues.append("hostIPC enabled")
 
-                for container in (spec.containers or []):
-                    sc = container.security_context
+                for container in (spec.get("containers") or []):
+                    sc = container.get("securityContext")
                     if sc:
-                        if sc.privileged:
-                            pod_issues.append(f"Container {container.name}: privileged mode")
-                        if sc.run_as_root:
-                            pod_issues.append(f"Container {container.name}: runs as root")
-                        if sc.allow_privilege_escalation:
-                            pod_issues.append(f"Container {container.name}: privilege escalation allowed")
+                        container_name = container["name"]
+                        if sc.get("privileged"):
+                            pod_issues.append(f"Container {container_name}: privileged mode")
+                        if sc.get("runAsUser") == 0:
+                            pod_issues.append(f"Container {container_name}: runs as root")
+                        if sc.get("allowPrivilegeEscalation"):
+                            pod_issues.append(f"Container {container_name}: privilege escalation allowed")
 
                 if pod_issues:
+                    metadata = pod["metadata"]
                     issues.append({
-                        "pod": pod.metadata.name,
-                        "namespace": pod.metadata.namespace,
+                        "pod": metadata["name"],
+                        "namespace": metadata.get("namespace"),
                         "issues": pod_issues
                     })
 
-            return {
+            envelope = {
                 "success": True,
                 "context": context or "current",
-                "totalPods": len(pods.items),
+                "totalPods": total_pods,
                 "podsWithIssues": len(issues),
-                "issues": issues[:50]
+                "issuesTruncated": truncated
             }
+            if jsonl:
+                return to_jsonl(envelope, issues)
+
+            envelope["issues"] = issues
+            return envelope
         except Exception as e:
             logger.error(f"Error analyzing pod security: {e}")
             return {"success": False, "error": str(e)}
@@ -185,37 +293,45 @@ def register_security_tools(server, non_destructive: bool):
             v1 = get_k8s_client(context)
 
             if namespace:
-                policies = networking.list_namespaced_network_policy(namespace)
-                namespaces = [v1.read_namespace(namespace)]
+                policies, namespaces = _parallel(
+                    lambda: list(iter_list_items(
+                        networking.list_namespaced_network_policy, namespace, page_size=LIST_PAGE_SIZE
+                    )),
+                    lambda: [_read_namespace_metadata(v1, namespace)],
+                )
             else:
-                policies = networking.list_network_policy_for_all_namespaces()
-                namespaces = v1.list_namespace().items
+                policies, namespaces = _parallel(
+                    lambda: list(iter_list_items(
+                        networking.list_network_policy_for_all_namespaces, page_size=LIST_PAGE_SIZE
+                    )),
+                    lambda: _list_namespace_metadata(v1, context),
+                )
 
             protected_namespaces = set()
-            for policy in policies.items:
-                protected_namespaces.add(policy.metadata.namespace)
-
-            unprotected = [
-                ns.metadata.name for ns in namespaces
-                if ns.metadata.name not in protected_namespaces
-                and ns.metadata.name not in ["kube-system", "kube-public", "kube-node-lease"]
-            ]
+            policy_summaries = []
+            for p in policies:
+                metadata, spec = p["metadata"], p["spec"]
+                protected_namespaces.add(metadata.get("namespace"))
+                policy_summaries.append({
+                    "name": metadata["name"],
+                    "namespace": metadata.get("namespace"),
+                    "podSelector": (spec.get("podSelector") or {}).get("matchLabels") or {},
+                    "policyTypes": spec.get("policyTypes")
+                })
+
+            unprotected = []
+            for ns in namespaces:
+                ns_name = ns["metadata"]["name"]
+                if ns_name not in protected_namespaces and ns_name not in _SYSTEM_NS:
+                    unprotected.append(ns_name)
 
             return {
                 "success": True,
                 "context": context or "current",
-                "totalPolicies": len(policies.items),
+                "totalPolicies": len(policies),
                 "protectedNamespaces": list(protected_namespaces),
                 "unprotectedNamespaces": unprotected,
-                "policies": [
-                    {
-                        "name": p.metadata.name,
-                        "namespace": p.metadata.namespace,
-                        "podSelector": p.spec.pod_selector.match_labels if p.spec.pod_selector else {},
-                        "policyTypes": p.spec.policy_types
-                    }
-                    for p in policies.items
-                ]
+                "policies": policy_summaries
             }
         except Exception as e:
             logger.error(f"Error analyzing network policies: {e}")
@@ -230,55 +346,58 @@ def register_security_tools(server, non_destructive: bool):
     def audit_rbac_permissions(
         namespace: Optional[str] = None,
         subject: Optional[str] = None,
-        context: str = ""
-    ) -> Dict[str, Any]:
+        context: str = "",
+        jsonl: bool = False
+    ) -> Union[Dict[str, Any], str]:
         """Audit RBAC permissions for subjects.
 
         Args:
             namespace: Namespace to audit (cluster-wide if not specified)
             subject: Filter by subject name
             context: Kubernetes context to use (uses current context if not specified)
+            jsonl: Return newline-delimited JSON: an envelope line, then one line per permission
         """
         try:
             rbac = get_rbac_client(context)
 
-            cluster_bindings = rbac.list_cluster_role_binding()
             if namespace:
-                role_bindings = rbac.list_namespaced_role_binding(namespace)
+                role_binding_call = (rbac.list_namespaced_role_binding, namespace)
             else:
-                role_bindings = rbac.list_role_binding_for_all_namespaces()
-
-            permissions = []
-
-            for binding in cluster_bindings.items:
-                for subj in (binding.subjects or []):
-                    if subject and subj.name != subject:
-                        continue
-                    permissions.append({
-                        "subject": subj.name,
-                        "subjectKind": subj.kind,
-                        "roleRef": binding.role_ref.name,
-                        "scope": "cluster",
-                        "bindingName": binding.metadata.name
-                    })
-
-            for binding in role_bindings.items:
-                for subj in (binding.subjects or []):
-                    if subject and subj.name != subject:
-                        continue
-                    permissions.append({
-                        "subject": subj.name,
-                        "subjectKind": subj.kind,
-                        "roleRef": binding.role_ref.name,
-                        "scope": binding.metadata.namespace,
-                        "bindingName": binding.metadata.name
-                    })
-
-            return {
-                "success": True,
-                "context": context or "current",
-                "permissions": permissions[:100]
-            }
+                role_binding_call = (rbac.list_role_binding_for_all_namespaces,)
+            # Only the first page of each list is fetched up front (concurrently);
+            # further pages are requested while the 100-permission cap is unmet
+            cluster_bindings, role_bindings = _parallel(
+                lambda: _first_page(iter_list_items(rbac.list_cluster_role_binding, page_size=100)),
+                lambda: _first_page(iter_list_items(*role_binding_call, page_size=100)),
+            )
+
+            def iter_permissions():
+                # ClusterRoleBindings are cluster-scoped; RoleBindings take their namespace
+                bindings = itertools.chain(
+                    ((binding, "cluster") for binding in cluster_bindings),
+                    ((binding, None) for binding in role_bindings),
+                )
+                for binding, scope in bindings:
+                    subjects = binding.get("subjects") or []
+                    if subject:
+                        subjects = [subj for subj in subjects if subj["name"] == subject]
+                        if not subjects:
+                            continue
+                    metadata = binding["metadata"]
+                    role_ref = binding["roleRef"]["name"]
+                    binding_name = metadata["name"]
+                    binding_scope = scope or metadata.get("namespace")
+                    for subj in subjects:
+                        yield _Permission(subj["name"], subj["kind"], role_ref, binding_scope, binding_name)
+
+            # Grants stay tuples until the output boundary
+            permissions = map(_Permission._asdict, itertools.islice(iter_permissions(), 100))
+            envelope = {"success": True, "context": context or "current"}
+            if jsonl:
+                return to_jsonl(envelope, permissions)
+
+            envelope["permissions"] = list(permissions)
+            return envelope
         except Exception as e:
             logger.error(f"Error auditing RBAC: {e}")
             return {"success": False, "error": str(e)}
@@ -295,6 +414,9 @@ def register_security_tools(server, non_destructive: bool):
     ) -> Dict[str, Any]:
         """Check security posture of secrets.
 
+        Service account token secrets are skipped. Scanning stops once
+        50 secrets with issues are found (findingsTruncated).
+
         Args:
             namespace: Namespace to check secrets in (all namespaces if not specified)
             context: Kubernetes context to use (uses current context if not specified)
@@ -303,34 +425,50 @@ def register_security_tools(server, non_destructive: bool):
             v1 = get_k8s_client(context)
 
             if namespace:
-                secrets = v1.list_namespaced_secret(namespace)
+                secrets = iter_list_items(
+                    v1.list_namespaced_secret, namespace,
+                    page_size=LIST_PAGE_SIZE, field_selector=_NON_SA_TOKEN_SELECTOR
+                )
             else:
-                secrets = v1.list_secret_for_all_namespaces()
+                secrets = iter_list_items(
+                    v1.list_secret_for_all_namespaces,
+                    page_size=LIST_PAGE_SIZE, field_selector=_NON_SA_TOKEN_SELECTOR
+                )
 
             findings = []
-            for secret in secrets.items:
+            total_secrets = 0
+            truncated = False
+            for secret in secrets:
+                if len(findings) >= _ISSUE_CAP:
+                    # Only truncated if a secret is left unscanned
+                    truncated = True
+                    break
+                total_secrets += 1
                 issues = []
+                secret_type = secret.get("type")
 
-                if secret.type == "Opaque":
+                if secret_type == "Opaque":
                     issues.append("Generic secret type - consider using specific types")
 
-                if not secret.metadata.annotations:
+                metadata = secret["metadata"]
+                if not metadata.get("annotations"):
                     issues.append("No annotations - consider adding metadata")
 
                 if issues:
                     findings.append({
-                        "name": secret.metadata.name,
-                        "namespace": secret.metadata.namespace,
-                        "type": secret.type,
+                        "name": metadata["name"],
+                        "namespace": metadata.get("namespace"),
+                        "type": secret_type,
                         "issues": issues
                     })
 
             return {
                 "success": True,
                 "context": context or "current",
-                "totalSecrets": len(secrets.items),
+                "totalSecrets": total_secrets,
                 "secretsWithIssues": len(findings),
-                "findings": findings[:50]
+                "findings": findings,
+                "findingsTruncated": truncated
             }
         except Exception as e:
             logger.error(f"Error checking secrets security: {e}")
@@ -356,15 +494,16 @@ def register_security_tools(server, non_destructive: bool):
             v1 = get_k8s_client(context)
 
             if namespace:
-                namespaces = [v1.read_namespace(namespace)]
+                namespaces = [_read_namespace_metadata(v1, namespace)]
             else:
-                namespaces = v1.list_namespace().items
+                namespaces = _list_namespace_metadata(v1, context)
 
             result = []
             for ns in namespaces:
-                labels = ns.metadata.labels or {}
+                metadata = ns["metadata"]
+                labels = metadata.get("labels") or {}
                 pss_info = {
-                    "namespace": ns.metadata.name,
+                    "namespace": metadata["name"],
                     "enforce": labels.get("pod-security.kubernetes.io/enforce"),
                     "enforceVersion": labels.get("pod-security.kubernetes.io/enforce-version"),
                     "audit": labels.get("pod-security.kubernetes.io/audit"),
@@ -1,12 +1,57 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from mcp.types import ToolAnnotations
 
+from ..informers import cached_list
 from ..k8s_config import get_k8s_client, get_storage_client
+from .utils import iter_list_models, to_jsonl
 
 logger = logging.getLogger("mcp-server")
 
+# (API field name, V1PersistentVolumeSpec attribute) for the volume sources we report
+_PV_SOURCES = (
+    ("nfs", "nfs"),
+    ("hostPath", "host_path"),
+    ("gcePersistentDisk", "gce_persistent_disk"),
+    ("awsElasticBlockStore", "aws_elastic_block_store"),
+    ("azureDisk", "azure_disk"),
+    ("azureFile", "azure_file"),
+    ("csi", "csi"),
+    ("local", "local"),
+    ("fc", "fc"),
+    ("iscsi", "iscsi"),
+)
+
+
+def _get_pv_source(spec) -> Dict[str, Any]:
+    """Return the type and a short description of a PV's volume source."""
+    for source, attr in _PV_SOURCES:
+        source_attr = getattr(spec, attr, None)
+        if source_attr:
+            return {"type": source, "details": str(source_attr)[:100]}
+    return {"type": "unknown"}
+
+
+def _summarize_pv(pv) -> Dict[str, Any]:
+    """Summarize a V1PersistentVolume for tool output."""
+    spec = pv.spec
+    capacity = spec.capacity
+    claim_ref = spec.claim_ref
+    return {
+        "name": pv.metadata.name,
+        "capacity": capacity.get("storage") if capacity else None,
+        "accessModes": spec.access_modes,
+        "reclaimPolicy": spec.persistent_volume_reclaim_policy,
+        "status": pv.status.phase,
+        "storageClass": spec.storage_class_name,
+        "claimRef": {
+            "name": claim_ref.name,
+            "namespace": claim_ref.namespace
+        } if claim_ref else None,
+        "source": _get_pv_source(spec)
+    }
+
 
 def register_storage_tools(server, non_destructive: bool):
     """Register storage-related tools."""
@@ -19,13 +64,15 @@ def register_storage_tools(server, non_destructive: bool):
     )
     def get_persistent_volumes(
         name: Optional[str] = None,
-        context: str = ""
-    ) -> Dict[str, Any]:
+        context: str = "",
+        jsonl: bool = False
+    ) -> Union[Dict[str, Any], str]:
         """Get Persistent Volumes in the cluster.
 
         Args:
             name: Specific PV name to get (all PVs if not specified)
             context: Kubernetes context to use (uses current context if not specified)
+            jsonl: Return newline-delimited JSON: an envelope line, then one line per PV
         """
         try:
             v1 = get_k8s_client(context)
@@ -34,37 +81,16 @@ def register_storage_tools(server, non_destructive: bool):
                 pv = v1.read_persistent_volume(name)
                 pvs = [pv]
             else:
-                pvs = v1.list_persistent_volume().items
+                pvs = cached_list(context, v1.list_persistent_volume)
+                if pvs is None:
+                    pvs = iter_list_models(v1.list_persistent_volume)
 
-            def get_pv_source(spec):
-                sources = ['nfs', 'hostPath', 'gcePersistentDisk', 'awsElasticBlockStore',
-                          'azureDisk', 'azureFile', 'csi', 'local', 'fc', 'iscsi']
-                for source in sources:
-                    source_attr = getattr(spec, source.replace('P', '_p').replace('D', '_d'), None)
-                    if source_attr:
-                        return {"type": source, "details": str(source_attr)[:100]}
-                return {"type": "unknown"}
+            envelope = {"success": True, "context": context or "current"}
+            if jsonl:
+                return to_jsonl(envelope, map(_summarize_pv, pvs))
 
-            return {
-                "success": True,
-                "context": context or "current",
-                "persistentVolumes": [
-                    {
-                        "name": pv.metadata.name,
-                        "capacity": pv.spec.capacity.get("storage") if pv.spec.capacity else None,
-                        "accessModes": pv.spec.access_modes,
-                        "reclaimPolicy": pv.spec.persistent_volume_reclaim_policy,
-                        "status": pv.status.phase,
-                        "storageClass": pv.spec.storage_class_name,
-                        "claimRef": {
-                            "name": pv.spec.claim_ref.name,
-                            "namespace": pv.spec.claim_ref.namespace
-                        } if pv.spec.claim_ref else None,
-                        "source": get_pv_source(pv.spec)
-                    }
-                    for pv in pvs
-                ]
-            }
+            envelope["persistentVolumes"] = [_summarize_pv(pv) for pv in pvs]
+            return envelope
         except Exception as e:
             logger.error(f"Error getting PVs: {e}")
             return {"success": False, "error": str(e)}
@@ -88,26 +114,37 @@ def register_storage_tools(server, non_destructive: bool):
         try:
             v1 = get_k8s_client(context)
 
-            if namespace:
-                pvcs = v1.list_namespaced_persistent_volume_claim(namespace)
-            else:
-                pvcs = v1.list_persistent_volume_claim_for_all_namespaces()
+            # One cluster-wide informer serves every namespace, filtered here
+            pvcs = cached_list(context, v1.list_persistent_volume_claim_for_all_namespaces)
+            if pvcs is None:
+                if namespace:
+                    pvcs = iter_list_models(v1.list_namespaced_persistent_volume_claim, namespace)
+                else:
+                    pvcs = iter_list_models(v1.list_persistent_volume_claim_for_all_namespaces)
+            elif namespace:
+                pvcs = [pvc for pvc in pvcs if pvc.metadata.namespace == namespace]
+
+            claims = []
+            append = claims.append
+            for pvc in pvcs:
+                meta = pvc.metadata
+                spec = pvc.spec
+                status = pvc.status
+                capacity = status.capacity
+                append({
+                    "name": meta.name,
+                    "namespace": meta.namespace,
+                    "status": status.phase,
+                    "capacity": capacity.get("storage") if capacity else None,
+                    "accessModes": spec.access_modes,
+                    "storageClass": spec.storage_class_name,
+                    "volumeName": spec.volume_name
+                })
 
             return {
                 "success": True,
                 "context": context or "current",
-                "pvcs": [
-                    {
-                        "name": pvc.metadata.name,
-                        "namespace": pvc.metadata.namespace,
-                        "status": pvc.status.phase,
-                        "capacity": pvc.status.capacity.get("storage") if pvc.status.capacity else None,
-                        "accessModes": pvc.spec.access_modes,
-                        "storageClass": pvc.spec.storage_class_name,
-                        "volumeName": pvc.spec.volume_name
-                    }
-                    for pvc in pvcs.items
-                ]
+                "pvcs": claims
             }
         except Exception as e:
             logger.error(f"Error getting PVCs: {e}")
@@ -128,24 +165,30 @@ def register_storage_tools(server, non_destructive: bool):
         try:
             storage = get_storage_client(context)
 
-            scs = storage.list_storage_class()
+            scs = cached_list(context, storage.list_storage_class)
+            if scs is None:
+                scs = iter_list_models(storage.list_storage_class)
+
+            storage_classes = []
+            append = storage_classes.append
+            for sc in scs:
+                meta = sc.metadata
+                annotations = meta.annotations
+                append({
+                    "name": meta.name,
+                    "provisioner": sc.provisioner,
+                    "reclaimPolicy": sc.reclaim_policy,
+                    "volumeBindingMode": sc.volume_binding_mode,
+                    "allowVolumeExpansion": sc.allow_volume_expansion,
+                    "default": annotations.get(
+                        "storageclass.kubernetes.io/is-default-class"
+                    ) == "true" if annotations else False
+                })
 
             return {
                 "success": True,
                 "context": context or "current",
-                "storageClasses": [
-                    {
-                        "name": sc.metadata.name,
-                        "provisioner": sc.provisioner,
-                        "reclaimPolicy": sc.reclaim_policy,
-                        "volumeBindingMode": sc.volume_binding_mode,
-                        "allowVolumeExpansion": sc.allow_volume_expansion,
-                        "default": sc.metadata.annotations.get(
-                            "storageclass.kubernetes.io/is-default-class"
-                        ) == "true" if sc.metadata.annotations else False
-                    }
-                    for sc in scs.items
-                ]
+                "storageClasses": storage_classes
             }
         except Exception as e:
             logger.error(f"Error getting Storage Classes: {e}")
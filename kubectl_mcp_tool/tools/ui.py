@@ -5,31 +5,100 @@ These tools return UIResource objects that can be rendered by MCP hosts
 that support the mcp-ui specification (Goose, LibreChat, Nanobot, etc.)
 
 For hosts that don't support mcp-ui, these tools can optionally render
-the UI to a screenshot using agent-browser, making them accessible to
-ALL MCP hosts including Claude Desktop.
+the UI to a screenshot using Playwright or agent-browser, making them
+accessible to ALL MCP hosts including Claude Desktop.
 
 Installation: pip install mcp-ui-server
-Browser screenshots: Requires agent-browser CLI (MCP_BROWSER_ENABLED=true)
+Browser screenshots: Requires MCP_BROWSER_ENABLED=true and either Playwright
+(pip install playwright && playwright install chromium) or the agent-browser CLI
 """
 
+import asyncio
+import atexit
 import base64
+import concurrent.futures
+import contextlib
+import functools
+import gzip
+import hashlib
+import heapq
+import itertools
 import json
 import logging
 import html
+import operator
 import os
+import queue
+import re
 import shutil
 import subprocess
 import tempfile
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from mcp.types import ToolAnnotations
 
+from ..k8s_config import (
+    get_apps_client,
+    get_batch_client,
+    get_k8s_client,
+    get_networking_client,
+)
+from ..informers import cached_list
+from .utils import LIST_CACHE_TTL, list_cache
+
 logger = logging.getLogger("mcp-server")
 
 # Check if agent-browser is available for screenshot rendering
 BROWSER_ENABLED = os.environ.get("MCP_BROWSER_ENABLED", "").lower() in ("1", "true")
 BROWSER_AVAILABLE = shutil.which("agent-browser") is not None
 
+# Playwright is optional; when installed, screenshots come from a long-lived
+# in-process Chromium instead of a chain of agent-browser subprocesses
+try:
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    sync_playwright = None
+    PLAYWRIGHT_AVAILABLE = False
+
+# Backends and the env switch are fixed for the process lifetime
+_CAN_RENDER = BROWSER_ENABLED and (PLAYWRIGHT_AVAILABLE or BROWSER_AVAILABLE)
+
+# Viewport used for screenshots, and for frame sizes given in percent
+DEFAULT_VIEWPORT = (1200, 800)
+_FRAME_DIMENSION_RE = re.compile(r"\s*(\d+)\s*(px|%)?\s*$")
+
+_CHROMIUM_ARGS = ["--no-sandbox", "--disable-gpu", "--disable-dev-shm-usage"]
+SCREENSHOT_TIMEOUT = 10
+
+# Identical pages rendered within this many seconds reuse the previous PNG
+SCREENSHOT_CACHE_TTL = 5.0
+SCREENSHOT_CACHE_SIZE = 32
+
+# Chromium captures one screenshot at a time per browser, so concurrent
+# renders are spread over several independent browsers
+BROWSER_POOL_SIZE = max(2, (os.cpu_count() or 2) // 2)
+
+# Seconds without a render after which a pooled browser is closed; the next
+# render relaunches it
+BROWSER_IDLE_TIMEOUT = 60.0
+
+# Seconds before a UI list call against the API server is abandoned
+LIST_REQUEST_TIMEOUT = 10
+
+# Dedicated pool for fanning out independent, network-bound API calls
+_K8S_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="k8s-api")
+
+# MarkupSafe's C escape is used for table cells when installed
+try:
+    from markupsafe import escape as _markup_escape
+except ImportError:
+    _markup_escape = None
+
 # Try to import mcp-ui-server, gracefully handle if not installed
 try:
     from mcp_ui_server import create_ui_resource, UIMetadataKey
@@ -40,69 +109,388 @@ except ImportError:
     UIResource = Dict[str, Any]  # Fallback type
     logger.warning("mcp-ui-server not installed. UI tools will return plain JSON.")
 
+# Without MCP-UI the show_* tools only ever return their JSON data, so they
+# skip building HTML (screenshots come from render_k8s_dashboard_screenshot)
+_JSON_ONLY = not MCP_UI_AVAILABLE
+
+
+class _BrowserSession:
+    """A headless Chromium kept open across screenshots.
+
+    Playwright's sync API is bound to the thread that started it, so the
+    browser lives on a dedicated worker thread and renders are submitted to it.
+    A browser left unused for BROWSER_IDLE_TIMEOUT seconds after a render is
+    closed to give its memory back.
+    """
+
+    def __init__(self):
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ui-browser"
+        )
+        self._playwright = None
+        self._browser = None
+        self._page = None
+        self._idle_lock = threading.Lock()
+        self._idle_timer: Optional[threading.Timer] = None
+        self._last_used = 0.0
+
+    def _ensure_page(self):
+        if self._browser is not None and self._browser.is_connected():
+            return self._page
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(headless=True, args=_CHROMIUM_ARGS)
+        self._page = self._browser.new_page()
+        return self._page
+
+    def _screenshot(self, html_content: str, width: int, height: int) -> bytes:
+        page = self._ensure_page()
+        page.set_viewport_size({"width": width, "height": height})
+        page.set_content(html_content, wait_until="domcontentloaded")
+        return page.screenshot(type="png", full_page=False, animations="disabled")
+
+    def _warm(self):
+        self._ensure_page().set_content("<html></html>")
+
+    def warm(self) -> concurrent.futures.Future:
+        """Launch the browser and load a blank page on the browser thread."""
+        return self._executor.submit(self._warm)
+
+    def submit(self, html_content: str, width: int, height: int) -> concurrent.futures.Future:
+        """Queue a render on the browser thread; the future resolves to PNG bytes."""
+        self._touch()
+        return self._executor.submit(self._screenshot, html_content, width, height)
+
+    def _touch(self):
+        # One timer per session, re-armed for the remaining time when it fires
+        # early, rather than a new timer thread for every render
+        with self._idle_lock:
+            self._last_used = time.monotonic()
+            if self._idle_timer is None:
+                self._arm_idle_timer(BROWSER_IDLE_TIMEOUT)
+
+    def _arm_idle_timer(self, delay: float):
+        self._idle_timer = threading.Timer(delay, self._close_if_idle)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _close_if_idle(self):
+        with self._idle_lock:
+            idle = time.monotonic() - self._last_used
+            if idle < BROWSER_IDLE_TIMEOUT:
+                self._arm_idle_timer(BROWSER_IDLE_TIMEOUT - idle)
+                return
+            self._idle_timer = None
+        # Queued behind any pending render; a later render relaunches the browser
+        with contextlib.suppress(RuntimeError):  # executor already shut down by close()
+            self._executor.submit(self._shutdown)
+
+    def render(self, html_content: str, width: int, height: int) -> bytes:
+        """Render HTML and return PNG bytes."""
+        return self.submit(html_content, width, height).result(timeout=SCREENSHOT_TIMEOUT)
+
+    def _shutdown(self):
+        browser, playwright = self._browser, self._playwright
+        self._browser = self._page = self._playwright = None
+        if browser is not None:
+            browser.close()
+        if playwright is not None:
+            playwright.stop()
+
+    def close(self):
+        """Close the browser and stop the worker thread."""
+        with self._idle_lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+        try:
+            self._executor.submit(self._shutdown).result(timeout=SCREENSHOT_TIMEOUT)
+        except Exception as e:
+            logger.debug("Error closing screenshot browser: %s", e)
+        self._executor.shutdown(wait=False)
+
+
+_browser_sessions: List[_BrowserSession] = []
+_browser_cycle = None
+_browser_session_lock = threading.Lock()
+
+
+def _close_browser_sessions():
+    for session in _browser_sessions:
+        session.close()
+
+
+def _get_browser_session() -> _BrowserSession:
+    """Return the next browser session from the pool, creating the pool on first use.
+
+    Each session starts its browser lazily, on its first render.
+    """
+    with _browser_session_lock:
+        _ensure_browser_pool()
+        return next(_browser_cycle)
+
+
+def _ensure_browser_pool():
+    """Create the session pool; callers must hold _browser_session_lock."""
+    global _browser_cycle
+    if _browser_cycle is None:
+        _browser_sessions.extend(_BrowserSession() for _ in range(BROWSER_POOL_SIZE))
+        _browser_cycle = itertools.cycle(_browser_sessions)
+        atexit.register(_close_browser_sessions)
+
+
+def _log_warm_failure(future: concurrent.futures.Future):
+    if future.exception() is not None:
+        logger.warning("Failed to pre-launch screenshot browser: %s", future.exception())
+
+
+def _prewarm_browser_pool():
+    """Launch every pooled browser in the background ahead of the first render."""
+    with _browser_session_lock:
+        _ensure_browser_pool()
+    for session in _browser_sessions:
+        session.warm().add_done_callback(_log_warm_failure)
+
+
+class _ScreenshotCache:
+    """Recently rendered screenshots keyed by a hash of the page and viewport."""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(html_content: str, width: int, height: int) -> bytes:
+        digest = hashlib.blake2b(html_content.encode("utf-8"), digest_size=16)
+        digest.update(b"%dx%d" % (width, height))
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self._ttl:
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def put(self, key: bytes, screenshot_b64: Optional[str]):
+        if screenshot_b64 is None:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), screenshot_b64)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+_screenshot_cache = _ScreenshotCache(SCREENSHOT_CACHE_TTL, SCREENSHOT_CACHE_SIZE)
+
 
 def _render_html_to_screenshot(html_content: str, width: int = 1200, height: int = 800) -> Optional[str]:
-    """Render HTML to a screenshot using agent-browser.
+    """Render HTML to a screenshot using Playwright, or agent-browser without it.
 
     Returns base64-encoded PNG image or None if browser not available.
     """
-    if not BROWSER_ENABLED or not BROWSER_AVAILABLE:
+    if not _CAN_RENDER:
         return None
 
-    try:
-        # Save HTML to temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write(html_content)
-            html_path = f.name
+    key = _ScreenshotCache.key(html_content, width, height)
+    screenshot_b64 = _screenshot_cache.get(key)
+    if screenshot_b64 is not None:
+        return screenshot_b64
+
+    if PLAYWRIGHT_AVAILABLE:
+        try:
+            png = _get_browser_session().render(html_content, width, height)
+            screenshot_b64 = base64.b64encode(png).decode('utf-8')
+        except Exception as e:
+            logger.warning("Failed to render screenshot with Playwright: %s", e)
+            if not BROWSER_AVAILABLE:
+                return None
+
+    if screenshot_b64 is None:
+        screenshot_b64 = _render_with_agent_browser(html_content, width, height)
+    _screenshot_cache.put(key, screenshot_b64)
+    return screenshot_b64
+
 
-        # Screenshot path
-        screenshot_path = tempfile.mktemp(suffix='.png')
+async def _render_html_to_screenshot_async(
+    html_content: str, width: int = 1200, height: int = 800
+) -> Optional[str]:
+    """Async variant of _render_html_to_screenshot that does not block the event loop."""
+    if not _CAN_RENDER:
+        return None
+
+    key = _ScreenshotCache.key(html_content, width, height)
+    screenshot_b64 = _screenshot_cache.get(key)
+    if screenshot_b64 is not None:
+        return screenshot_b64
 
+    if PLAYWRIGHT_AVAILABLE:
         try:
-            # Use agent-browser to render and screenshot
-            # Open the HTML file
-            subprocess.run(
-                ["agent-browser", "open", f"file://{html_path}"],
-                capture_output=True, timeout=10
-            )
-
-            # Set viewport size
-            subprocess.run(
-                ["agent-browser", "eval", f"window.resizeTo({width}, {height})"],
-                capture_output=True, timeout=5
-            )
-
-            # Wait for render
-            subprocess.run(
-                ["agent-browser", "wait", "500"],
-                capture_output=True, timeout=5
-            )
-
-            # Take screenshot
-            result = subprocess.run(
-                ["agent-browser", "screenshot", screenshot_path],
-                capture_output=True, timeout=10
-            )
-
-            if result.returncode == 0 and os.path.exists(screenshot_path):
+            future = _get_browser_session().submit(html_content, width, height)
+            png = await asyncio.wait_for(asyncio.wrap_future(future), timeout=SCREENSHOT_TIMEOUT)
+            screenshot_b64 = base64.b64encode(png).decode('utf-8')
+        except Exception as e:
+            logger.warning("Failed to render screenshot with Playwright: %s", e)
+            if not BROWSER_AVAILABLE:
+                return None
+
+    if screenshot_b64 is None:
+        screenshot_b64 = await asyncio.to_thread(_render_with_agent_browser, html_content, width, height)
+    _screenshot_cache.put(key, screenshot_b64)
+    return screenshot_b64
+
+
+def _list_items(
+    cache_key: tuple,
+    list_fn,
+    *args,
+    field_selector: Optional[str] = None,
+    context: str = "",
+) -> list:
+    """Return the items of a list call without a round trip where possible.
+
+    Unfiltered cluster-wide lists come from a shared watch-backed informer for
+    context when informers are enabled and synced. Namespaced and filtered
+    lists go through list_cache, so per-namespace calls never start informers.
+    """
+    if not args and not field_selector:
+        items = cached_list(context, list_fn)
+        if items is not None:
+            return items
+
+    kwargs = {"_request_timeout": LIST_REQUEST_TIMEOUT}
+    if field_selector:
+        kwargs["field_selector"] = field_selector
+    loader = functools.partial(list_fn, *args, **kwargs)
+    return list_cache.get(cache_key, LIST_CACHE_TTL, loader).items
+
+
+def _on_k8s_pool(fn, *args) -> "asyncio.Future":
+    """Run a blocking API client call on _K8S_POOL from the event loop.
+
+    Keeping every UI tool's API I/O on this one bounded pool lets concurrent
+    callers queue for its threads instead of each claiming one from the
+    default executor, which the agent-browser renders also use.
+    """
+    return asyncio.get_running_loop().run_in_executor(_K8S_POOL, fn, *args)
+
+
+async def _list_cluster_overview(v1) -> tuple:
+    """Fetch node, namespace, pod and service items concurrently on _K8S_POOL."""
+    return await asyncio.gather(
+        _on_k8s_pool(_list_items, ("nodes",), v1.list_node),
+        _on_k8s_pool(_list_items, ("namespaces",), v1.list_namespace),
+        _on_k8s_pool(_list_items, ("pods", None, None), v1.list_pod_for_all_namespaces),
+        _on_k8s_pool(_list_items, ("services",), v1.list_service_for_all_namespaces),
+    )
+
+
+# Reusable HTML/PNG file pairs for agent-browser renders, kept in a private
+# directory on tmpfs (/dev/shm) when available so renders never touch disk
+SCRATCH_SLOTS = 4
+_scratch_dir: Optional[str] = None
+_scratch_slots: "queue.Queue[int]" = queue.Queue()
+_scratch_lock = threading.Lock()
+
+
+def _get_scratch_dir() -> str:
+    """Create the scratch directory and its free-slot queue on first use."""
+    global _scratch_dir
+    with _scratch_lock:
+        if _scratch_dir is None:
+            parent = "/dev/shm" if os.path.isdir("/dev/shm") else None
+            _scratch_dir = tempfile.mkdtemp(prefix="kubectl-mcp-ui-", dir=parent)
+            atexit.register(shutil.rmtree, _scratch_dir, ignore_errors=True)
+            for slot in range(SCRATCH_SLOTS):
+                _scratch_slots.put(slot)
+        return _scratch_dir
+
+
+@contextlib.contextmanager
+def _scratch_files() -> Iterator[Tuple[str, str]]:
+    """Check out an (html_path, png_path) pair, returning it to the ring afterwards."""
+    scratch_dir = _get_scratch_dir()
+    slot = _scratch_slots.get(timeout=SCREENSHOT_TIMEOUT)
+    try:
+        yield (os.path.join(scratch_dir, f"page-{slot}.html"),
+               os.path.join(scratch_dir, f"shot-{slot}.png"))
+    finally:
+        _scratch_slots.put(slot)
+
+
+# agent-browser drives one page in its background daemon, so renders through
+# it are serialized; the last viewport is remembered to skip redundant resizes
+_agent_browser_lock = threading.Lock()
+_agent_browser_viewport: Optional[Tuple[int, int]] = None
+
+
+def _render_with_agent_browser(html_content: str, width: int, height: int) -> Optional[str]:
+    """Render HTML to a screenshot through the agent-browser CLI."""
+    global _agent_browser_viewport
+
+    try:
+        with _scratch_files() as (html_path, screenshot_path):
+            with open(html_path, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+
+            with _agent_browser_lock:
+                if _agent_browser_viewport != (width, height):
+                    resized = subprocess.run(
+                        ["agent-browser", "set", "viewport", str(width), str(height)],
+                        capture_output=True, timeout=5
+                    )
+                    _agent_browser_viewport = (width, height) if resized.returncode == 0 else None
+
+                # open returns once the page has loaded; the HTML is static,
+                # so no extra settle time is needed before the screenshot
+                subprocess.run(
+                    ["agent-browser", "open", f"file://{html_path}"],
+                    capture_output=True, timeout=10
+                )
+                result = subprocess.run(
+                    ["agent-browser", "screenshot", screenshot_path],
+                    capture_output=True, timeout=10
+                )
+
+            if result.returncode == 0:
                 with open(screenshot_path, 'rb') as f:
                     return base64.b64encode(f.read()).decode('utf-8')
 
             return None
-        finally:
-            # Cleanup temp files
-            if os.path.exists(html_path):
-                os.unlink(html_path)
-            if os.path.exists(screenshot_path):
-                os.unlink(screenshot_path)
     except Exception as e:
-        logger.warning(f"Failed to render screenshot: {e}")
+        logger.warning("Failed to render screenshot: %s", e)
         return None
 
 
 def _can_render_screenshots() -> bool:
     """Check if screenshot rendering is available."""
-    return BROWSER_ENABLED and BROWSER_AVAILABLE
+    return _CAN_RENDER
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_frame(frame_size: tuple) -> Tuple[int, int]:
+    """Convert a CSS (width, height) frame size to a pixel viewport.
+
+    Percentages and unparseable values fall back to DEFAULT_VIEWPORT.
+    """
+    viewport = []
+    for value, default in zip(frame_size, DEFAULT_VIEWPORT):
+        match = _FRAME_DIMENSION_RE.match(value)
+        if match and match.group(2) != "%":
+            viewport.append(int(match.group(1)))
+        else:
+            viewport.append(default)
+    return viewport[0], viewport[1]
 
 
 # CSS styles for consistent theming across UI components
@@ -252,15 +640,414 @@ tr:hover td { background: rgba(137, 180, 250, 0.05); }
 """
 
 
-def _escape(text: str) -> str:
-    """HTML escape text content."""
-    return html.escape(str(text)) if text else ""
+# Namespaced kinds (with kubectl short names) read straight from the API as YAML
+_YAML_READER_TABLE = (
+    (("pod", "pods", "po"), get_k8s_client, "read_namespaced_pod"),
+    (("service", "services", "svc"), get_k8s_client, "read_namespaced_service"),
+    (("configmap", "configmaps", "cm"), get_k8s_client, "read_namespaced_config_map"),
+    (("secret", "secrets"), get_k8s_client, "read_namespaced_secret"),
+    (("serviceaccount", "serviceaccounts", "sa"), get_k8s_client, "read_namespaced_service_account"),
+    (("persistentvolumeclaim", "persistentvolumeclaims", "pvc"), get_k8s_client,
+     "read_namespaced_persistent_volume_claim"),
+    (("deployment", "deployments", "deploy"), get_apps_client, "read_namespaced_deployment"),
+    (("statefulset", "statefulsets", "sts"), get_apps_client, "read_namespaced_stateful_set"),
+    (("daemonset", "daemonsets", "ds"), get_apps_client, "read_namespaced_daemon_set"),
+    (("replicaset", "replicasets", "rs"), get_apps_client, "read_namespaced_replica_set"),
+    (("job", "jobs"), get_batch_client, "read_namespaced_job"),
+    (("cronjob", "cronjobs", "cj"), get_batch_client, "read_namespaced_cron_job"),
+    (("ingress", "ingresses", "ing"), get_networking_client, "read_namespaced_ingress"),
+    (("networkpolicy", "networkpolicies", "netpol"), get_networking_client,
+     "read_namespaced_network_policy"),
+)
+_YAML_READERS = {
+    alias: (get_client, method)
+    for aliases, get_client, method in _YAML_READER_TABLE
+    for alias in aliases
+}
+_YAML_ACCEPT = {"Accept": "application/yaml"}
+
+# kubectl hides metadata.managedFields by default; drop it from API YAML too
+_MANAGED_FIELDS_RE = re.compile(r"^  managedFields:\n(?:(?:  - |    ).*\n)*", re.M)
+
+
+def _read_resource_yaml(resource_type: str, name: str, namespace: str) -> Optional[str]:
+    """Read a resource as YAML from the API server.
+
+    Returns None for kinds without a direct reader; callers fall back to kubectl.
+    """
+    reader = _YAML_READERS.get(resource_type.lower())
+    if reader is None:
+        return None
+    get_client, method = reader
+    resp = getattr(get_client(), method)(
+        name, namespace, _preload_content=False, _headers=_YAML_ACCEPT
+    )
+    return _MANAGED_FIELDS_RE.sub("", resp.data.decode("utf-8"))
+
+
+# Log line highlighting: one match picks the first class whose keyword occurs
+# anywhere in the line (error beats warn beats info), named by lastgroup
+_LOG_CLASSIFIER = re.compile(
+    r"(?=.*(?:error|fail|exception|panic))(?P<err>)|(?=.*warn)(?P<warn>)|(?=.*info)(?P<info>)",
+    re.I,
+)
+_LOG_LINE_CLASS = {
+    "err": "log-line log-error",
+    "warn": "log-line log-warn",
+    "info": "log-line log-info",
+}
+
+_LOG_CHUNK_SIZE = 64 * 1024
+
+
+def _read_log_lines(v1, pod_name: str, namespace: str, container: Optional[str], tail: int) -> List[str]:
+    """Stream the last `tail` lines of a pod's log without buffering the whole body."""
+    resp = v1.read_namespaced_pod_log(
+        name=pod_name,
+        namespace=namespace,
+        container=container,
+        tail_lines=tail,
+        _preload_content=False
+    )
+    lines = []
+    pending = b""
+    try:
+        for chunk in resp.stream(_LOG_CHUNK_SIZE):
+            *complete, pending = (pending + chunk).split(b"\n")
+            lines.extend(line.decode("utf-8", errors="replace") for line in complete)
+    finally:
+        resp.release_conn()
+    if pending:
+        lines.append(pending.decode("utf-8", errors="replace"))
+    return lines
+
+
+def _minify_css(css: str) -> str:
+    """Collapse whitespace in a stylesheet and drop it around punctuation."""
+    return re.sub(r"\s*([{};:,>])\s*", r"\1", re.sub(r"\s+", " ", css)).strip()
+
+
+# Page shell around the minified theme, built once; only the body varies per call
+_PAGE_HEAD = f"""<!DOCTYPE html>
+<html><head><style>{_minify_css(DARK_THEME_CSS)}</style></head>
+<body>
+"""
+_PAGE_TAIL = "</body></html>"
+
+
+def _render_page(body: str) -> str:
+    """Wrap body markup in the themed HTML page."""
+    return _PAGE_HEAD + body + _PAGE_TAIL
+
+
+# Pages larger than this are shipped gzip-compressed to MCP-UI hosts. Typical
+# dashboards stay well below it and are sent as plain HTML, so hosts without
+# DecompressionStream or with a strict CSP still render them
+COMPRESS_MIN_BYTES = 64 * 1024
+
+# Inflates the embedded gzip+base64 page in the host iframe
+_GZIP_BOOTSTRAP = """<!DOCTYPE html>
+<html><body><script>
+const b = atob("{payload}");
+const bytes = Uint8Array.from(b, c => c.charCodeAt(0));
+new Response(new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip")))
+    .text().then(page => {{ document.open(); document.write(page); document.close(); }});
+</script></body></html>"""
+
+
+def _compress_page(html_content: str) -> str:
+    """Return a small self-inflating page for large HTML, else the HTML itself.
+
+    Table-heavy pages repeat the same markup per row, so gzip shrinks them
+    several times over even after base64 encoding.
+    """
+    if len(html_content) <= COMPRESS_MIN_BYTES:
+        return html_content
+    blob = gzip.compress(html_content.encode("utf-8"), compresslevel=6)
+    return _GZIP_BOOTSTRAP.format(payload=base64.b64encode(blob).decode("ascii"))
+
+
+# Static page scripts; only the pod logs page carries per-call data (LOG_PARAMS)
+_LOGS_SCRIPT = """<script>
+function filterLogs() {
+    const search = document.getElementById('search').value.toLowerCase();
+    const lines = document.querySelectorAll('.log-line');
+    lines.forEach(line => {
+        line.style.display = line.textContent.toLowerCase().includes(search) ? 'block' : 'none';
+    });
+}
+function copyLogs() {
+    const logs = document.getElementById('logs').textContent;
+    navigator.clipboard.writeText(logs);
+}
+function refreshLogs() {
+    window.parent.postMessage({
+        type: 'tool',
+        payload: {
+            toolName: 'show_pod_logs_ui',
+            params: LOG_PARAMS
+        }
+    }, '*');
+}
+</script>
+"""
+
+_PODS_SCRIPT = """<script>
+function filterPods(search) {
+    const rows = document.querySelectorAll('#pods-table tbody tr');
+    search = search.toLowerCase();
+    rows.forEach(row => {
+        row.style.display = row.textContent.toLowerCase().includes(search) ? '' : 'none';
+    });
+}
+function viewLogs(pod, ns) {
+    window.parent.postMessage({
+        type: 'tool',
+        payload: { toolName: 'show_pod_logs_ui', params: { pod_name: pod, namespace: ns, tail: 100 } }
+    }, '*');
+}
+</script>
+"""
+
+_YAML_SCRIPT = """<script>
+function copyYaml() {
+    const yaml = document.getElementById('yaml-content').textContent;
+    navigator.clipboard.writeText(yaml);
+}
+</script>
+"""
+
+_OVERVIEW_SCRIPT = """<script>
+function viewPods() {
+    window.parent.postMessage({
+        type: 'tool',
+        payload: { toolName: 'show_pods_dashboard_ui', params: {} }
+    }, '*');
+}
+function refresh() {
+    window.parent.postMessage({
+        type: 'tool',
+        payload: { toolName: 'show_cluster_overview_ui', params: {} }
+    }, '*');
+}
+</script>
+"""
+
+# Filtering flips one attribute on #events; the stylesheet hides the other cards
+_EVENTS_SCRIPT = """<style>
+#events[data-filter="Warning"] .card:not([data-event-type="Warning"]),
+#events[data-filter="Normal"] .card:not([data-event-type="Normal"]) { display: none; }
+</style>
+<script>
+function filterEvents(type) {
+    const events = document.getElementById('events');
+    if (type === 'all') delete events.dataset.filter;
+    else events.dataset.filter = type;
+}
+</script>
+"""
+
+
+def _js_literal(value: Any) -> str:
+    """Encode a value as a JavaScript literal that is safe inside a <script> element."""
+    return json.dumps(value).replace("</", "<\\/")
+
+
+def _logs_script(pod_name: str, namespace: str, tail: int) -> str:
+    """Pod logs page script with the refresh parameters bound."""
+    params = _js_literal({"pod_name": pod_name, "namespace": namespace, "tail": tail})
+    return f"<script>const LOG_PARAMS = {params};</script>\n" + _LOGS_SCRIPT
+
+
+# Phases always reported by the pods dashboard, even when zero
+_POD_PHASES = ("Running", "Pending", "Failed", "Succeeded", "Unknown")
+
+# Pod phase -> (status indicator class, badge color)
+_PHASE_STYLE = {
+    "Running": ("status-running", "green"),
+    "Pending": ("status-pending", "yellow"),
+    "Failed": ("status-failed", "red"),
+    "Succeeded": ("status-running", "red"),
+}
+_DEFAULT_PHASE_STYLE = ("status-unknown", "red")
+
+_POD_ROW_TEMPLATE = """
+                <tr>
+                    <td><span class="status-indicator {status_class}"></span>{name}</td>
+                    <td>{namespace}</td>
+                    <td><span class="badge badge-{badge}">{phase}</span></td>
+                    <td>{restarts}</td>
+                    <td>{ip}</td>
+                    <td>
+                        <button class="btn btn-secondary" onclick="viewLogs({name_js}, {namespace_js})">Logs</button>
+                    </td>
+                </tr>"""
+
+
+# Unclassified log line for the screenshot logs view
+_PLAIN_LOG_LINE = '<span class="log-line">{}</span>'
+
+# Characters of a log line kept in a screenshot; the rest cannot be seen
+# in a 1200x800 render and only slows escaping and page load
+SCREENSHOT_LOG_LINE_CHARS = 2000
+
+# Compact pod row for the screenshot dashboard
+_SCREENSHOT_POD_ROW_TEMPLATE = """
+                    <tr>
+                        <td><span class="status-indicator {status_class}"></span>{name}</td>
+                        <td>{namespace}</td>
+                        <td><span class="badge badge-{badge}">{phase}</span></td>
+                    </tr>"""
+_SCREENSHOT_PHASE_STYLE = {
+    "Running": ("status-running", "green"),
+    "Pending": ("status-pending", "yellow"),
+}
+_DEFAULT_SCREENSHOT_PHASE_STYLE = ("status-failed", "red")
+
+_NODE_ROW_TEMPLATE = """
+                <tr>
+                    <td><span class="status-indicator {status_class}"></span>{name}</td>
+                    <td><span class="badge badge-{badge}">{status}</span></td>
+                    <td>{cpu}</td>
+                    <td>{memory}</td>
+                </tr>"""
+
+_EVENT_CARD_TEMPLATE = """
+                <div class="card" data-event-type="{type}" style="border-left: 3px solid var({accent})">
+                    <div class="card-header">
+                        <span class="card-title">
+                            <span class="badge badge-{badge}">{type}</span>
+                            {reason}
+                        </span>
+                        <span class="timestamp">{time}</span>
+                    </div>
+                    <p style="font-size: 0.85rem; color: var(--text-secondary)">
+                        {kind}: {object_name}
+                        <span style="color: var(--text-muted)">in {namespace}</span>
+                    </p>
+                    <p style="margin-top: 8px; font-size: 0.85rem">{message}</p>
+                </div>"""
+
+
+if _markup_escape is not None:
+    def _escape(text: str) -> str:
+        """HTML escape text content."""
+        return str(_markup_escape(text)) if text else ""
+else:
+    # html.escape's chained str.replace calls are each a single C scan; a
+    # str.translate table with multi-character replacements is several times
+    # slower, so the stdlib escape stays as the fallback
+    def _escape(text: str) -> str:
+        """HTML escape text content."""
+        if not text:
+            return ""
+        return html.escape(text if text.__class__ is str else str(text))
+
+
+def _pod_row(pod) -> str:
+    """Render one pods-dashboard table row."""
+    status = pod.status
+    phase = status.phase or "Unknown"
+    container_statuses = status.container_statuses
+    status_class, badge = _PHASE_STYLE.get(phase, _DEFAULT_PHASE_STYLE)
+    return _POD_ROW_TEMPLATE.format(
+        status_class=status_class,
+        name=_escape(pod.metadata.name),
+        namespace=_escape(pod.metadata.namespace),
+        badge=badge,
+        phase=_escape(phase),
+        restarts=sum(cs.restart_count for cs in container_statuses) if container_statuses else 0,
+        ip=_escape(status.pod_ip or '-'),
+        # JS string literals inside an HTML attribute: JSON-encode, then escape for the attribute
+        name_js=html.escape(json.dumps(pod.metadata.name)),
+        namespace_js=html.escape(json.dumps(pod.metadata.namespace)),
+    )
+
+
+def _screenshot_log_lines(log_lines: List[str]) -> Iterator[str]:
+    """Drop blank log lines and clip long ones to SCREENSHOT_LOG_LINE_CHARS."""
+    for line in log_lines:
+        if not line or line.isspace():
+            continue
+        if len(line) > SCREENSHOT_LOG_LINE_CHARS:
+            line = line[:SCREENSHOT_LOG_LINE_CHARS] + "\u2026"
+        yield line
+
+
+def _count_running_pods(pods: list) -> int:
+    """Count pods in the Running phase.
+
+    The cost is the model's status/phase property lookups, not the loop
+    itself; attrgetter or array-based counting measured no faster.
+    """
+    return sum(1 for pod in pods if pod.status.phase == "Running")
+
+
+def _node_is_ready(node) -> bool:
+    """Check a node's Ready condition."""
+    return any(c.type == "Ready" and c.status == "True" for c in (node.status.conditions or []))
+
+
+def _screenshot_pod_row(pod) -> str:
+    """Render one screenshot pods-dashboard table row."""
+    phase = pod.status.phase or "Unknown"
+    status_class, badge = _SCREENSHOT_PHASE_STYLE.get(phase, _DEFAULT_SCREENSHOT_PHASE_STYLE)
+    return _SCREENSHOT_POD_ROW_TEMPLATE.format(
+        status_class=status_class,
+        name=_escape(pod.metadata.name[:40]),
+        namespace=_escape(pod.metadata.namespace),
+        badge=badge,
+        phase=_escape(phase),
+    )
+
+
+def _node_row(node, is_ready: bool) -> str:
+    """Render one cluster-overview node table row."""
+    allocatable = node.status.allocatable or {}
+    return _NODE_ROW_TEMPLATE.format(
+        status_class="status-running" if is_ready else "status-failed",
+        name=_escape(node.metadata.name),
+        badge="green" if is_ready else "red",
+        status="Ready" if is_ready else "NotReady",
+        cpu=_escape(allocatable.get("cpu", "N/A")),
+        memory=_escape(allocatable.get("memory", "N/A")),
+    )
+
+
+# Sort key for events that carry no timestamp at all
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
+# Fields of an event listed in the JSON summary, fetched in one call
+_event_summary_fields = operator.attrgetter("type", "reason", "message", "involved_object")
+
+
+def _event_time(event) -> datetime:
+    """Timestamp used to order events, newest being largest."""
+    return event.last_timestamp or event.metadata.creation_timestamp or _EPOCH
+
+
+def _event_card(event, is_warning: bool) -> str:
+    """Render one events-timeline card."""
+    timestamp = event.last_timestamp or event.metadata.creation_timestamp
+    involved = event.involved_object
+    return _EVENT_CARD_TEMPLATE.format(
+        accent="--accent-red" if is_warning else "--accent-green",
+        badge="red" if is_warning else "green",
+        type=_escape(event.type),
+        reason=_escape(event.reason),
+        time=timestamp.strftime("%H:%M:%S") if timestamp else "Unknown",
+        kind=_escape(involved.kind),
+        object_name=_escape(involved.name),
+        namespace=_escape(event.metadata.namespace),
+        message=_escape(event.message),
+    )
 
 
 def _create_ui_or_fallback(
     uri: str,
     html_content: str,
-    fallback_data: Dict[str, Any],
+    fallback: Callable[[], Dict[str, Any]],
     frame_size: tuple = ("800px", "500px"),
     render_screenshot: bool = False
 ) -> Union[List[UIResource], Dict[str, Any]]:
@@ -269,14 +1056,14 @@ def _create_ui_or_fallback(
     Args:
         uri: Unique URI for the resource (e.g., ui://cluster-overview)
         html_content: The HTML content to render
-        fallback_data: JSON data to return if MCP-UI not available
+        fallback: Builds the JSON data returned if MCP-UI is not available;
+            only called when that data is actually returned
         frame_size: Preferred frame size (width, height) in CSS units
         render_screenshot: If True and browser available, also render screenshot
     """
     # Option 1: Render screenshot using agent-browser (works everywhere)
-    if render_screenshot and _can_render_screenshots():
-        width = int(frame_size[0].replace('px', '').replace('%', '0'))
-        height = int(frame_size[1].replace('px', '').replace('%', '0'))
+    if render_screenshot and _CAN_RENDER:
+        width, height = _parse_frame(frame_size)
         screenshot_b64 = _render_html_to_screenshot(html_content, width, height)
         if screenshot_b64:
             # Return as embedded image that any MCP host can display
@@ -287,8 +1074,8 @@ def _create_ui_or_fallback(
                     "media_type": "image/png",
                     "data": screenshot_b64
                 },
-                "note": "Screenshot rendered via agent-browser. For interactive UI, use a host that supports MCP-UI.",
-                **fallback_data
+                "note": "Screenshot rendered via headless browser. For interactive UI, use a host that supports MCP-UI.",
+                **fallback()
             }
 
     # Option 2: Return MCP-UI resource (for compatible hosts)
@@ -298,7 +1085,7 @@ def _create_ui_or_fallback(
                 "uri": uri,
                 "content": {
                     "type": "rawHtml",
-                    "htmlString": html_content
+                    "htmlString": _compress_page(html_content)
                 },
                 "encoding": "text",
                 "uiMetadata": {
@@ -307,63 +1094,40 @@ def _create_ui_or_fallback(
             })
             return [ui_resource]
         except Exception as e:
-            logger.warning(f"Failed to create UI resource: {e}")
+            logger.warning("Failed to create UI resource: %s", e)
 
     # Option 3: Return plain JSON fallback
-    return fallback_data
+    return fallback()
 
 
-def register_ui_tools(server, non_destructive: bool):
-    """Register UI-enhanced tools with the MCP server.
+def show_pod_logs_ui(
+    pod_name: str,
+    namespace: str = "default",
+    container: Optional[str] = None,
+    tail: int = 100
+) -> Union[List[UIResource], Dict[str, Any]]:
+    """Display pod logs in an interactive UI with search and syntax highlighting."""
+    try:
+        v1 = get_k8s_client()
 
-    Args:
-        server: FastMCP server instance
-        non_destructive: If True, block destructive operations
-    """
+        log_lines = _read_log_lines(v1, pod_name, namespace, container, tail)
 
-    @server.tool(
-        annotations=ToolAnnotations(
-            title="Show Pod Logs UI",
-            readOnlyHint=True,
-        ),
-    )
-    def show_pod_logs_ui(
-        pod_name: str,
-        namespace: str = "default",
-        container: Optional[str] = None,
-        tail: int = 100
-    ) -> Union[List[UIResource], Dict[str, Any]]:
-        """Display pod logs in an interactive UI with search and syntax highlighting."""
-        try:
-            from kubernetes import client, config
-            config.load_kube_config()
-            v1 = client.CoreV1Api()
-
-            logs = v1.read_namespaced_pod_log(
-                name=pod_name,
-                namespace=namespace,
-                container=container,
-                tail_lines=tail
-            )
-
-            # Process log lines for highlighting
-            log_lines = logs.split('\n') if logs else []
-            processed_lines = []
-            for line in log_lines:
-                escaped = _escape(line)
-                css_class = "log-line"
-                if any(kw in line.lower() for kw in ['error', 'fail', 'exception', 'panic']):
-                    css_class += " log-error"
-                elif any(kw in line.lower() for kw in ['warn', 'warning']):
-                    css_class += " log-warn"
-                elif any(kw in line.lower() for kw in ['info']):
-                    css_class += " log-info"
-                processed_lines.append(f'<span class="{css_class}">{escaped}</span>')
-
-            html_content = f"""<!DOCTYPE html>
-<html><head><style>{DARK_THEME_CSS}</style></head>
-<body>
-<div class="container">
+        def fallback_data() -> Dict[str, Any]:
+            return {"success": True, "logs": "\n".join(log_lines), "lineCount": len(log_lines)}
+
+        if _JSON_ONLY:
+            return fallback_data()
+
+        # Process log lines for highlighting
+        processed_lines = []
+        append = processed_lines.append
+        classify = _LOG_CLASSIFIER.match
+        for line in log_lines:
+            match = classify(line)
+            css_class = _LOG_LINE_CLASS[match.lastgroup] if match else "log-line"
+            append(f'<span class="{css_class}">{_escape(line)}</span>')
+
+        html_content = _render_page(f"""<div class="container">
     <div class="header">
         <h2>Pod Logs</h2>
         <span class="badge badge-blue">{_escape(namespace)}/{_escape(pod_name)}</span>
@@ -381,101 +1145,58 @@ def register_ui_tools(server, non_destructive: bool):
         <pre class="log-content" id="logs">{''.join(processed_lines)}</pre>
     </div>
 </div>
-<script>
-function filterLogs() {{
-    const search = document.getElementById('search').value.toLowerCase();
-    const lines = document.querySelectorAll('.log-line');
-    lines.forEach(line => {{
-        line.style.display = line.textContent.toLowerCase().includes(search) ? 'block' : 'none';
-    }});
-}}
-function copyLogs() {{
-    const logs = document.getElementById('logs').textContent;
-    navigator.clipboard.writeText(logs);
-}}
-function refreshLogs() {{
-    window.parent.postMessage({{
-        type: 'tool',
-        payload: {{
-            toolName: 'show_pod_logs_ui',
-            params: {{ pod_name: '{_escape(pod_name)}', namespace: '{_escape(namespace)}', tail: {tail} }}
-        }}
-    }}, '*');
-}}
-</script>
-</body></html>"""
+""" + _logs_script(pod_name, namespace, tail))
 
-            return _create_ui_or_fallback(
-                uri=f"ui://pod-logs/{namespace}/{pod_name}",
-                html_content=html_content,
-                fallback_data={"success": True, "logs": logs, "lineCount": len(log_lines)},
-                frame_size=("900px", "600px")
-            )
+        return _create_ui_or_fallback(
+            uri=f"ui://pod-logs/{namespace}/{pod_name}",
+            html_content=html_content,
+            fallback=fallback_data,
+            frame_size=("900px", "600px")
+        )
 
-        except Exception as e:
-            logger.error(f"Error showing pod logs UI: {e}")
-            return {"success": False, "error": str(e)}
-
-    @server.tool(
-        annotations=ToolAnnotations(
-            title="Show Pods Dashboard UI",
-            readOnlyHint=True,
-        ),
-    )
-    def show_pods_dashboard_ui(
-        namespace: Optional[str] = None
-    ) -> Union[List[UIResource], Dict[str, Any]]:
-        """Display an interactive dashboard showing all pods with status, metrics, and actions."""
-        try:
-            from kubernetes import client, config
-            config.load_kube_config()
-            v1 = client.CoreV1Api()
+    except Exception as e:
+        logger.error("Error showing pod logs UI: %s", e)
+        return {"success": False, "error": str(e)}
 
-            if namespace:
-                pods = v1.list_namespaced_pod(namespace)
-            else:
-                pods = v1.list_pod_for_all_namespaces()
-
-            # Count by status
-            status_counts = {"Running": 0, "Pending": 0, "Failed": 0, "Succeeded": 0, "Unknown": 0}
-            pod_rows = []
-
-            for pod in pods.items:
-                phase = pod.status.phase or "Unknown"
-                status_counts[phase] = status_counts.get(phase, 0) + 1
-
-                # Determine status indicator class
-                status_class = {
-                    "Running": "status-running",
-                    "Pending": "status-pending",
-                    "Failed": "status-failed",
-                    "Succeeded": "status-running"
-                }.get(phase, "status-unknown")
-
-                # Get restart count
-                restart_count = 0
-                if pod.status.container_statuses:
-                    restart_count = sum(cs.restart_count for cs in pod.status.container_statuses)
-
-                pod_rows.append(f"""
-                <tr>
-                    <td><span class="status-indicator {status_class}"></span>{_escape(pod.metadata.name)}</td>
-                    <td>{_escape(pod.metadata.namespace)}</td>
-                    <td><span class="badge badge-{'green' if phase == 'Running' else 'yellow' if phase == 'Pending' else 'red'}">{_escape(phase)}</span></td>
-                    <td>{restart_count}</td>
-                    <td>{_escape(pod.status.pod_ip or '-')}</td>
-                    <td>
-                        <button class="btn btn-secondary" onclick="viewLogs('{_escape(pod.metadata.name)}', '{_escape(pod.metadata.namespace)}')">Logs</button>
-                    </td>
-                </tr>""")
 
-            total_pods = len(pods.items)
-            ns_display = f"Namespace: {_escape(namespace)}" if namespace else "All Namespaces"
+def show_pods_dashboard_ui(
+    namespace: Optional[str] = None,
+    status: Optional[str] = None
+) -> Union[List[UIResource], Dict[str, Any]]:
+    """Display an interactive dashboard showing all pods (optionally only one phase, e.g. Running) with status, metrics, and actions."""
+    try:
+        v1 = get_k8s_client()
 
-            html_content = f"""<!DOCTYPE html>
-<html><head><style>{DARK_THEME_CSS}</style></head>
-<body>
-<div class="container">
+        field_selector = f"status.phase={status}" if status else None
+        cache_key = ("pods", namespace or None, status or None)
+        if namespace:
+            pods = _list_items(cache_key, v1.list_namespaced_pod, namespace, field_selector=field_selector)
+        else:
+            pods = _list_items(cache_key, v1.list_pod_for_all_namespaces, field_selector=field_selector)
+
+        # Count by status
+        status_counts = Counter(dict.fromkeys(_POD_PHASES, 0))
+        status_counts.update(pod.status.phase or "Unknown" for pod in pods)
+        total_pods = len(pods)
+
+        def fallback_data() -> Dict[str, Any]:
+            return {
+                "success": True,
+                "totalPods": total_pods,
+                "statusCounts": status_counts,
+                "pods": [
+                    {"name": p.metadata.name, "namespace": p.metadata.namespace, "status": p.status.phase}
+                    for p in pods[:50]  # Limit for JSON response
+                ]
+            }
+
+        if _JSON_ONLY:
+            return fallback_data()
+
+        pod_rows = "".join(map(_pod_row, pods))
+        ns_display = f"Namespace: {_escape(namespace)}" if namespace else "All Namespaces"
+
+        html_content = _render_page(f"""<div class="container">
     <div class="header">
         <h2>Pods Dashboard</h2>
         <span class="badge badge-blue">{ns_display}</span>
@@ -487,15 +1208,15 @@ function refreshLogs() {{
             <div class="stat-label">Total Pods</div>
         </div>
         <div class="stat-card">
-            <div class="stat-value" style="color: var(--accent-green)">{status_counts.get('Running', 0)}</div>
+            <div class="stat-value" style="color: var(--accent-green)">{status_counts['Running']}</div>
             <div class="stat-label">Running</div>
         </div>
         <div class="stat-card">
-            <div class="stat-value" style="color: var(--accent-yellow)">{status_counts.get('Pending', 0)}</div>
+            <div class="stat-value" style="color: var(--accent-yellow)">{status_counts['Pending']}</div>
             <div class="stat-label">Pending</div>
         </div>
         <div class="stat-card">
-            <div class="stat-value" style="color: var(--accent-red)">{status_counts.get('Failed', 0)}</div>
+            <div class="stat-value" style="color: var(--accent-red)">{status_counts['Failed']}</div>
             <div class="stat-label">Failed</div>
         </div>
     </div>
@@ -514,63 +1235,36 @@ function refreshLogs() {{
                         <th>Actions</th>
                     </tr>
                 </thead>
-                <tbody>{''.join(pod_rows)}</tbody>
+                <tbody>{pod_rows}</tbody>
             </table>
         </div>
     </div>
 </div>
-<script>
-function filterPods(search) {{
-    const rows = document.querySelectorAll('#pods-table tbody tr');
-    search = search.toLowerCase();
-    rows.forEach(row => {{
-        row.style.display = row.textContent.toLowerCase().includes(search) ? '' : 'none';
-    }});
-}}
-function viewLogs(pod, ns) {{
-    window.parent.postMessage({{
-        type: 'tool',
-        payload: {{ toolName: 'show_pod_logs_ui', params: {{ pod_name: pod, namespace: ns, tail: 100 }} }}
-    }}, '*');
-}}
-</script>
-</body></html>"""
-
-            return _create_ui_or_fallback(
-                uri=f"ui://pods-dashboard/{namespace or 'all'}",
-                html_content=html_content,
-                fallback_data={
-                    "success": True,
-                    "totalPods": total_pods,
-                    "statusCounts": status_counts,
-                    "pods": [
-                        {"name": p.metadata.name, "namespace": p.metadata.namespace, "status": p.status.phase}
-                        for p in pods.items[:50]  # Limit for JSON response
-                    ]
-                },
-                frame_size=("1000px", "700px")
-            )
+""" + _PODS_SCRIPT)
 
-        except Exception as e:
-            logger.error(f"Error showing pods dashboard UI: {e}")
-            return {"success": False, "error": str(e)}
-
-    @server.tool(
-        annotations=ToolAnnotations(
-            title="Show Resource YAML UI",
-            readOnlyHint=True,
-        ),
-    )
-    def show_resource_yaml_ui(
-        resource_type: str,
-        name: str,
-        namespace: str = "default"
-    ) -> Union[List[UIResource], Dict[str, Any]]:
-        """Display Kubernetes resource YAML with syntax highlighting and actions."""
-        try:
-            import subprocess
-            import yaml
+        return _create_ui_or_fallback(
+            uri=f"ui://pods-dashboard/{namespace or 'all'}",
+            html_content=html_content,
+            fallback=fallback_data,
+            frame_size=("1000px", "700px")
+        )
+
+    except Exception as e:
+        logger.error("Error showing pods dashboard UI: %s", e)
+        return {"success": False, "error": str(e)}
 
+
+def show_resource_yaml_ui(
+    resource_type: str,
+    name: str,
+    namespace: str = "default"
+) -> Union[List[UIResource], Dict[str, Any]]:
+    """Display Kubernetes resource YAML with syntax highlighting and actions."""
+    try:
+        yaml_content = _read_resource_yaml(resource_type, name, namespace)
+
+        if yaml_content is None:
+            # CRDs and other kinds without a direct reader go through kubectl
             cmd = ["kubectl", "get", resource_type, name, "-n", namespace, "-o", "yaml"]
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
 
@@ -579,27 +1273,27 @@ function viewLogs(pod, ns) {{
 
             yaml_content = result.stdout
 
-            # Basic YAML syntax highlighting
-            highlighted_lines = []
-            for line in yaml_content.split('\n'):
-                escaped = _escape(line)
-                # Highlight keys
-                if ':' in line and not line.strip().startswith('-'):
-                    key_part = escaped.split(':')[0]
-                    rest = ':'.join(escaped.split(':')[1:])
-                    escaped = f'<span style="color: var(--accent-blue)">{key_part}</span>:{rest}'
-                # Highlight comments
-                if line.strip().startswith('#'):
-                    escaped = f'<span style="color: var(--text-muted)">{escaped}</span>'
-                highlighted_lines.append(escaped)
-
-            # Escape YAML for JavaScript template literal (must be done outside f-string)
-            escaped_yaml = yaml_content.replace('`', r'\`').replace('$', r'\$')
-
-            html_content = f"""<!DOCTYPE html>
-<html><head><style>{DARK_THEME_CSS}</style></head>
-<body>
-<div class="container">
+        def fallback_data() -> Dict[str, Any]:
+            return {"success": True, "yaml": yaml_content}
+
+        if _JSON_ONLY:
+            return fallback_data()
+
+        # Basic YAML syntax highlighting
+        highlighted_lines = []
+        for line in yaml_content.split('\n'):
+            escaped = _escape(line)
+            # Highlight keys
+            if ':' in line and not line.strip().startswith('-'):
+                key_part = escaped.split(':')[0]
+                rest = ':'.join(escaped.split(':')[1:])
+                escaped = f'<span style="color: var(--accent-blue)">{key_part}</span>:{rest}'
+            # Highlight comments
+            if line.strip().startswith('#'):
+                escaped = f'<span style="color: var(--text-muted)">{escaped}</span>'
+            highlighted_lines.append(escaped)
+
+        html_content = _render_page(f"""<div class="container">
     <div class="header">
         <h2>{_escape(resource_type)}: {_escape(name)}</h2>
         <span class="badge badge-blue">{_escape(namespace)}</span>
@@ -614,81 +1308,49 @@ function viewLogs(pod, ns) {{
         <pre id="yaml-content">{chr(10).join(highlighted_lines)}</pre>
     </div>
 </div>
-<script>
-function copyYaml() {{
-    const yaml = `{escaped_yaml}`;
-    navigator.clipboard.writeText(yaml);
-}}
-</script>
-</body></html>"""
+""" + _YAML_SCRIPT)
 
-            return _create_ui_or_fallback(
-                uri=f"ui://resource-yaml/{resource_type}/{namespace}/{name}",
-                html_content=html_content,
-                fallback_data={"success": True, "yaml": yaml_content},
-                frame_size=("900px", "700px")
-            )
+        return _create_ui_or_fallback(
+            uri=f"ui://resource-yaml/{resource_type}/{namespace}/{name}",
+            html_content=html_content,
+            fallback=fallback_data,
+            frame_size=("900px", "700px")
+        )
 
-        except Exception as e:
-            logger.error(f"Error showing resource YAML UI: {e}")
-            return {"success": False, "error": str(e)}
-
-    @server.tool(
-        annotations=ToolAnnotations(
-            title="Show Cluster Overview UI",
-            readOnlyHint=True,
-        ),
-    )
-    def show_cluster_overview_ui() -> Union[List[UIResource], Dict[str, Any]]:
-        """Display a comprehensive cluster overview dashboard with nodes, namespaces, and key metrics."""
-        try:
-            from kubernetes import client, config
-            config.load_kube_config()
-            v1 = client.CoreV1Api()
-
-            # Get nodes
-            nodes = v1.list_node()
-            node_rows = []
-            ready_nodes = 0
-
-            for node in nodes.items:
-                is_ready = False
-                for condition in (node.status.conditions or []):
-                    if condition.type == "Ready" and condition.status == "True":
-                        is_ready = True
-                        ready_nodes += 1
-                        break
-
-                # Get allocatable resources
-                allocatable = node.status.allocatable or {}
-                cpu = allocatable.get("cpu", "N/A")
-                memory = allocatable.get("memory", "N/A")
-
-                node_rows.append(f"""
-                <tr>
-                    <td><span class="status-indicator {'status-running' if is_ready else 'status-failed'}"></span>{_escape(node.metadata.name)}</td>
-                    <td><span class="badge badge-{'green' if is_ready else 'red'}">{'Ready' if is_ready else 'NotReady'}</span></td>
-                    <td>{_escape(cpu)}</td>
-                    <td>{_escape(memory)}</td>
-                </tr>""")
-
-            # Get namespaces
-            namespaces = v1.list_namespace()
-            ns_count = len(namespaces.items)
-
-            # Get pods summary
-            pods = v1.list_pod_for_all_namespaces()
-            total_pods = len(pods.items)
-            running_pods = sum(1 for p in pods.items if p.status.phase == "Running")
-
-            # Get services
-            services = v1.list_service_for_all_namespaces()
-            svc_count = len(services.items)
-
-            html_content = f"""<!DOCTYPE html>
-<html><head><style>{DARK_THEME_CSS}</style></head>
-<body>
-<div class="container">
+    except Exception as e:
+        logger.error("Error showing resource YAML UI: %s", e)
+        return {"success": False, "error": str(e)}
+
+
+async def show_cluster_overview_ui() -> Union[List[UIResource], Dict[str, Any]]:
+    """Display a comprehensive cluster overview dashboard with nodes, namespaces, and key metrics."""
+    try:
+        v1 = await _on_k8s_pool(get_k8s_client)
+
+        nodes, namespaces, pods, services = await _list_cluster_overview(v1)
+
+        node_ready = [_node_is_ready(node) for node in nodes]
+        ready_nodes = sum(node_ready)
+        ns_count = len(namespaces)
+        total_pods = len(pods)
+        running_pods = _count_running_pods(pods)
+        svc_count = len(services)
+
+        def fallback_data() -> Dict[str, Any]:
+            return {
+                "success": True,
+                "nodes": {"total": len(nodes), "ready": ready_nodes},
+                "namespaces": ns_count,
+                "pods": {"total": total_pods, "running": running_pods},
+                "services": svc_count
+            }
+
+        if _JSON_ONLY:
+            return fallback_data()
+
+        node_rows = "".join(map(_node_row, nodes, node_ready))
+
+        html_content = _render_page(f"""<div class="container">
     <div class="header">
         <h2>Cluster Overview</h2>
         <span class="badge badge-green">Connected</span>
@@ -696,7 +1358,7 @@ function copyYaml() {{
 
     <div class="stat-grid">
         <div class="stat-card">
-            <div class="stat-value">{len(nodes.items)}</div>
+            <div class="stat-value">{len(nodes)}</div>
             <div class="stat-label">Nodes ({ready_nodes} Ready)</div>
         </div>
         <div class="stat-card">
@@ -721,7 +1383,7 @@ function copyYaml() {{
             <thead>
                 <tr><th>Name</th><th>Status</th><th>CPU</th><th>Memory</th></tr>
             </thead>
-            <tbody>{''.join(node_rows)}</tbody>
+            <tbody>{node_rows}</tbody>
         </table>
     </div>
 
@@ -730,103 +1392,63 @@ function copyYaml() {{
         <button class="btn btn-secondary" onclick="refresh()">Refresh</button>
     </div>
 </div>
-<script>
-function viewPods() {{
-    window.parent.postMessage({{
-        type: 'tool',
-        payload: {{ toolName: 'show_pods_dashboard_ui', params: {{}} }}
-    }}, '*');
-}}
-function refresh() {{
-    window.parent.postMessage({{
-        type: 'tool',
-        payload: {{ toolName: 'show_cluster_overview_ui', params: {{}} }}
-    }}, '*');
-}}
-</script>
-</body></html>"""
-
-            return _create_ui_or_fallback(
-                uri="ui://cluster-overview",
-                html_content=html_content,
-                fallback_data={
-                    "success": True,
-                    "nodes": {"total": len(nodes.items), "ready": ready_nodes},
-                    "namespaces": ns_count,
-                    "pods": {"total": total_pods, "running": running_pods},
-                    "services": svc_count
-                },
-                frame_size=("1000px", "700px")
-            )
+""" + _OVERVIEW_SCRIPT)
 
-        except Exception as e:
-            logger.error(f"Error showing cluster overview UI: {e}")
-            return {"success": False, "error": str(e)}
-
-    @server.tool(
-        annotations=ToolAnnotations(
-            title="Show Events Timeline UI",
-            readOnlyHint=True,
-        ),
-    )
-    def show_events_timeline_ui(
-        namespace: Optional[str] = None,
-        limit: int = 50
-    ) -> Union[List[UIResource], Dict[str, Any]]:
-        """Display Kubernetes events in a timeline view with filtering by type."""
-        try:
-            from kubernetes import client, config
-            config.load_kube_config()
-            v1 = client.CoreV1Api()
+        return _create_ui_or_fallback(
+            uri="ui://cluster-overview",
+            html_content=html_content,
+            fallback=fallback_data,
+            frame_size=("1000px", "700px")
+        )
 
-            if namespace:
-                events = v1.list_namespaced_event(namespace)
-            else:
-                events = v1.list_event_for_all_namespaces()
-
-            # Sort by timestamp (most recent first)
-            sorted_events = sorted(
-                events.items,
-                key=lambda e: e.last_timestamp or e.metadata.creation_timestamp or "",
-                reverse=True
-            )[:limit]
-
-            event_items = []
-            warning_count = 0
-            normal_count = 0
-
-            for event in sorted_events:
-                is_warning = event.type == "Warning"
-                if is_warning:
-                    warning_count += 1
-                else:
-                    normal_count += 1
-
-                timestamp = event.last_timestamp or event.metadata.creation_timestamp
-                time_str = timestamp.strftime("%H:%M:%S") if timestamp else "Unknown"
-
-                event_items.append(f"""
-                <div class="card" style="border-left: 3px solid var({'--accent-red' if is_warning else '--accent-green'})">
-                    <div class="card-header">
-                        <span class="card-title">
-                            <span class="badge badge-{'red' if is_warning else 'green'}">{_escape(event.type)}</span>
-                            {_escape(event.reason)}
-                        </span>
-                        <span class="timestamp">{time_str}</span>
-                    </div>
-                    <p style="font-size: 0.85rem; color: var(--text-secondary)">
-                        {_escape(event.involved_object.kind)}: {_escape(event.involved_object.name)}
-                        <span style="color: var(--text-muted)">in {_escape(event.metadata.namespace)}</span>
-                    </p>
-                    <p style="margin-top: 8px; font-size: 0.85rem">{_escape(event.message)}</p>
-                </div>""")
+    except Exception as e:
+        logger.error("Error showing cluster overview UI: %s", e)
+        return {"success": False, "error": str(e)}
 
-            ns_display = f"Namespace: {_escape(namespace)}" if namespace else "All Namespaces"
 
-            html_content = f"""<!DOCTYPE html>
-<html><head><style>{DARK_THEME_CSS}</style></head>
-<body>
-<div class="container">
+def show_events_timeline_ui(
+    namespace: Optional[str] = None,
+    limit: int = 50,
+    event_type: Optional[str] = None
+) -> Union[List[UIResource], Dict[str, Any]]:
+    """Display Kubernetes events in a timeline view with filtering by type (event_type: Warning or Normal)."""
+    try:
+        v1 = get_k8s_client()
+
+        field_selector = f"type={event_type}" if event_type else None
+        cache_key = ("events", namespace or None, event_type or None)
+        if namespace:
+            events = _list_items(cache_key, v1.list_namespaced_event, namespace, field_selector=field_selector)
+        else:
+            events = _list_items(cache_key, v1.list_event_for_all_namespaces, field_selector=field_selector)
+
+        # Most recent first
+        sorted_events = heapq.nlargest(limit, events, key=_event_time)
+
+        is_warning = [event.type == "Warning" for event in sorted_events]
+        warning_count = sum(is_warning)
+        normal_count = len(sorted_events) - warning_count
+
+        def fallback_data() -> Dict[str, Any]:
+            return {
+                "success": True,
+                "totalEvents": len(sorted_events),
+                "warnings": warning_count,
+                "normal": normal_count,
+                "events": [
+                    {"type": type_, "reason": reason, "message": message, "object": f"{obj.kind}/{obj.name}"}
+                    for type_, reason, message, obj in map(_event_summary_fields, sorted_events[:20])
+                ]
+            }
+
+        if _JSON_ONLY:
+            return fallback_data()
+
+        event_items = "".join(map(_event_card, sorted_events, is_warning))
+
+        ns_display = f"Namespace: {_escape(namespace)}" if namespace else "All Namespaces"
+
+        html_content = _render_page(f"""<div class="container">
     <div class="header">
         <h2>Events Timeline</h2>
         <span class="badge badge-blue">{ns_display}</span>
@@ -853,209 +1475,167 @@ function refresh() {{
         <button class="btn btn-secondary" onclick="filterEvents('Normal')">Normal</button>
     </div>
 
-    <div id="events">{''.join(event_items)}</div>
+    <div id="events">{event_items}</div>
 </div>
-<script>
-function filterEvents(type) {{
-    const events = document.querySelectorAll('#events .card');
-    events.forEach(e => {{
-        if (type === 'all') e.style.display = 'block';
-        else e.style.display = e.innerHTML.includes('>' + type + '<') ? 'block' : 'none';
-    }});
-}}
-</script>
-</body></html>"""
-
-            return _create_ui_or_fallback(
-                uri=f"ui://events-timeline/{namespace or 'all'}",
-                html_content=html_content,
-                fallback_data={
-                    "success": True,
-                    "totalEvents": len(sorted_events),
-                    "warnings": warning_count,
-                    "normal": normal_count,
-                    "events": [
-                        {
-                            "type": e.type,
-                            "reason": e.reason,
-                            "message": e.message,
-                            "object": f"{e.involved_object.kind}/{e.involved_object.name}"
-                        }
-                        for e in sorted_events[:20]
-                    ]
-                },
-                frame_size=("900px", "700px")
-            )
+""" + _EVENTS_SCRIPT)
 
-        except Exception as e:
-            logger.error(f"Error showing events timeline UI: {e}")
-            return {"success": False, "error": str(e)}
-
-    @server.tool(
-        annotations=ToolAnnotations(
-            title="Render K8s Dashboard Screenshot",
-            readOnlyHint=True,
-        ),
-    )
-    def render_k8s_dashboard_screenshot(
-        dashboard: str = "cluster",
-        namespace: Optional[str] = None,
-        pod_name: Optional[str] = None,
-        resource_type: Optional[str] = None,
-        resource_name: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Render a Kubernetes dashboard to a screenshot image (works in all MCP hosts).
-
-        This uses agent-browser to render the UI and capture a screenshot,
-        making visual dashboards accessible even in hosts that don't support MCP-UI.
-
-        Args:
-            dashboard: Type of dashboard to render:
-                - "cluster": Cluster overview with nodes, pods, services
-                - "pods": Pods dashboard with status table
-                - "events": Events timeline
-                - "logs": Pod logs viewer (requires pod_name)
-                - "yaml": Resource YAML viewer (requires resource_type and resource_name)
-            namespace: Namespace filter (optional)
-            pod_name: Pod name for logs dashboard
-            resource_type: Resource type for YAML view (e.g., "deployment", "service")
-            resource_name: Resource name for YAML view
-        """
-        if not _can_render_screenshots():
-            return {
-                "success": False,
-                "error": "Screenshot rendering requires MCP_BROWSER_ENABLED=true and agent-browser installed"
-            }
+        return _create_ui_or_fallback(
+            uri=f"ui://events-timeline/{namespace or 'all'}",
+            html_content=html_content,
+            fallback=fallback_data,
+            frame_size=("900px", "700px")
+        )
 
-        try:
-            from kubernetes import client, config
-            config.load_kube_config()
-
-            # Generate the appropriate dashboard HTML
-            if dashboard == "cluster":
-                # Reuse cluster overview logic
-                v1 = client.CoreV1Api()
-                nodes = v1.list_node()
-                namespaces = v1.list_namespace()
-                pods = v1.list_pod_for_all_namespaces()
-                services = v1.list_service_for_all_namespaces()
-
-                ready_nodes = sum(1 for n in nodes.items
-                    for c in (n.status.conditions or [])
-                    if c.type == "Ready" and c.status == "True")
-                running_pods = sum(1 for p in pods.items if p.status.phase == "Running")
-
-                node_rows = []
-                for node in nodes.items:
-                    is_ready = any(c.type == "Ready" and c.status == "True"
-                        for c in (node.status.conditions or []))
-                    allocatable = node.status.allocatable or {}
-                    node_rows.append(f"""
-                    <tr>
-                        <td><span class="status-indicator {'status-running' if is_ready else 'status-failed'}"></span>{_escape(node.metadata.name)}</td>
-                        <td><span class="badge badge-{'green' if is_ready else 'red'}">{'Ready' if is_ready else 'NotReady'}</span></td>
-                        <td>{_escape(allocatable.get('cpu', 'N/A'))}</td>
-                        <td>{_escape(allocatable.get('memory', 'N/A'))}</td>
-                    </tr>""")
-
-                html_content = f"""<!DOCTYPE html>
-<html><head><style>{DARK_THEME_CSS}</style></head>
-<body>
-<div class="container">
+    except Exception as e:
+        logger.error("Error showing events timeline UI: %s", e)
+        return {"success": False, "error": str(e)}
+
+
+async def render_k8s_dashboard_screenshot(
+    dashboard: str = "cluster",
+    namespace: Optional[str] = None,
+    pod_name: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    resource_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """Render a Kubernetes dashboard to a screenshot image (works in all MCP hosts).
+
+    This uses a headless browser to render the UI and capture a screenshot,
+    making visual dashboards accessible even in hosts that don't support MCP-UI.
+
+    Args:
+        dashboard: Type of dashboard to render:
+            - "cluster": Cluster overview with nodes, pods, services
+            - "pods": Pods dashboard with status table
+            - "logs": Pod logs viewer (requires pod_name)
+        namespace: Namespace filter (optional)
+        pod_name: Pod name for logs dashboard
+        resource_type: Not used by any dashboard; accepted for compatibility
+        resource_name: Not used by any dashboard; accepted for compatibility
+    """
+    if not _CAN_RENDER:
+        return {
+            "success": False,
+            "error": "Screenshot rendering requires MCP_BROWSER_ENABLED=true and Playwright or agent-browser installed"
+        }
+
+    try:
+        v1 = await _on_k8s_pool(get_k8s_client)
+
+        # Generate the appropriate dashboard HTML
+        if dashboard == "cluster":
+            # Reuse cluster overview logic
+            nodes, namespaces, pods, services = await _list_cluster_overview(v1)
+
+            running_pods = _count_running_pods(pods)
+
+            node_ready = [_node_is_ready(node) for node in nodes]
+            ready_nodes = sum(node_ready)
+            node_rows = "".join(map(_node_row, nodes, node_ready))
+
+            html_content = _render_page(f"""<div class="container">
     <div class="header">
         <h2>Cluster Overview</h2>
         <span class="badge badge-green">Connected</span>
     </div>
     <div class="stat-grid">
-        <div class="stat-card"><div class="stat-value">{len(nodes.items)}</div><div class="stat-label">Nodes ({ready_nodes} Ready)</div></div>
-        <div class="stat-card"><div class="stat-value">{len(namespaces.items)}</div><div class="stat-label">Namespaces</div></div>
-        <div class="stat-card"><div class="stat-value" style="color: var(--accent-green)">{running_pods}/{len(pods.items)}</div><div class="stat-label">Pods Running</div></div>
-        <div class="stat-card"><div class="stat-value">{len(services.items)}</div><div class="stat-label">Services</div></div>
+        <div class="stat-card"><div class="stat-value">{len(nodes)}</div><div class="stat-label">Nodes ({ready_nodes} Ready)</div></div>
+        <div class="stat-card"><div class="stat-value">{len(namespaces)}</div><div class="stat-label">Namespaces</div></div>
+        <div class="stat-card"><div class="stat-value" style="color: var(--accent-green)">{running_pods}/{len(pods)}</div><div class="stat-label">Pods Running</div></div>
+        <div class="stat-card"><div class="stat-value">{len(services)}</div><div class="stat-label">Services</div></div>
     </div>
     <div class="card" style="margin-top: 16px">
         <div class="card-header"><span class="card-title">Nodes</span></div>
         <table><thead><tr><th>Name</th><th>Status</th><th>CPU</th><th>Memory</th></tr></thead>
-        <tbody>{''.join(node_rows)}</tbody></table>
+        <tbody>{node_rows}</tbody></table>
     </div>
 </div>
-</body></html>"""
-
-            elif dashboard == "pods":
-                v1 = client.CoreV1Api()
-                if namespace:
-                    pods = v1.list_namespaced_pod(namespace)
-                else:
-                    pods = v1.list_pod_for_all_namespaces()
-
-                pod_rows = []
-                for pod in pods.items[:30]:  # Limit for screenshot
-                    phase = pod.status.phase or "Unknown"
-                    status_class = {"Running": "status-running", "Pending": "status-pending"}.get(phase, "status-failed")
-                    badge_color = {"Running": "green", "Pending": "yellow"}.get(phase, "red")
-                    pod_rows.append(f"""
-                    <tr>
-                        <td><span class="status-indicator {status_class}"></span>{_escape(pod.metadata.name[:40])}</td>
-                        <td>{_escape(pod.metadata.namespace)}</td>
-                        <td><span class="badge badge-{badge_color}">{_escape(phase)}</span></td>
-                    </tr>""")
+""")
 
-                html_content = f"""<!DOCTYPE html>
-<html><head><style>{DARK_THEME_CSS}</style></head>
-<body>
-<div class="container">
+        elif dashboard == "pods":
+            cache_key = ("pods", namespace or None, None)
+            if namespace:
+                pods = await _on_k8s_pool(_list_items, cache_key, v1.list_namespaced_pod, namespace)
+            else:
+                pods = await _on_k8s_pool(_list_items, cache_key, v1.list_pod_for_all_namespaces)
+
+            pod_rows = "".join(map(_screenshot_pod_row, pods[:30]))  # Limit for screenshot
+
+            html_content = _render_page(f"""<div class="container">
     <div class="header">
         <h2>Pods Dashboard</h2>
-        <span class="badge badge-blue">{namespace or 'All Namespaces'}</span>
+        <span class="badge badge-blue">{_escape(namespace) or 'All Namespaces'}</span>
     </div>
     <div class="card">
         <table><thead><tr><th>Name</th><th>Namespace</th><th>Status</th></tr></thead>
-        <tbody>{''.join(pod_rows)}</tbody></table>
+        <tbody>{pod_rows}</tbody></table>
     </div>
 </div>
-</body></html>"""
+""")
 
-            elif dashboard == "logs" and pod_name:
-                v1 = client.CoreV1Api()
-                ns = namespace or "default"
-                logs = v1.read_namespaced_pod_log(name=pod_name, namespace=ns, tail_lines=50)
-                log_lines = logs.split('\n') if logs else []
-                processed = [f'<span class="log-line">{_escape(line)}</span>' for line in log_lines]
+        elif dashboard == "logs" and pod_name:
+            ns = namespace or "default"
+            log_lines = await _on_k8s_pool(_read_log_lines, v1, pod_name, ns, None, 50)
+            processed = "".join(map(_PLAIN_LOG_LINE.format, map(_escape, _screenshot_log_lines(log_lines))))
 
-                html_content = f"""<!DOCTYPE html>
-<html><head><style>{DARK_THEME_CSS}</style></head>
-<body>
-<div class="container">
+            html_content = _render_page(f"""<div class="container">
     <div class="header">
         <h2>Pod Logs</h2>
         <span class="badge badge-blue">{_escape(ns)}/{_escape(pod_name)}</span>
     </div>
     <div class="card">
-        <pre class="log-content">{''.join(processed)}</pre>
+        <pre class="log-content">{processed}</pre>
     </div>
 </div>
-</body></html>"""
+""")
 
-            else:
-                return {"success": False, "error": f"Unknown dashboard type: {dashboard}"}
-
-            # Render to screenshot
-            screenshot_b64 = _render_html_to_screenshot(html_content, 1200, 800)
-            if screenshot_b64:
-                return {
-                    "success": True,
-                    "dashboard": dashboard,
-                    "image": {
-                        "type": "base64",
-                        "media_type": "image/png",
-                        "data": screenshot_b64
-                    }
+        else:
+            return {"success": False, "error": f"Unknown dashboard type: {dashboard}"}
+
+        # Render to screenshot
+        screenshot_b64 = await _render_html_to_screenshot_async(html_content, 1200, 800)
+        if screenshot_b64:
+            return {
+                "success": True,
+                "dashboard": dashboard,
+                "image": {
+                    "type": "base64",
+                    "media_type": "image/png",
+                    "data": screenshot_b64
                 }
-            else:
-                return {"success": False, "error": "Failed to render screenshot"}
+            }
+        else:
+            return {"success": False, "error": "Failed to render screenshot"}
 
-        except Exception as e:
-            logger.error(f"Error rendering dashboard screenshot: {e}")
-            return {"success": False, "error": str(e)}
+    except Exception as e:
+        logger.error("Error rendering dashboard screenshot: %s", e)
+        return {"success": False, "error": str(e)}
+
+
+# (annotations, tool function) pairs registered by register_ui_tools
+_REGISTRATIONS = [
+    (ToolAnnotations(title="Show Pod Logs UI", readOnlyHint=True), show_pod_logs_ui),
+    (ToolAnnotations(title="Show Pods Dashboard UI", readOnlyHint=True), show_pods_dashboard_ui),
+    (ToolAnnotations(title="Show Resource YAML UI", readOnlyHint=True), show_resource_yaml_ui),
+    (ToolAnnotations(title="Show Cluster Overview UI", readOnlyHint=True), show_cluster_overview_ui),
+    (ToolAnnotations(title="Show Events Timeline UI", readOnlyHint=True), show_events_timeline_ui),
+    (ToolAnnotations(title="Render K8s Dashboard Screenshot", readOnlyHint=True), render_k8s_dashboard_screenshot),
+]
+
+
+def register_ui_tools(server, non_destructive: bool):
+    """Register UI-enhanced tools with the MCP server.
+
+    Args:
+        server: FastMCP server instance
+        non_destructive: If True, block destructive operations
+    """
+    # Browsers launch on their own worker threads, so this does not delay startup
+    if _CAN_RENDER and PLAYWRIGHT_AVAILABLE:
+        _prewarm_browser_pool()
+
+    for annotations, fn in _REGISTRATIONS:
+        server.tool(annotations=annotations)(fn)
 
 
 def is_ui_available() -> bool:
@@ -1,28 +1,245 @@
 """Shared utilities for kubectl-mcp-server tools."""
 
+import concurrent.futures
+import functools
+import logging
+import shutil
 import subprocess
 import json
-from typing import Any, Dict, List
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from ..k8s_config import _get_kubectl_context_args
+from ..k8s_config import (
+    _get_kubectl_context_args,
+    get_apiextensions_client,
+    get_apps_client,
+    get_custom_objects_client,
+    get_k8s_client,
+    is_stateless_mode,
+    on_config_change,
+)
+
+logger = logging.getLogger("mcp-server")
+
+# ijson is optional; without it list bodies are decoded in one go
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson is optional; it encodes JSONL output and parses list bodies several
+# times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both decoders raise a ValueError subclass on malformed input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Resolved once so each kubectl spawn skips the PATH search; a kubectl
+# installed after startup is still found through PATH
+_KUBECTL = shutil.which("kubectl") or "kubectl"
+
+# Default page size for limit/continue pagination of list calls
+LIST_PAGE_SIZE = 500
+
+# Seconds a cached list result is served as fresh
+LIST_CACHE_TTL = 10.0
+
+# Seconds after which a stale list result is no longer served while refreshing
+LIST_CACHE_MAX_STALE = 60.0
+
+
+class _K8sCache:
+    """Stale-while-revalidate cache for API list results.
+
+    A fresh entry is returned as is. An entry past its TTL is still returned,
+    but a background refresh is started so the next call sees new data. Misses
+    and entries older than LIST_CACHE_MAX_STALE load synchronously. Nothing is
+    cached in stateless mode.
+    """
+
+    def __init__(self):
+        self._entries: Dict[tuple, Tuple[float, Any]] = {}
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="list-cache"
+        )
+
+    def get(
+        self,
+        key: tuple,
+        ttl: float,
+        loader: Callable[[], Any],
+        max_stale: float = LIST_CACHE_MAX_STALE,
+    ) -> Any:
+        """Return the cached value for key, loading or refreshing it as needed.
+
+        With max_stale equal to ttl, an expired entry is never served and is
+        always reloaded synchronously (a plain TTL cache).
+        """
+        if is_stateless_mode():
+            return loader()
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < ttl:
+                return entry[1]
+            if age < max_stale:
+                self._refresh_in_background(key, loader)
+                return entry[1]
+        return self._load(key, loader)
+
+    def invalidate(self, prefix: tuple = ()):
+        """Drop every entry whose key starts with prefix (all entries by default)."""
+        with self._lock:
+            for key in [k for k in self._entries if k[:len(prefix)] == prefix]:
+                del self._entries[key]
+
+    def _load(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        value = loader()
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+        return value
+
+    def _refresh_in_background(self, key: tuple, loader: Callable[[], Any]):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        self._executor.submit(self._refresh, key, loader)
+
+    def _refresh(self, key: tuple, loader: Callable[[], Any]):
+        try:
+            self._load(key, loader)
+        except Exception as e:
+            logger.debug("Background refresh of %s failed: %s", key, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+list_cache = _K8sCache()
+on_config_change(list_cache.invalidate)
+
+
+@functools.lru_cache(maxsize=32)
+def _kubectl_context_args(context: str) -> Tuple[str, ...]:
+    """Memoized kubectl --context arguments for a context."""
+    return tuple(_get_kubectl_context_args(context))
 
 
 def run_kubectl(args: List[str], context: str = "", timeout: int = 60) -> Dict[str, Any]:
     """Run kubectl command and return result."""
-    cmd = ["kubectl"] + _get_kubectl_context_args(context) + args
+    cmd = [_KUBECTL, *_kubectl_context_args(context), *args]
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        # Raw bytes, decoded once, instead of text mode's newline translation
+        result = subprocess.run(cmd, capture_output=True, timeout=timeout)
         if result.returncode == 0:
-            return {"success": True, "output": result.stdout}
-        return {"success": False, "error": result.stderr}
+            return {"success": True, "output": result.stdout.decode("utf-8", "replace")}
+        return {"success": False, "error": result.stderr.decode("utf-8", "replace")}
     except subprocess.TimeoutExpired:
         return {"success": False, "error": "Command timed out"}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+def to_jsonl(envelope: Dict[str, Any], items: Iterable[Any]) -> str:
+    """Encode an envelope line followed by one JSON line per item.
+
+    Items are encoded as they are consumed, so a generator is never
+    materialized as a list of dicts.
+    """
+    if orjson is not None:
+        lines = [orjson.dumps(envelope, default=str)]
+        lines.extend(orjson.dumps(item, default=str) for item in items)
+        return b"\n".join(lines).decode()
+    lines = [json.dumps(envelope, default=str)]
+    lines.extend(json.dumps(item, default=str) for item in items)
+    return "\n".join(lines)
+
+
+# Built-in kinds listed through the typed clients:
+# kind -> (client getter, namespaced list method, all-namespaces/cluster list method)
+_BUILTIN_LISTS = {
+    "pods": (get_k8s_client, "list_namespaced_pod", "list_pod_for_all_namespaces"),
+    "services": (get_k8s_client, "list_namespaced_service", "list_service_for_all_namespaces"),
+    "events": (get_k8s_client, "list_namespaced_event", "list_event_for_all_namespaces"),
+    "nodes": (get_k8s_client, None, "list_node"),
+    "namespaces": (get_k8s_client, None, "list_namespace"),
+    "deployments": (get_apps_client, "list_namespaced_deployment", "list_deployment_for_all_namespaces"),
+}
+_BUILTIN_KIND_ALIASES = {
+    "pod": "pods", "po": "pods",
+    "service": "services", "svc": "services",
+    "event": "events", "ev": "events",
+    "node": "nodes", "no": "nodes",
+    "namespace": "namespaces", "ns": "namespaces",
+    "deployment": "deployments", "deploy": "deployments",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _custom_resource_target(context: str, kind: str) -> Tuple[str, str, str, bool]:
+    """Resolve a plural.group kind to (group, version, plural, namespaced) from its CRD."""
+    crd = get_apiextensions_client(context).read_custom_resource_definition(kind)
+    versions = crd.spec.versions
+    version = next((v.name for v in versions if v.storage), versions[0].name)
+    return crd.spec.group, version, crd.spec.names.plural, crd.spec.scope == "Namespaced"
+
+
+# CRD versions and the default context can change with the kubeconfig
+on_config_change(_custom_resource_target.cache_clear)
+
+
+def _list_call(kind: str, namespace: str, context: str) -> Optional[Tuple[Callable, tuple]]:
+    """Return (list function, positional args) for listing kind in-process, or None."""
+    kind = kind.lower()
+    builtin = _BUILTIN_LISTS.get(_BUILTIN_KIND_ALIASES.get(kind, kind))
+    if builtin is not None:
+        get_client, namespaced_method, all_method = builtin
+        api = get_client(context)
+        if namespace and namespaced_method:
+            return getattr(api, namespaced_method), (namespace,)
+        return getattr(api, all_method), ()
+
+    if "." not in kind:
+        return None
+    group, version, plural, namespaced = _custom_resource_target(context, kind)
+    api = get_custom_objects_client(context)
+    if namespace and namespaced:
+        return api.list_namespaced_custom_object, (group, version, namespace, plural)
+    return api.list_cluster_custom_object, (group, version, plural)
+
+
 def get_resources(kind: str, namespace: str = "", context: str = "", label_selector: str = "") -> List[Dict]:
-    """Get Kubernetes resources of a specific kind."""
+    """Get Kubernetes resources of a specific kind.
+
+    Common built-in kinds and CRD-backed plural.group kinds are listed through
+    the API client, returning the same camelCase dicts as ``kubectl -o json``
+    without spawning kubectl. Other kinds (short names, unknown CRDs) fall
+    back to kubectl.
+    """
+    try:
+        call = _list_call(kind, namespace, context)
+    except Exception as e:
+        logger.debug("Listing %s in-process is not possible, using kubectl: %s", kind, e)
+        call = None
+
+    if call is not None:
+        list_fn, args = call
+        kwargs = {"label_selector": label_selector} if label_selector else {}
+        try:
+            return list(iter_list_items(list_fn, *args, **kwargs))
+        except Exception as e:
+            logger.debug("Error listing %s: %s", kind, e)
+            return []
+
     args = ["get", kind, "-o", "json"]
     if namespace:
         args.extend(["-n", namespace])
@@ -34,8 +251,106 @@ def get_resources(kind: str, namespace: str = "", context: str = "", label_selec
     result = run_kubectl(args, context)
     if result["success"]:
         try:
-            data = json.loads(result["output"])
+            data = _json_loads(result["output"])
             return data.get("items", [])
-        except json.JSONDecodeError:
+        except ValueError:
             return []
     return []
+
+
+def get_resources_fields(
+    kind: str,
+    fields: List[str],
+    namespace: str = "",
+    context: str = "",
+    label_selector: str = "",
+) -> List[Dict[str, str]]:
+    """Get only the given fields of each resource of a kind.
+
+    ``fields`` are dotted paths such as ``"metadata.name"``. kubectl renders
+    them as one tab-separated line per item with a jsonpath template, so the
+    full objects are never serialized or parsed. Missing fields come back as
+    empty strings; fields whose values can contain tabs or newlines need
+    get_resources instead.
+    """
+    columns = '{"\\t"}'.join(f"{{.{field}}}" for field in fields)
+    args = ["get", kind, "-o", f'jsonpath={{range .items[*]}}{columns}{{"\\n"}}{{end}}']
+    if namespace:
+        args.extend(["-n", namespace])
+    else:
+        args.append("-A")
+    if label_selector:
+        args.extend(["-l", label_selector])
+
+    result = run_kubectl(args, context)
+    if not result["success"]:
+        return []
+    return [dict(zip(fields, line.split("\t"))) for line in result["output"].splitlines() if line]
+
+
+def _iter_response_items(resp) -> Iterator[Dict[str, Any]]:
+    """Yield the items of a raw (unpreloaded) list response.
+
+    The generator's return value is the response's continue token.
+    """
+    metadata: Dict[str, Any] = {}
+    done = False
+    try:
+        if ijson is not None:
+            def events():
+                for prefix, event, value in ijson.parse(resp, use_float=True):
+                    if prefix == "metadata.continue":
+                        metadata["continue"] = value
+                    yield prefix, event, value
+
+            yield from ijson.items(events(), "items.item")
+        else:
+            body = _json_loads(resp.data)
+            metadata = body.get("metadata") or {}
+            yield from body.get("items") or []
+        done = True
+    finally:
+        # Only a fully read response can go back to the connection pool
+        if done:
+            resp.release_conn()
+        else:
+            resp.close()
+    return metadata.get("continue")
+
+
+def iter_list_items(
+    list_fn: Callable, *args, page_size: Optional[int] = None, **kwargs
+) -> Iterator[Dict[str, Any]]:
+    """Yield the items of a Kubernetes list call as plain JSON dicts.
+
+    Skips the kubernetes client's model deserializer by requesting the raw
+    response. Items are stream-parsed with ijson when it is installed.
+    Keys keep their API (camelCase) spelling.
+
+    With page_size set, the collection is fetched in limit/continue pages and
+    each page is only requested once the caller has consumed the previous one,
+    so stopping early also stops the apiserver work.
+    """
+    if page_size is None:
+        yield from _iter_response_items(list_fn(*args, _preload_content=False, **kwargs))
+        return
+
+    token = None
+    while True:
+        resp = list_fn(*args, limit=page_size, _continue=token, _preload_content=False, **kwargs)
+        token = yield from _iter_response_items(resp)
+        if not token:
+            return
+
+
+def iter_list_models(
+    list_fn: Callable, *args, page_size: int = LIST_PAGE_SIZE, **kwargs
+) -> Iterator[Any]:
+    """Yield the model items of a Kubernetes list call, paging with limit/continue."""
+    token = None
+    while True:
+        resp = list_fn(*args, limit=page_size, _continue=token, **kwargs)
+        yield from resp.items
+        token = resp.metadata._continue
+        if not token:
+            return
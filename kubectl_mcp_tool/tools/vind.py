@@ -6,8 +6,16 @@ combining vCluster with Docker's simplicity. Uses the standard vCluster CLI.
 
 import subprocess
 import json
+import logging
+import os
 import re
-from typing import Dict, Any, List, Optional
+import shutil
+import tempfile
+import threading
+import time
+from collections import deque
+from functools import partial, wraps
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 
 try:
     from fastmcp import FastMCP
@@ -16,32 +24,154 @@ except ImportError:
     from mcp.server.fastmcp import FastMCP
     from mcp.types import ToolAnnotations
 
+# orjson is optional; it parses JSON straight from bytes and serializes tool
+# output several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..k8s_config import is_stateless_mode, on_config_change
+from .utils import list_cache
+
+logger = logging.getLogger("mcp-server")
+
+_INSTALL_URL = "https://www.vcluster.com/docs/getting-started/setup"
+VCLUSTER_NOT_AVAILABLE = "vcluster CLI not available. Install from: " + _INSTALL_URL
+
+# Returned as shallow copies so a caller mutating its result cannot change them
+_NOT_AVAILABLE_RESULT: Dict[str, Any] = {"success": False, "error": VCLUSTER_NOT_AVAILABLE}
+_NOT_INSTALLED_DETECTION: Dict[str, Any] = {
+    "installed": False,
+    "cli_available": False,
+    "version": None,
+    "install_instructions": _INSTALL_URL,
+}
+
+# Both decoders accept bytes and raise a ValueError subclass on bad input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Tool output is compact on the wire; MCP_DEBUG turns indentation back on
+PRETTY_JSON = os.environ.get("MCP_DEBUG", "").lower() in ("1", "true")
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a tool result as JSON, indented only when PRETTY_JSON is set."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if PRETTY_JSON else 0).decode()
+    if PRETTY_JSON:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+
+_VERSION_RE = re.compile(r'v?\d+\.\d+\.\d+')
+
+# Splits comma-separated --set values and strips them in the same pass
+_SET_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# Seconds a CLI availability or version probe result is reused
+VCLUSTER_PROBE_TTL = 30.0
+
+# Seconds a `vcluster list` result is shared between list and status calls
+VCLUSTER_LIST_TTL = 3.0
+
+# Seconds a read-only tool's JSON output is reused for identical arguments
+VIND_TOOL_CACHE_TTL = 3.0
+VIND_TOOL_CACHE_SIZE = 128
+
+# Most recent bytes of `vcluster logs` output kept per call, read in chunks
+VIND_LOGS_MAX_BYTES = 1 << 20
+VIND_LOGS_CHUNK_SIZE = 64 * 1024
+
+# vcluster subcommands that do not change any vCluster
+_READ_ONLY_COMMANDS = frozenset({"list", "describe", "logs", "version"})
+
+# (tool name, *arguments) -> (monotonic time, JSON output)
+_tool_output_cache: Dict[tuple, Tuple[float, str]] = {}
+_tool_output_lock = threading.Lock()
+
+# probe name -> (monotonic time, result)
+_probe_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+def invalidate_vcluster_cache() -> None:
+    """Forget cached vcluster CLI probes, e.g. after installing the CLI."""
+    _probe_cache.clear()
+
+
+def _invalidate_vcluster_results() -> None:
+    """Drop cached list results and tool outputs once a vCluster may have changed."""
+    list_cache.invalidate(("vcluster",))
+    with _tool_output_lock:
+        _tool_output_cache.clear()
+
+
+on_config_change(_invalidate_vcluster_results)
+
+
+def _cached_tool_json(key: tuple, produce: Callable[[], Dict[str, Any]]) -> str:
+    """Return a read-only tool's indented JSON, reusing a recent identical call.
+
+    Failed results are serialized but not kept. Nothing is cached in
+    stateless mode.
+    """
+    if is_stateless_mode():
+        return _dumps(produce())
+
+    now = time.monotonic()
+    with _tool_output_lock:
+        entry = _tool_output_cache.get(key)
+    if entry is not None and now - entry[0] < VIND_TOOL_CACHE_TTL:
+        return entry[1]
+
+    result = produce()
+    output = _dumps(result)
+    if result.get("success", True):
+        with _tool_output_lock:
+            _tool_output_cache.pop(key, None)
+            if len(_tool_output_cache) >= VIND_TOOL_CACHE_SIZE:
+                del _tool_output_cache[next(iter(_tool_output_cache))]
+            _tool_output_cache[key] = (now, output)
+    return output
+
+
+def _cached_probe(name: str, probe: Callable[[], Any]) -> Any:
+    now = time.monotonic()
+    entry = _probe_cache.get(name)
+    if entry is not None and now - entry[0] < VCLUSTER_PROBE_TTL:
+        return entry[1]
+    value = probe()
+    _probe_cache[name] = (now, value)
+    return value
+
+
+def _vcluster_path() -> Optional[str]:
+    """Absolute path of the vcluster CLI on PATH, or None."""
+    return _cached_probe("path", lambda: shutil.which("vcluster"))
+
 
 def _vcluster_available() -> bool:
-    """Check if vcluster CLI is available."""
-    try:
-        result = subprocess.run(
-            ["vcluster", "version"],
-            capture_output=True,
-            timeout=10
-        )
-        return result.returncode == 0
-    except Exception:
-        return False
+    """Check if vcluster CLI is on PATH, without running it."""
+    return _vcluster_path() is not None
 
 
 def _get_vcluster_version() -> Optional[str]:
     """Get vcluster CLI version."""
+    return _cached_probe("version", _probe_vcluster_version)
+
+
+def _probe_vcluster_version() -> Optional[str]:
     try:
+        # Only stdout is read, and as bytes: the version string is ASCII
         result = subprocess.run(
-            ["vcluster", "version"],
-            capture_output=True,
-            text=True,
+            [_vcluster_path() or "vcluster", "version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=10
         )
         if result.returncode == 0:
-            output = result.stdout.strip()
-            match = re.search(r'v?\d+\.\d+\.\d+', output)
+            output = result.stdout.decode("ascii", "ignore").strip()
+            match = _VERSION_RE.search(output)
             if match:
                 return match.group(0)
             return output
@@ -50,6 +180,10 @@ def _get_vcluster_version() -> Optional[str]:
         return None
 
 
+def _as_text(output) -> str:
+    return output.decode("utf-8", errors="replace") if isinstance(output, bytes) else output
+
+
 def _run_vcluster(
     args: List[str],
     timeout: int = 120,
@@ -65,39 +199,201 @@ def _run_vcluster(
     Returns:
         Result dict with success status and output/error
     """
-    if not _vcluster_available():
-        return {
-            "success": False,
-            "error": "vcluster CLI not available. Install from: https://www.vcluster.com/docs/getting-started/setup"
-        }
-
-    cmd = ["vcluster"] + args
+    # Exec the resolved path so each spawn skips the PATH search. CPython
+    # already starts these children with vfork, which does not copy the
+    # parent's page tables, so close_fds stays at its safe default rather
+    # than being turned off to reach posix_spawn.
+    vcluster = _vcluster_path()
+    if vcluster is None:
+        return _NOT_AVAILABLE_RESULT.copy()
+
+    cmd = [vcluster] + args
     if json_output and "--output" not in args:
         cmd.extend(["--output", "json"])
 
     try:
+        # JSON output stays bytes so it is parsed without decoding it first
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
+            text=not json_output,
             timeout=timeout
         )
         if result.returncode == 0:
             output = result.stdout.strip()
             if json_output and output:
                 try:
-                    return {"success": True, "data": json.loads(output)}
-                except json.JSONDecodeError:
-                    return {"success": True, "output": output}
-            return {"success": True, "output": output}
+                    return {"success": True, "data": _json_loads(output)}
+                except ValueError:
+                    pass
+            return {"success": True, "output": _as_text(output)}
         return {
             "success": False,
-            "error": result.stderr.strip() or f"Command failed with exit code {result.returncode}"
+            "error": _as_text(result.stderr).strip() or f"Command failed with exit code {result.returncode}"
         }
+    except FileNotFoundError:
+        # Removed since the cached PATH probe
+        invalidate_vcluster_cache()
+        return _NOT_AVAILABLE_RESULT.copy()
     except subprocess.TimeoutExpired:
         return {"success": False, "error": f"Command timed out after {timeout} seconds"}
     except Exception as e:
         return {"success": False, "error": str(e)}
+    finally:
+        if args[0] not in _READ_ONLY_COMMANDS:
+            _invalidate_vcluster_results()
+
+
+def _iter_vcluster_output(
+    vcluster: str,
+    args: List[str],
+    timeout: int,
+    chunk_size: int = VIND_LOGS_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield a vcluster command's stdout in chunks as it is produced.
+
+    Raises subprocess.TimeoutExpired if the command outlives timeout and
+    subprocess.CalledProcessError (carrying stderr) if it exits non-zero.
+    """
+    cmd = [vcluster] + args
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            yield from iter(partial(proc.stdout.read1, chunk_size), b"")
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                # The caller stopped reading early
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if returncode != 0:
+            stderr.seek(0)
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr.read())
+
+
+def _run_vcluster_streaming(
+    args: List[str],
+    max_bytes: int = VIND_LOGS_MAX_BYTES,
+    timeout: int = 60
+) -> Dict[str, Any]:
+    """Run a vcluster command, keeping only the last max_bytes of its output.
+
+    Output is read incrementally into a bounded buffer, so memory stays flat
+    however much the command prints. When older output was dropped the
+    result has "truncated": True and starts at the first whole line.
+    """
+    vcluster = _vcluster_path()
+    if vcluster is None:
+        return _NOT_AVAILABLE_RESULT.copy()
+
+    chunks: deque = deque()
+    size = 0
+    truncated = False
+    try:
+        for chunk in _iter_vcluster_output(vcluster, args, timeout):
+            chunks.append(chunk)
+            size += len(chunk)
+            while size - len(chunks[0]) >= max_bytes:
+                size -= len(chunks.popleft())
+                truncated = True
+    except FileNotFoundError:
+        invalidate_vcluster_cache()
+        return _NOT_AVAILABLE_RESULT.copy()
+    except subprocess.TimeoutExpired:
+        return {"success": False, "error": f"Command timed out after {timeout} seconds"}
+    except subprocess.CalledProcessError as e:
+        return {
+            "success": False,
+            "error": _as_text(e.stderr).strip() or f"Command failed with exit code {e.returncode}"
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+    data = b"".join(chunks)
+    if len(data) > max_bytes:
+        data = data[-max_bytes:]
+        truncated = True
+    if truncated:
+        data = data[data.find(b"\n") + 1:]
+
+    result = {"success": True, "output": _as_text(data.strip())}
+    if truncated:
+        result["truncated"] = True
+    return result
+
+
+class _VclusterCommandError(Exception):
+    """A failed vcluster command; carries the error result so it is not cached."""
+
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result.get("error"))
+        self.result = result
+
+
+def _load_vcluster_list() -> Dict[str, Any]:
+    result = _run_vcluster(["list"], json_output=True, timeout=30)
+    if not result["success"]:
+        raise _VclusterCommandError(result)
+    return result
+
+
+def _list_vclusters() -> Dict[str, Any]:
+    """Run `vcluster list --output json`, reusing a result from the last few seconds.
+
+    Goes through the shared list cache so kubeconfig changes drop it, but
+    with a plain TTL: an expired result is reloaded, never served stale, so
+    status polls see clusters created or deleted elsewhere within seconds.
+    """
+    try:
+        return list_cache.get(
+            ("vcluster", "list"), VCLUSTER_LIST_TTL, _load_vcluster_list,
+            max_stale=VCLUSTER_LIST_TTL,
+        )
+    except _VclusterCommandError as e:
+        return e.result
+
+
+def _split_set_values(set_values: str) -> Optional[List[str]]:
+    """Turn a tool's comma-separated set_values into a list, or None if empty."""
+    if not set_values:
+        return None
+    return [v for v in _SET_SPLIT_RE.split(set_values.strip()) if v] or None
+
+
+def _norm(cluster: Dict[str, Any]) -> Dict[str, Any]:
+    """Lower-case a cluster entry's keys; vcluster has emitted both "Name" and "name"."""
+    return {k.lower(): v for k, v in cluster.items()}
+
+
+def _cluster_summary(c: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "name": c.get("name", ""),
+        "namespace": c.get("namespace", ""),
+        "status": c.get("status", ""),
+        "version": c.get("version", ""),
+        "connected": c.get("connected", False),
+        "created": c.get("created", ""),
+        "age": c.get("age", ""),
+    }
+
+
+def _cluster_status(c: Dict[str, Any]) -> Dict[str, Any]:
+    cluster = _cluster_summary(c)
+    cluster["pro"] = c.get("pro", False)
+    return cluster
 
 
 def vind_detect() -> Dict[str, Any]:
@@ -106,14 +402,16 @@ def vind_detect() -> Dict[str, Any]:
     Returns:
         Detection results including CLI availability and version
     """
-    available = _vcluster_available()
-    version = _get_vcluster_version() if available else None
+    # Only report the CLI as installed if it actually runs
+    version = _get_vcluster_version() if _vcluster_available() else None
+    if version is None:
+        return _NOT_INSTALLED_DETECTION.copy()
 
     return {
-        "installed": available,
-        "cli_available": available,
+        "installed": True,
+        "cli_available": True,
         "version": version,
-        "install_instructions": "https://www.vcluster.com/docs/getting-started/setup" if not available else None
+        "install_instructions": None
     }
 
 
@@ -123,31 +421,17 @@ def vind_list_clusters() -> Dict[str, Any]:
     Returns:
         List of vCluster instances with their status
     """
-    result = _run_vcluster(["list"], json_output=True, timeout=30)
+    result = _list_vclusters()
 
     if not result["success"]:
         return result
 
     clusters = []
+    # _run_vcluster returns "data" when the output parsed as JSON, else the raw "output"
     data = result.get("data") or result.get("output", "")
 
-    if isinstance(data, str) and data:
-        try:
-            data = json.loads(data)
-        except json.JSONDecodeError:
-            pass
-
     if isinstance(data, list):
-        for cluster in data:
-            clusters.append({
-                "name": cluster.get("Name", cluster.get("name", "")),
-                "namespace": cluster.get("Namespace", cluster.get("namespace", "")),
-                "status": cluster.get("Status", cluster.get("status", "")),
-                "version": cluster.get("Version", cluster.get("version", "")),
-                "connected": cluster.get("Connected", cluster.get("connected", False)),
-                "created": cluster.get("Created", cluster.get("created", "")),
-                "age": cluster.get("Age", cluster.get("age", "")),
-            })
+        clusters = [_cluster_summary(_norm(cluster)) for cluster in data]
     elif isinstance(data, str) and data:
         return {"success": True, "output": data, "clusters": []}
 
@@ -168,34 +452,17 @@ def vind_status(name: str, namespace: str = "vcluster") -> Dict[str, Any]:
     Returns:
         Detailed status information
     """
-    result = _run_vcluster(
-        ["list"],
-        timeout=30,
-        json_output=True,
-    )
+    result = _list_vclusters()
 
     if not result["success"]:
         return result
 
     data = result.get("data") or []
     if isinstance(data, list):
-        for cluster in data:
-            cluster_name = cluster.get("Name", cluster.get("name", ""))
-            cluster_ns = cluster.get("Namespace", cluster.get("namespace", ""))
-            if cluster_name == name and (not namespace or cluster_ns == namespace):
-                return {
-                    "success": True,
-                    "cluster": {
-                        "name": cluster_name,
-                        "namespace": cluster_ns,
-                        "status": cluster.get("Status", cluster.get("status", "")),
-                        "version": cluster.get("Version", cluster.get("version", "")),
-                        "connected": cluster.get("Connected", cluster.get("connected", False)),
-                        "created": cluster.get("Created", cluster.get("created", "")),
-                        "age": cluster.get("Age", cluster.get("age", "")),
-                        "pro": cluster.get("Pro", cluster.get("pro", False)),
-                    }
-                }
+        for raw in data:
+            c = _norm(raw)
+            if c.get("name", "") == name and (not namespace or c.get("namespace", "") == namespace):
+                return {"success": True, "cluster": _cluster_status(c)}
 
     return {
         "success": False,
@@ -203,6 +470,53 @@ def vind_status(name: str, namespace: str = "vcluster") -> Dict[str, Any]:
     }
 
 
+def vind_status_many(names: List[str], namespace: str = "vcluster") -> Dict[str, Any]:
+    """Get the status of several vCluster instances from a single `vcluster list`.
+
+    Prefer this over repeated vind_status calls when checking more than one
+    cluster.
+
+    Args:
+        names: Names of the vCluster instances
+        namespace: Namespace where they are running (empty matches any)
+
+    Returns:
+        Status per requested name, None for clusters that were not found
+    """
+    result = _list_vclusters()
+
+    if not result["success"]:
+        return result
+
+    wanted = set(names)
+    found: Dict[str, Dict[str, Any]] = {}
+    data = result.get("data") or []
+    if isinstance(data, list):
+        for raw in data:
+            c = _norm(raw)
+            name = c.get("name", "")
+            if name in wanted and name not in found and (not namespace or c.get("namespace", "") == namespace):
+                found[name] = _cluster_status(c)
+
+    return {
+        "success": True,
+        "clusters": {name: found.get(name) for name in names}
+    }
+
+
+def _option_args(*options: Tuple[str, Any]) -> List[str]:
+    """Flatten (flag, value) pairs into CLI arguments, skipping empty values."""
+    return [part for flag, value in options if value for part in (flag, str(value))]
+
+
+def _run_action(args: List[str], timeout: int, message: str, **extra: Any) -> Dict[str, Any]:
+    """Run a vcluster command and wrap its output with a success message."""
+    result = _run_vcluster(args, timeout=timeout)
+    if result["success"]:
+        return {"success": True, "message": message, "output": result.get("output", ""), **extra}
+    return result
+
+
 def vind_get_kubeconfig(
     name: str,
     namespace: str = "vcluster",
@@ -251,12 +565,8 @@ def vind_logs(
     Returns:
         Log output
     """
-    args = ["logs", name, "--namespace", namespace]
-    if tail:
-        args.extend(["--tail", str(tail)])
-
-    result = _run_vcluster(args, timeout=60)
-    return result
+    args = ["logs", name, "--namespace", namespace] + _option_args(("--tail", tail))
+    return _run_vcluster_streaming(args, timeout=60)
 
 
 def vind_create_cluster(
@@ -282,40 +592,17 @@ def vind_create_cluster(
     Returns:
         Creation result
     """
-    args = ["create", name]
-
-    if namespace:
-        args.extend(["--namespace", namespace])
-
-    if kubernetes_version:
-        args.extend(["--kubernetes-version", kubernetes_version])
-
-    if values_file:
-        args.extend(["--values", values_file])
-
-    if set_values:
-        for val in set_values:
-            args.extend(["--set", val])
-
-    if connect:
-        args.append("--connect")
-    else:
-        args.append("--connect=false")
-
+    args = ["create", name] + _option_args(
+        ("--namespace", namespace),
+        ("--kubernetes-version", kubernetes_version),
+        ("--values", values_file),
+        *(("--set", val) for val in set_values or ()),
+    )
+    args.append("--connect" if connect else "--connect=false")
     if upgrade:
         args.append("--upgrade")
 
-    result = _run_vcluster(args, timeout=300)
-
-    if result["success"]:
-        return {
-            "success": True,
-            "message": f"vCluster '{name}' created successfully",
-            "output": result.get("output", ""),
-            "connected": connect
-        }
-
-    return result
+    return _run_action(args, 300, f"vCluster '{name}' created successfully", connected=connect)
 
 
 def vind_delete_cluster(
@@ -335,27 +622,13 @@ def vind_delete_cluster(
     Returns:
         Deletion result
     """
-    args = ["delete", name]
-
-    if namespace:
-        args.extend(["--namespace", namespace])
-
+    args = ["delete", name] + _option_args(("--namespace", namespace))
     if delete_namespace:
         args.append("--delete-namespace")
-
     if force:
         args.append("--force")
 
-    result = _run_vcluster(args, timeout=120)
-
-    if result["success"]:
-        return {
-            "success": True,
-            "message": f"vCluster '{name}' deleted successfully",
-            "output": result.get("output", "")
-        }
-
-    return result
+    return _run_action(args, 120, f"vCluster '{name}' deleted successfully")
 
 
 def vind_pause(name: str, namespace: str = "") -> Dict[str, Any]:
@@ -368,21 +641,8 @@ def vind_pause(name: str, namespace: str = "") -> Dict[str, Any]:
     Returns:
         Pause result
     """
-    args = ["pause", name]
-
-    if namespace:
-        args.extend(["--namespace", namespace])
-
-    result = _run_vcluster(args, timeout=120)
-
-    if result["success"]:
-        return {
-            "success": True,
-            "message": f"vCluster '{name}' paused successfully",
-            "output": result.get("output", "")
-        }
-
-    return result
+    args = ["pause", name] + _option_args(("--namespace", namespace))
+    return _run_action(args, 120, f"vCluster '{name}' paused successfully")
 
 
 def vind_resume(name: str, namespace: str = "") -> Dict[str, Any]:
@@ -395,21 +655,8 @@ def vind_resume(name: str, namespace: str = "") -> Dict[str, Any]:
     Returns:
         Resume result
     """
-    args = ["resume", name]
-
-    if namespace:
-        args.extend(["--namespace", namespace])
-
-    result = _run_vcluster(args, timeout=120)
-
-    if result["success"]:
-        return {
-            "success": True,
-            "message": f"vCluster '{name}' resumed successfully",
-            "output": result.get("output", "")
-        }
-
-    return result
+    args = ["resume", name] + _option_args(("--namespace", namespace))
+    return _run_action(args, 120, f"vCluster '{name}' resumed successfully")
 
 
 def vind_connect(
@@ -431,30 +678,14 @@ def vind_connect(
     Returns:
         Connection result
     """
-    args = ["connect", name]
-
-    if namespace:
-        args.extend(["--namespace", namespace])
-
+    args = ["connect", name] + _option_args(("--namespace", namespace))
     if not update_current:
         args.append("--update-current=false")
-
-    if kube_config:
-        args.extend(["--kube-config", kube_config])
-
+    args += _option_args(("--kube-config", kube_config))
     if background_proxy:
         args.append("--background-proxy")
 
-    result = _run_vcluster(args, timeout=60)
-
-    if result["success"]:
-        return {
-            "success": True,
-            "message": f"Connected to vCluster '{name}'",
-            "output": result.get("output", "")
-        }
-
-    return result
+    return _run_action(args, 60, f"Connected to vCluster '{name}'")
 
 
 def vind_disconnect(name: str, namespace: str = "") -> Dict[str, Any]:
@@ -467,18 +698,7 @@ def vind_disconnect(name: str, namespace: str = "") -> Dict[str, Any]:
     Returns:
         Disconnection result
     """
-    args = ["disconnect"]
-
-    result = _run_vcluster(args, timeout=30)
-
-    if result["success"]:
-        return {
-            "success": True,
-            "message": "Disconnected from vCluster",
-            "output": result.get("output", "")
-        }
-
-    return result
+    return _run_action(["disconnect"], 30, "Disconnected from vCluster")
 
 
 def vind_upgrade(
@@ -500,31 +720,13 @@ def vind_upgrade(
     Returns:
         Upgrade result
     """
-    args = ["create", name, "--upgrade"]
-
-    if namespace:
-        args.extend(["--namespace", namespace])
-
-    if kubernetes_version:
-        args.extend(["--kubernetes-version", kubernetes_version])
-
-    if values_file:
-        args.extend(["--values", values_file])
-
-    if set_values:
-        for val in set_values:
-            args.extend(["--set", val])
-
-    result = _run_vcluster(args, timeout=300)
-
-    if result["success"]:
-        return {
-            "success": True,
-            "message": f"vCluster '{name}' upgraded successfully",
-            "output": result.get("output", "")
-        }
-
-    return result
+    args = ["create", name, "--upgrade"] + _option_args(
+        ("--namespace", namespace),
+        ("--kubernetes-version", kubernetes_version),
+        ("--values", values_file),
+        *(("--set", val) for val in set_values or ()),
+    )
+    return _run_action(args, 300, f"vCluster '{name}' upgraded successfully")
 
 
 def vind_describe(name: str, namespace: str = "") -> Dict[str, Any]:
@@ -537,13 +739,8 @@ def vind_describe(name: str, namespace: str = "") -> Dict[str, Any]:
     Returns:
         Detailed cluster information
     """
-    args = ["describe", name]
-
-    if namespace:
-        args.extend(["--namespace", namespace])
-
-    result = _run_vcluster(args, timeout=60)
-    return result
+    args = ["describe", name] + _option_args(("--namespace", namespace))
+    return _run_vcluster(args, timeout=60)
 
 
 def vind_platform_start(
@@ -561,41 +758,64 @@ def vind_platform_start(
     Returns:
         Platform start result
     """
-    args = ["platform", "start"]
+    args = ["platform", "start"] + _option_args(("--host", host), ("--port", port))
+    if no_port_forwarding:
+        args.append("--no-port-forwarding")
 
-    if host:
-        args.extend(["--host", host])
+    return _run_action(args, 60, "vCluster Platform started")
 
-    if port:
-        args.extend(["--port", str(port)])
 
-    if no_port_forwarding:
-        args.append("--no-port-forwarding")
+_BLOCKED = json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
 
-    result = _run_vcluster(args, timeout=60)
 
-    if result["success"]:
-        return {
-            "success": True,
-            "message": "vCluster Platform started",
-            "output": result.get("output", "")
-        }
+def _blocked_when(non_destructive: bool) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    """Swap a write tool for a stand-in that returns the blocked reply.
 
-    return result
+    Decided once at registration. The stand-in keeps the tool's name,
+    docstring and signature, so the tool schema clients see is unchanged.
+    """
+    def decorate(fn: Callable[..., str]) -> Callable[..., str]:
+        if not non_destructive:
+            return fn
+
+        @wraps(fn)
+        def blocked(*args, **kwargs) -> str:
+            return _BLOCKED
+        return blocked
+    return decorate
 
 
 def register_vind_tools(mcp: FastMCP, non_destructive: bool = False):
     """Register vind (vCluster in Docker) tools with the MCP server."""
+    write_tool = _blocked_when(non_destructive)
 
     @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
     def vind_detect_tool() -> str:
         """Detect if vCluster CLI is installed and get version info."""
-        return json.dumps(vind_detect(), indent=2)
+        return _cached_tool_json(("vind_detect",), vind_detect)
+
+    if not _vcluster_available():
+        # Without the CLI every other tool could only return the install
+        # message, so list a single stand-in for them instead
+        logger.warning("vcluster CLI not found in PATH; registering only vind_detect_tool and vind_unavailable_tool")
+
+        unavailable_json = json.dumps({
+            "success": False,
+            "error": VCLUSTER_NOT_AVAILABLE
+            + ". Restart the MCP server after installing it to register the vind tools.",
+        })
+
+        @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+        def vind_unavailable_tool() -> str:
+            """Explain that vind tools need the vCluster CLI, which was not found at startup; restart after installing it."""
+            return unavailable_json
+
+        return
 
     @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
     def vind_list_clusters_tool() -> str:
         """List all vCluster instances."""
-        return json.dumps(vind_list_clusters(), indent=2)
+        return _cached_tool_json(("vind_list_clusters",), vind_list_clusters)
 
     @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
     def vind_status_tool(
@@ -603,7 +823,17 @@ def register_vind_tools(mcp: FastMCP, non_destructive: bool = False):
         namespace: str = "vcluster"
     ) -> str:
         """Get detailed status of a vCluster instance."""
-        return json.dumps(vind_status(name, namespace), indent=2)
+        return _cached_tool_json(("vind_status", name, namespace), lambda: vind_status(name, namespace))
+
+    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    def vind_status_many_tool(
+        names: List[str],
+        namespace: str = "vcluster"
+    ) -> str:
+        """Get the status of several vCluster instances at once; prefer this over repeated vind_status_tool calls."""
+        return _cached_tool_json(
+            ("vind_status_many", tuple(names), namespace), lambda: vind_status_many(names, namespace)
+        )
 
     @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
     def vind_get_kubeconfig_tool(
@@ -611,7 +841,7 @@ def register_vind_tools(mcp: FastMCP, non_destructive: bool = False):
         namespace: str = "vcluster"
     ) -> str:
         """Get kubeconfig for a vCluster instance."""
-        return json.dumps(vind_get_kubeconfig(name, namespace, print_only=True), indent=2)
+        return _dumps(vind_get_kubeconfig(name, namespace, print_only=True))
 
     @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
     def vind_logs_tool(
@@ -620,9 +850,10 @@ def register_vind_tools(mcp: FastMCP, non_destructive: bool = False):
         tail: int = 100
     ) -> str:
         """Get logs from a vCluster instance."""
-        return json.dumps(vind_logs(name, namespace, follow=False, tail=tail), indent=2)
+        return _dumps(vind_logs(name, namespace, follow=False, tail=tail))
 
     @mcp.tool()
+    @write_tool
     def vind_create_cluster_tool(
         name: str,
         namespace: str = "",
@@ -643,16 +874,13 @@ def register_vind_tools(mcp: FastMCP, non_destructive: bool = False):
             connect: Update kubeconfig after creation
             upgrade: Upgrade existing vCluster instead of failing
         """
-        if non_destructive:
-            return json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
-
-        values_list = [v.strip() for v in set_values.split(",") if v.strip()] if set_values else None
-        return json.dumps(
-            vind_create_cluster(name, namespace, kubernetes_version, values_file, values_list, connect, upgrade),
-            indent=2
+        values_list = _split_set_values(set_values)
+        return _dumps(
+            vind_create_cluster(name, namespace, kubernetes_version, values_file, values_list, connect, upgrade)
         )
 
     @mcp.tool()
+    @write_tool
     def vind_delete_cluster_tool(
         name: str,
         namespace: str = "",
@@ -660,49 +888,44 @@ def register_vind_tools(mcp: FastMCP, non_destructive: bool = False):
         force: bool = False
     ) -> str:
         """Delete a vCluster instance."""
-        if non_destructive:
-            return json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
-        return json.dumps(vind_delete_cluster(name, namespace, delete_namespace, force), indent=2)
+        return _dumps(vind_delete_cluster(name, namespace, delete_namespace, force))
 
     @mcp.tool()
+    @write_tool
     def vind_pause_tool(
         name: str,
         namespace: str = ""
     ) -> str:
         """Pause/sleep a vCluster instance to save resources."""
-        if non_destructive:
-            return json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
-        return json.dumps(vind_pause(name, namespace), indent=2)
+        return _dumps(vind_pause(name, namespace))
 
     @mcp.tool()
+    @write_tool
     def vind_resume_tool(
         name: str,
         namespace: str = ""
     ) -> str:
         """Resume/wake a sleeping vCluster instance."""
-        if non_destructive:
-            return json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
-        return json.dumps(vind_resume(name, namespace), indent=2)
+        return _dumps(vind_resume(name, namespace))
 
     @mcp.tool()
+    @write_tool
     def vind_connect_tool(
         name: str,
         namespace: str = "",
         kube_config: str = ""
     ) -> str:
         """Connect kubectl to a vCluster instance."""
-        if non_destructive:
-            return json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
-        return json.dumps(vind_connect(name, namespace, True, kube_config), indent=2)
+        return _dumps(vind_connect(name, namespace, True, kube_config))
 
     @mcp.tool()
+    @write_tool
     def vind_disconnect_tool() -> str:
         """Disconnect from a vCluster instance."""
-        if non_destructive:
-            return json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
-        return json.dumps(vind_disconnect("", ""), indent=2)
+        return _dumps(vind_disconnect("", ""))
 
     @mcp.tool()
+    @write_tool
     def vind_upgrade_tool(
         name: str,
         namespace: str = "",
@@ -719,11 +942,8 @@ def register_vind_tools(mcp: FastMCP, non_destructive: bool = False):
             values_file: Path to values.yaml file
             set_values: Comma-separated Helm-style value overrides
         """
-        if non_destructive:
-            return json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
-
-        values_list = [v.strip() for v in set_values.split(",") if v.strip()] if set_values else None
-        return json.dumps(vind_upgrade(name, namespace, kubernetes_version, values_file, values_list), indent=2)
+        values_list = _split_set_values(set_values)
+        return _dumps(vind_upgrade(name, namespace, kubernetes_version, values_file, values_list))
 
     @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
     def vind_describe_tool(
@@ -731,14 +951,13 @@ def register_vind_tools(mcp: FastMCP, non_destructive: bool = False):
         namespace: str = ""
     ) -> str:
         """Describe a vCluster instance with detailed information."""
-        return json.dumps(vind_describe(name, namespace), indent=2)
+        return _cached_tool_json(("vind_describe", name, namespace), lambda: vind_describe(name, namespace))
 
     @mcp.tool()
+    @write_tool
     def vind_platform_start_tool(
         host: str = "",
         port: int = 0
     ) -> str:
         """Start the vCluster Platform UI."""
-        if non_destructive:
-            return json.dumps({"success": False, "error": "Operation blocked: non-destructive mode"})
-        return json.dumps(vind_platform_start(host, port), indent=2)
+        return _dumps(vind_platform_start(host, port))
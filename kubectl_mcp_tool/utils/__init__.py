@@ -2,6 +2,7 @@ from .helpers import (
     mask_secrets,
     check_dependencies,
     check_tool_availability,
+    check_tool_on_path,
     check_kubectl_availability,
     check_helm_availability,
     get_logger,
@@ -11,6 +12,7 @@ __all__ = [
     "mask_secrets",
     "check_dependencies",
     "check_tool_availability",
+    "check_tool_on_path",
     "check_kubectl_availability",
     "check_helm_availability",
     "get_logger",
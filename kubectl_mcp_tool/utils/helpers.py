@@ -1,9 +1,12 @@
+import concurrent.futures
+import functools
 import logging
 import os
 import re
 import subprocess
 import shutil
 import sys
+import time
 from typing import List
 
 _log_file = os.environ.get("MCP_LOG_FILE")
@@ -32,17 +35,51 @@ for handler in logging.root.handlers[:]:
 logger = logging.getLogger("mcp-server")
 
 
+@functools.lru_cache(maxsize=32)
 def get_logger(name: str = "mcp-server") -> logging.Logger:
     return logging.getLogger(name)
 
 
+# Only horizontal whitespace before the first newline after "data:"; with \s*
+# there the engine retried every split of a long blank run (quadratic time)
+_MASK_DATA_RE = re.compile(r'(data:[^\S\n]*\n)(\s+\w+:\s*)([A-Za-z0-9+/=]{20,})')
+_MASK_KV_RE = re.compile(r'(password|secret|token|key|credential)(["\s:=]+)([^\s"\n]+)', re.IGNORECASE)
+
+
 def mask_secrets(text: str) -> str:
-    masked = re.sub(r'(data:\s*\n)(\s+\w+:\s*)([A-Za-z0-9+/=]{20,})', r'\1\2[MASKED]', text)
-    masked = re.sub(r'(password|secret|token|key|credential)(["\s:=]+)([^\s"\n]+)', r'\1\2[MASKED]', masked, flags=re.IGNORECASE)
+    masked = _MASK_DATA_RE.sub(r'\1\2[MASKED]', text)
+    masked = _MASK_KV_RE.sub(r'\1\2[MASKED]', masked)
     return masked
 
 
+# Seconds a tool's PATH lookup or version probe result is reused
+TOOL_CHECK_TTL = 30.0
+
+
+def _check_window() -> int:
+    # The window number is part of the cache key, so a result expires when it rolls over
+    return int(time.monotonic() // TOOL_CHECK_TTL)
+
+
+def check_tool_on_path(tool: str) -> bool:
+    return _on_path_in_window(tool, _check_window())
+
+
+@functools.lru_cache(maxsize=16)
+def _on_path_in_window(tool: str, window: int) -> bool:
+    return shutil.which(tool) is not None
+
+
 def check_tool_availability(tool: str) -> bool:
+    return _probe_tool_in_window(tool, _check_window())
+
+
+@functools.lru_cache(maxsize=16)
+def _probe_tool_in_window(tool: str, window: int) -> bool:
+    return _probe_tool(tool)
+
+
+def _probe_tool(tool: str) -> bool:
     try:
         if shutil.which(tool) is None:
             return False
@@ -64,17 +101,25 @@ def check_tool_availability(tool: str) -> bool:
 
 
 def check_kubectl_availability() -> bool:
-    return check_tool_availability("kubectl")
+    return check_tool_on_path("kubectl")
 
 
 def check_helm_availability() -> bool:
-    return check_tool_availability("helm")
+    return check_tool_on_path("helm")
+
 
+def check_dependencies(deep: bool = False) -> bool:
+    tools = ["kubectl", "helm"]
+    if deep:
+        # Each probe may wait on a subprocess, so they run side by side
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            results = list(executor.map(check_tool_availability, tools))
+    else:
+        results = [check_tool_on_path(tool) for tool in tools]
 
-def check_dependencies() -> bool:
     all_available = True
-    for tool in ["kubectl", "helm"]:
-        if not check_tool_availability(tool):
+    for tool, available in zip(tools, results):
+        if not available:
             logger.warning(f"{tool} not found in PATH. Operations requiring {tool} will not work.")
             all_available = False
     return all_available
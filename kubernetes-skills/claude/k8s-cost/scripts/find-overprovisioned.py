@@ -9,8 +9,47 @@ Usage within Claude Code:
 """
 
 import json
+import re
 import sys
-from typing import Any
+from io import StringIO
+from typing import Any, TextIO
+
+# orjson is optional; it serializes large results several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Usage/request ratios outside these bounds are reported
+_CPU_LOW = 0.1
+_CPU_HIGH = 0.8
+_MEMORY_LOW = 0.3
+_MEMORY_HIGH = 0.9
+
+# Quantity number, then an optional unit suffix
+_CPU_RE = re.compile(r'^([0-9.eE+-]+)(m)?$')
+_MEMORY_RE = re.compile(r'^([0-9.eE+-]+?)\s*(Ki|Mi|Gi|Ti|K|M|G|T)?$')
+
+_MEMORY_UNITS = {
+    "Ki": 1024,
+    "Mi": 1024**2,
+    "Gi": 1024**3,
+    "Ti": 1024**4,
+    "K": 1000,
+    "M": 1000**2,
+    "G": 1000**3,
+    "T": 1000**4
+}
+
+
+# (name, tool, description) of each check; only the params depend on the call
+_CHECKS = (
+    ("resource_recommendations", "get_resource_recommendations", "Get VPA-style recommendations"),
+    ("pod_metrics", "get_resource_usage", "Get current resource usage"),
+    ("unused_pvcs", "find_orphaned_pvcs", "Find PVCs not mounted by any pod"),
+    ("unused_resources", "find_unused_resources", "Find unused ConfigMaps/Secrets"),
+    ("namespace_cost", "get_namespace_cost", "Get namespace cost breakdown"),
+)
 
 
 def find_overprovisioned(namespace: str = "", context: str = "") -> dict[str, Any]:
@@ -29,45 +68,17 @@ def find_overprovisioned(namespace: str = "", context: str = "") -> dict[str, An
         "context": context or "current",
         "checks": [],
         "thresholds": {
-            "cpu_underutilized": 0.1,      # <10% usage
-            "memory_underutilized": 0.3,   # <30% usage
-            "cpu_overutilized": 0.8,       # >80% usage
-            "memory_overutilized": 0.9     # >90% usage
+            "cpu_underutilized": _CPU_LOW,        # <10% usage
+            "memory_underutilized": _MEMORY_LOW,  # <30% usage
+            "cpu_overutilized": _CPU_HIGH,        # >80% usage
+            "memory_overutilized": _MEMORY_HIGH   # >90% usage
         }
     }
 
     # Define checks to run with MCP tools
     analysis["checks"] = [
-        {
-            "name": "resource_recommendations",
-            "tool": "get_resource_recommendations",
-            "params": {"namespace": namespace, "context": context},
-            "description": "Get VPA-style recommendations"
-        },
-        {
-            "name": "pod_metrics",
-            "tool": "get_resource_usage",
-            "params": {"namespace": namespace, "context": context},
-            "description": "Get current resource usage"
-        },
-        {
-            "name": "unused_pvcs",
-            "tool": "find_orphaned_pvcs",
-            "params": {"namespace": namespace, "context": context},
-            "description": "Find PVCs not mounted by any pod"
-        },
-        {
-            "name": "unused_resources",
-            "tool": "find_unused_resources",
-            "params": {"namespace": namespace, "context": context},
-            "description": "Find unused ConfigMaps/Secrets"
-        },
-        {
-            "name": "namespace_cost",
-            "tool": "get_namespace_cost",
-            "params": {"namespace": namespace, "context": context},
-            "description": "Get namespace cost breakdown"
-        }
+        {"name": name, "tool": tool, "params": {"namespace": namespace, "context": context}, "description": description}
+        for name, tool, description in _CHECKS
     ]
 
     return analysis
@@ -90,79 +101,133 @@ def analyze_pod_resources(pod: dict, metrics: dict) -> dict[str, Any] | None:
         "containers": []
     }
 
-    has_issues = False
-
+    container_metrics = metrics.get("containers", {})
     for container in pod.get("containers", []):
         container_name = container.get("name")
-        resources = container.get("resources", {})
-        requests = resources.get("requests", {})
+        requests = container.get("resources", {}).get("requests", {})
+        usage = container_metrics.get(container_name, {})
+
+        container_finding = _check_container(
+            container_name,
+            parse_cpu(requests.get("cpu", "0")),
+            usage.get("cpu_cores", 0),
+            parse_memory(requests.get("memory", "0")),
+            usage.get("memory_bytes", 0),
+        )
+        if container_finding is not None:
+            finding["containers"].append(container_finding)
 
-        # Get actual usage from metrics
-        container_metrics = metrics.get("containers", {}).get(container_name, {})
+    return finding if finding["containers"] else None
 
-        cpu_request = parse_cpu(requests.get("cpu", "0"))
-        cpu_usage = container_metrics.get("cpu_cores", 0)
-        memory_request = parse_memory(requests.get("memory", "0"))
-        memory_usage = container_metrics.get("memory_bytes", 0)
 
-        container_finding = {
-            "name": container_name,
-            "issues": [],
-            "recommendations": []
-        }
+def analyze_pods_bulk(pods: list[dict], metrics: list[dict]) -> list[dict[str, Any]]:
+    """
+    Analyze many pods at once.
 
-        # Check CPU
-        if cpu_request > 0 and cpu_usage > 0:
-            cpu_ratio = cpu_usage / cpu_request
-            if cpu_ratio < 0.1:
-                container_finding["issues"].append(
-                    f"CPU severely underutilized: {cpu_ratio*100:.1f}% of request"
-                )
-                container_finding["recommendations"].append(
-                    f"Reduce CPU request from {cpu_request} to {cpu_usage * 2:.3f} cores"
-                )
-                has_issues = True
-            elif cpu_ratio > 0.8:
-                container_finding["issues"].append(
-                    f"CPU highly utilized: {cpu_ratio*100:.1f}% of request"
-                )
-                container_finding["recommendations"].append(
-                    f"Increase CPU request/limit to prevent throttling"
-                )
-                has_issues = True
-
-        # Check Memory
-        if memory_request > 0 and memory_usage > 0:
-            memory_ratio = memory_usage / memory_request
-            if memory_ratio < 0.3:
-                container_finding["issues"].append(
-                    f"Memory underutilized: {memory_ratio*100:.1f}% of request"
-                )
-                container_finding["recommendations"].append(
-                    f"Reduce memory request"
-                )
-                has_issues = True
-            elif memory_ratio > 0.9:
-                container_finding["issues"].append(
-                    f"Memory near limit: {memory_ratio*100:.1f}% of request"
-                )
-                container_finding["recommendations"].append(
-                    f"Increase memory limit to prevent OOMKill"
-                )
-                has_issues = True
-
-        if container_finding["issues"]:
-            finding["containers"].append(container_finding)
+    Same findings as calling analyze_pod_resources per pod, but every
+    container's numbers are gathered into flat columns first and finding
+    dicts are only built for the flagged rows. Request strings repeat
+    across replicas, so each distinct one is parsed once.
+
+    Args:
+        pods: Pod specs with resources
+        metrics: Metrics for each pod, in the same order as pods
+
+    Returns:
+        Findings for pods with optimization opportunities
+    """
+    cpu_cache: dict[str, float] = {}
+    memory_cache: dict[str, int] = {}
+
+    rows = []
+    cpu_req, cpu_use, mem_req, mem_use = [], [], [], []
+    for pod_index, (pod, pod_metrics) in enumerate(zip(pods, metrics)):
+        container_metrics = pod_metrics.get("containers", {})
+        for container in pod.get("containers", []):
+            container_name = container.get("name")
+            requests = container.get("resources", {}).get("requests", {})
+            usage = container_metrics.get(container_name, {})
+
+            cpu = requests.get("cpu", "0")
+            if cpu not in cpu_cache:
+                cpu_cache[cpu] = parse_cpu(cpu)
+            memory = requests.get("memory", "0")
+            if memory not in memory_cache:
+                memory_cache[memory] = parse_memory(memory)
+
+            rows.append((pod_index, container_name))
+            cpu_req.append(cpu_cache[cpu])
+            cpu_use.append(usage.get("cpu_cores", 0))
+            mem_req.append(memory_cache[memory])
+            mem_use.append(usage.get("memory_bytes", 0))
+
+    flagged = [
+        i for i, (cr, cu, mr, mu) in enumerate(zip(cpu_req, cpu_use, mem_req, mem_use))
+        if (cr > 0 and cu > 0 and not _CPU_LOW <= cu / cr <= _CPU_HIGH)
+        or (mr > 0 and mu > 0 and not _MEMORY_LOW <= mu / mr <= _MEMORY_HIGH)
+    ]
 
-    return finding if has_issues else None
+    findings: dict[int, dict[str, Any]] = {}
+    for i in flagged:
+        pod_index, container_name = rows[i]
+        finding = findings.get(pod_index)
+        if finding is None:
+            pod = pods[pod_index]
+            finding = findings[pod_index] = {
+                "pod": pod.get("name"),
+                "namespace": pod.get("namespace"),
+                "containers": []
+            }
+        finding["containers"].append(
+            _check_container(container_name, cpu_req[i], cpu_use[i], mem_req[i], mem_use[i])
+        )
+
+    return list(findings.values())
+
+
+def _check_container(
+    name: str,
+    cpu_request: float,
+    cpu_usage: float,
+    memory_request: int,
+    memory_usage: int
+) -> dict[str, Any] | None:
+    """Compare one container's usage with its requests; None if it looks right-sized."""
+    issues = []
+    recommendations = []
+
+    # Check CPU
+    if cpu_request > 0 and cpu_usage > 0:
+        cpu_ratio = cpu_usage / cpu_request
+        if cpu_ratio < _CPU_LOW:
+            issues.append(f"CPU severely underutilized: {cpu_ratio*100:.1f}% of request")
+            recommendations.append(f"Reduce CPU request from {cpu_request} to {cpu_usage * 2:.3f} cores")
+        elif cpu_ratio > _CPU_HIGH:
+            issues.append(f"CPU highly utilized: {cpu_ratio*100:.1f}% of request")
+            recommendations.append("Increase CPU request/limit to prevent throttling")
+
+    # Check Memory
+    if memory_request > 0 and memory_usage > 0:
+        memory_ratio = memory_usage / memory_request
+        if memory_ratio < _MEMORY_LOW:
+            issues.append(f"Memory underutilized: {memory_ratio*100:.1f}% of request")
+            recommendations.append("Reduce memory request")
+        elif memory_ratio > _MEMORY_HIGH:
+            issues.append(f"Memory near limit: {memory_ratio*100:.1f}% of request")
+            recommendations.append("Increase memory limit to prevent OOMKill")
+
+    if not issues:
+        return None
+    return {"name": name, "issues": issues, "recommendations": recommendations}
 
 
 def parse_cpu(cpu_str: str) -> float:
     """Parse CPU string to cores."""
     if not cpu_str:
         return 0
-    if cpu_str.endswith("m"):
-        return float(cpu_str[:-1]) / 1000
+    match = _CPU_RE.match(cpu_str)
+    if match is not None and match[2]:
+        return float(match[1]) / 1000
     return float(cpu_str)
 
 
@@ -171,22 +236,11 @@ def parse_memory(memory_str: str) -> int:
     if not memory_str:
         return 0
 
-    units = {
-        "Ki": 1024,
-        "Mi": 1024**2,
-        "Gi": 1024**3,
-        "Ti": 1024**4,
-        "K": 1000,
-        "M": 1000**2,
-        "G": 1000**3,
-        "T": 1000**4
-    }
-
-    for suffix, multiplier in units.items():
-        if memory_str.endswith(suffix):
-            return int(float(memory_str[:-len(suffix)]) * multiplier)
-
-    return int(memory_str)
+    match = _MEMORY_RE.match(memory_str)
+    if match is None or match[2] is None:
+        # Plain byte counts stay exact; anything else raises as before
+        return int(memory_str)
+    return int(float(match[1]) * _MEMORY_UNITS[match[2]])
 
 
 def calculate_savings(findings: list[dict[str, Any]]) -> dict[str, Any]:
@@ -230,38 +284,55 @@ def calculate_savings(findings: list[dict[str, Any]]) -> dict[str, Any]:
     return savings
 
 
-def generate_report(analysis: dict[str, Any], findings: list[dict[str, Any]]) -> str:
+def generate_report(
+    analysis: dict[str, Any],
+    findings: list[dict[str, Any]],
+    out: TextIO | None = None
+) -> str | None:
     """
     Generate cost optimization report.
 
     Args:
         analysis: Analysis configuration
         findings: List of findings
+        out: Stream to write the report to as it is built
 
     Returns:
-        Formatted report
+        Formatted report, or None when it was written to out
     """
-    report = ["# Kubernetes Cost Optimization Report\n"]
-    report.append(f"Namespace: {analysis['namespace']}")
-    report.append(f"Context: {analysis['context']}\n")
+    buf = StringIO() if out is None else out
+    w = buf.write
+    w("# Kubernetes Cost Optimization Report\n\n")
+    w(f"Namespace: {analysis['namespace']}\n")
+    w(f"Context: {analysis['context']}\n\n")
 
     if not findings:
-        report.append("No optimization opportunities found.")
-        return "\n".join(report)
+        w("No optimization opportunities found.")
+        return buf.getvalue() if out is None else None
 
-    report.append(f"## Found {len(findings)} pods with optimization opportunities\n")
+    w(f"## Found {len(findings)} pods with optimization opportunities\n\n")
 
-    for finding in findings:
-        report.append(f"### Pod: {finding['namespace']}/{finding['pod']}")
+    for i, finding in enumerate(findings):
+        if i:
+            w("\n")
+        w(f"### Pod: {finding['namespace']}/{finding['pod']}\n")
         for container in finding.get("containers", []):
-            report.append(f"  Container: {container['name']}")
+            w(f"  Container: {container['name']}\n")
             for issue in container.get("issues", []):
-                report.append(f"    - Issue: {issue}")
+                w(f"    - Issue: {issue}\n")
             for rec in container.get("recommendations", []):
-                report.append(f"    - Action: {rec}")
-        report.append("")
+                w(f"    - Action: {rec}\n")
+
+    return buf.getvalue() if out is None else None
+
 
-    return "\n".join(report)
+def write_json(result: dict[str, Any], out: TextIO) -> None:
+    """Write result to out as indented JSON followed by a newline."""
+    if orjson is not None:
+        out.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE).decode())
+        return
+    json.dump(result, out, indent=2)
+    out.write("\n")
 
 
 if __name__ == "__main__":
@@ -269,4 +340,4 @@ if __name__ == "__main__":
     context = sys.argv[2] if len(sys.argv) > 2 else ""
 
     result = find_overprovisioned(namespace, context)
-    print(json.dumps(result, indent=2))
+    write_json(result, sys.stdout)
@@ -11,7 +11,64 @@ Usage within Claude Code:
 import json
 import sys
 from datetime import datetime
-from typing import Any
+from io import StringIO
+from typing import Any, TextIO
+
+# orjson is optional; it serializes large results several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Static parts of each check as (name, tool, description); params are built per call
+_CLUSTER_HEALTH_CHECKS = (
+    ("nodes", "get_nodes", "List all nodes and their status"),
+    ("system_pods", "get_pods", "Check control plane pods"),
+)
+_NAMESPACE_RESOURCE_CHECKS = (
+    ("pods", "get_pods", "List all pods"),
+    ("deployments", "get_deployments", "List deployments"),
+    ("services", "get_services", "List services"),
+    ("endpoints", "get_endpoints", "Check service backends"),
+    ("events", "get_events", "Recent events"),
+)
+_LOG_CHECKS = (
+    ("pod_logs", "get_pod_logs", "Get logs from each failing pod"),
+)
+
+# (category, priority, checks) planned for every run, after the namespace-specific ones
+_NAMESPACED_CATEGORIES = (
+    ("networking", 4, (
+        ("network_policies", "get_network_policies", "Check network policies"),
+        ("ingresses", "get_ingresses", "Check ingress configuration"),
+    )),
+    ("storage", 5, (
+        ("pvcs", "get_pvc", "Check PVC status"),
+    )),
+    ("resources", 6, (
+        ("resource_usage", "get_resource_usage", "Check resource consumption"),
+    )),
+)
+
+
+# Pod statuses that triage does not treat as failing
+_POD_OK_STATUSES = frozenset(("Running", "Completed"))
+
+
+def _checks(templates: tuple, params: tuple) -> list[dict[str, Any]]:
+    """Pair check templates with their per-call params."""
+    return [
+        {"name": name, "tool": tool, "params": check_params, "description": description}
+        for (name, tool, description), check_params in zip(templates, params)
+    ]
+
+
+def _namespaced_checks(templates: tuple, namespace: str, context: str) -> list[dict[str, Any]]:
+    return [
+        {"name": name, "tool": tool, "params": {"namespace": namespace, "context": context}, "description": description}
+        for name, tool, description in templates
+    ]
 
 
 def collect_diagnostics(
@@ -41,135 +98,40 @@ def collect_diagnostics(
     }
 
     # Cluster health
-    diagnostics["collection_plan"].extend([
-        {
-            "category": "cluster_health",
-            "priority": 1,
-            "checks": [
-                {
-                    "name": "nodes",
-                    "tool": "get_nodes",
-                    "params": {"context": context},
-                    "description": "List all nodes and their status"
-                },
-                {
-                    "name": "system_pods",
-                    "tool": "get_pods",
-                    "params": {"namespace": "kube-system", "context": context},
-                    "description": "Check control plane pods"
-                }
-            ]
-        }
-    ])
+    diagnostics["collection_plan"].append({
+        "category": "cluster_health",
+        "priority": 1,
+        "checks": _checks(_CLUSTER_HEALTH_CHECKS, ({"context": context}, {"namespace": "kube-system", "context": context}))
+    })
 
     # Namespace-specific if provided
     if namespace:
-        diagnostics["collection_plan"].extend([
-            {
-                "category": "namespace_resources",
-                "priority": 2,
-                "checks": [
-                    {
-                        "name": "pods",
-                        "tool": "get_pods",
-                        "params": {"namespace": namespace, "context": context},
-                        "description": "List all pods"
-                    },
-                    {
-                        "name": "deployments",
-                        "tool": "get_deployments",
-                        "params": {"namespace": namespace, "context": context},
-                        "description": "List deployments"
-                    },
-                    {
-                        "name": "services",
-                        "tool": "get_services",
-                        "params": {"namespace": namespace, "context": context},
-                        "description": "List services"
-                    },
-                    {
-                        "name": "endpoints",
-                        "tool": "get_endpoints",
-                        "params": {"namespace": namespace, "context": context},
-                        "description": "Check service backends"
-                    },
-                    {
-                        "name": "events",
-                        "tool": "get_events",
-                        "params": {"namespace": namespace, "context": context},
-                        "description": "Recent events"
-                    }
-                ]
-            }
-        ])
+        diagnostics["collection_plan"].append({
+            "category": "namespace_resources",
+            "priority": 2,
+            "checks": _namespaced_checks(_NAMESPACE_RESOURCE_CHECKS, namespace, context)
+        })
 
         if include_logs:
             diagnostics["collection_plan"].append({
                 "category": "logs",
                 "priority": 3,
                 "note": "Collect logs from failing pods",
-                "checks": [
-                    {
-                        "name": "pod_logs",
-                        "tool": "get_pod_logs",
-                        "params": {
-                            "namespace": namespace,
-                            "tail_lines": 100,
-                            "previous": True,
-                            "context": context
-                        },
-                        "description": "Get logs from each failing pod"
-                    }
-                ]
+                "checks": _checks(_LOG_CHECKS, ({
+                    "namespace": namespace,
+                    "tail_lines": 100,
+                    "previous": True,
+                    "context": context
+                },))
             })
 
-    # Network diagnostics
-    diagnostics["collection_plan"].append({
-        "category": "networking",
-        "priority": 4,
-        "checks": [
-            {
-                "name": "network_policies",
-                "tool": "get_network_policies",
-                "params": {"namespace": namespace, "context": context},
-                "description": "Check network policies"
-            },
-            {
-                "name": "ingresses",
-                "tool": "get_ingresses",
-                "params": {"namespace": namespace, "context": context},
-                "description": "Check ingress configuration"
-            }
-        ]
-    })
-
-    # Storage diagnostics
-    diagnostics["collection_plan"].append({
-        "category": "storage",
-        "priority": 5,
-        "checks": [
-            {
-                "name": "pvcs",
-                "tool": "get_pvc",
-                "params": {"namespace": namespace, "context": context},
-                "description": "Check PVC status"
-            }
-        ]
-    })
-
-    # Resource usage
-    diagnostics["collection_plan"].append({
-        "category": "resources",
-        "priority": 6,
-        "checks": [
-            {
-                "name": "resource_usage",
-                "tool": "get_resource_usage",
-                "params": {"namespace": namespace, "context": context},
-                "description": "Check resource consumption"
-            }
-        ]
-    })
+    # Network, storage and resource usage diagnostics
+    for category, priority, checks in _NAMESPACED_CATEGORIES:
+        diagnostics["collection_plan"].append({
+            "category": category,
+            "priority": priority,
+            "checks": _namespaced_checks(checks, namespace, context)
+        })
 
     return diagnostics
 
@@ -204,7 +166,7 @@ def triage_findings(findings: dict[str, Any]) -> dict[str, Any]:
 
     # Critical: System pods failing
     system_pods = findings.get("system_pods", [])
-    failing_system = [p for p in system_pods if p.get("status") not in ["Running", "Completed"]]
+    failing_system = [p for p in system_pods if p.get("status") not in _POD_OK_STATUSES]
     if failing_system:
         triage["critical"].append({
             "type": "system_pods_failing",
@@ -215,7 +177,7 @@ def triage_findings(findings: dict[str, Any]) -> dict[str, Any]:
 
     # Warning: Application pods failing
     pods = findings.get("pods", [])
-    failing_pods = [p for p in pods if p.get("status") not in ["Running", "Completed"]]
+    failing_pods = [p for p in pods if p.get("status") not in _POD_OK_STATUSES]
     if failing_pods:
         triage["warning"].append({
             "type": "pods_failing",
@@ -250,48 +212,60 @@ def triage_findings(findings: dict[str, Any]) -> dict[str, Any]:
 
 def generate_incident_report(
     diagnostics: dict[str, Any],
-    triage: dict[str, Any]
-) -> str:
+    triage: dict[str, Any],
+    out: TextIO | None = None
+) -> str | None:
     """
     Generate incident report.
 
     Args:
         diagnostics: Collected diagnostics
         triage: Triaged findings
+        out: Stream to write the report to as it is built
 
     Returns:
-        Formatted incident report
+        Formatted incident report, or None when it was written to out
     """
-    report = ["# Kubernetes Incident Diagnostic Report\n"]
-    report.append(f"Timestamp: {diagnostics['timestamp']}")
-    report.append(f"Context: {diagnostics['context']}")
-    report.append(f"Namespace: {diagnostics['namespace']}\n")
+    buf = StringIO() if out is None else out
+    w = buf.write
+    w("# Kubernetes Incident Diagnostic Report\n\n")
+    w(f"Timestamp: {diagnostics['timestamp']}\n")
+    w(f"Context: {diagnostics['context']}\n")
+    w(f"Namespace: {diagnostics['namespace']}\n\n")
 
-    report.append(f"## Summary\n{triage['summary']}\n")
+    w(f"## Summary\n{triage['summary']}\n\n")
 
     if triage["critical"]:
-        report.append("## Critical Issues\n")
+        w("## Critical Issues\n\n")
         for issue in triage["critical"]:
-            report.append(f"### {issue['type']}")
-            report.append(f"- Count: {issue.get('count', 'N/A')}")
-            report.append(f"- Action: {issue['action']}\n")
+            w(f"### {issue['type']}\n")
+            w(f"- Count: {issue.get('count', 'N/A')}\n")
+            w(f"- Action: {issue['action']}\n\n")
 
     if triage["warning"]:
-        report.append("## Warnings\n")
+        w("## Warnings\n\n")
         for issue in triage["warning"]:
-            report.append(f"### {issue['type']}")
-            report.append(f"- Action: {issue['action']}\n")
+            w(f"### {issue['type']}\n")
+            w(f"- Action: {issue['action']}\n\n")
 
-    report.append("## Collection Plan\n")
-    report.append("Execute the following MCP tools to gather data:\n")
+    w("## Collection Plan\n\n")
+    w("Execute the following MCP tools to gather data:\n")
 
     for category in sorted(diagnostics["collection_plan"], key=lambda x: x["priority"]):
-        report.append(f"### {category['category'].replace('_', ' ').title()}")
+        w(f"\n### {category['category'].replace('_', ' ').title()}\n")
         for check in category["checks"]:
-            report.append(f"- `{check['tool']}`: {check['description']}")
-        report.append("")
+            w(f"- `{check['tool']}`: {check['description']}\n")
+
+    return buf.getvalue() if out is None else None
+
 
-    return "\n".join(report)
+def write_json(result: dict[str, Any], out: TextIO) -> None:
+    """Write result to out as indented JSON followed by a newline."""
+    if orjson is not None:
+        out.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE).decode())
+        return
+    json.dump(result, out, indent=2)
+    out.write("\n")
 
 
 if __name__ == "__main__":
@@ -299,4 +273,4 @@ if __name__ == "__main__":
     context = sys.argv[2] if len(sys.argv) > 2 else ""
 
     result = collect_diagnostics(namespace, context)
-    print(json.dumps(result, indent=2))
+    write_json(result, sys.stdout)
@@ -8,9 +8,26 @@ Usage within Claude Code:
     RBAC configuration and find potential security issues.
 """
 
+import copy
 import json
 import sys
-from typing import Any
+import threading
+from collections import defaultdict
+from typing import Any, TextIO
+
+# orjson is optional; it serializes large results several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Report order of finding severities
+_SEVERITIES = ("critical", "high", "medium", "low")
+
+# (role name, resourceVersion) -> findings; many bindings point at the same few
+# roles. audit_rbac() clears it, so results are only reused within one audit
+_ROLE_CACHE: dict[tuple[str, str], list[dict[str, Any]]] = {}
+_ROLE_CACHE_LOCK = threading.Lock()
 
 
 def audit_rbac(context: str = "") -> dict[str, Any]:
@@ -23,6 +40,8 @@ def audit_rbac(context: str = "") -> dict[str, Any]:
     Returns:
         Dictionary with audit findings
     """
+    clear_role_cache()
+
     audit = {
         "context": context or "current",
         "critical": [],
@@ -110,12 +129,40 @@ def analyze_cluster_role(role: dict) -> list[dict[str, Any]]:
     """
     Analyze a ClusterRole for security issues.
 
+    Findings are memoized by name and resourceVersion until the next
+    audit_rbac() or clear_role_cache() call.
+
     Args:
         role: ClusterRole data
 
     Returns:
         List of findings
     """
+    metadata = role.get("metadata", {})
+    resource_version = metadata.get("resourceVersion")
+    if not resource_version:
+        # Without a version the same name may carry different rules
+        return _scan_role_rules(role)
+
+    key = (metadata.get("name", "unknown"), resource_version)
+    with _ROLE_CACHE_LOCK:
+        cached = _ROLE_CACHE.get(key)
+    if cached is None:
+        # Detached from role, whose rule dicts the findings would otherwise share
+        cached = copy.deepcopy(_scan_role_rules(role))
+        with _ROLE_CACHE_LOCK:
+            _ROLE_CACHE[key] = cached
+    # Deep copies: findings hold the role's rule dict, which callers may edit
+    return copy.deepcopy(cached)
+
+
+def clear_role_cache() -> None:
+    """Forget analyzed roles, e.g. before auditing another cluster."""
+    with _ROLE_CACHE_LOCK:
+        _ROLE_CACHE.clear()
+
+
+def _scan_role_rules(role: dict) -> list[dict[str, Any]]:
     findings = []
     rules = role.get("rules", [])
     role_name = role.get("metadata", {}).get("name", "unknown")
@@ -179,34 +226,43 @@ def generate_report(findings: list[dict[str, Any]]) -> str:
         Formatted report string
     """
     report = ["# RBAC Security Audit Report\n"]
+    append = report.append
 
-    by_severity = {
-        "critical": [],
-        "high": [],
-        "medium": [],
-        "low": []
-    }
-
+    by_severity = defaultdict(list)
+    total = 0
     for finding in findings:
         severity = finding.get("severity", "low")
+        # Unrecognized severities are reported with the low ones, not dropped
+        if severity not in _SEVERITIES:
+            severity = "low"
         by_severity[severity].append(finding)
+        total += 1
 
-    for severity in ["critical", "high", "medium", "low"]:
-        items = by_severity[severity]
+    for severity in _SEVERITIES:
+        items = by_severity.get(severity)
         if items:
-            report.append(f"\n## {severity.upper()} ({len(items)} findings)\n")
+            append(f"\n## {severity.upper()} ({len(items)} findings)\n")
             for item in items:
-                report.append(f"- **{item['type']}**: {item.get('role', item.get('binding', 'N/A'))}")
-                report.append(f"  - Recommendation: {item['recommendation']}")
+                append(f"- **{item['type']}**: {item.get('role', item.get('binding', 'N/A'))}")
+                append(f"  - Recommendation: {item['recommendation']}")
 
-    if not any(by_severity.values()):
-        report.append("\nNo security issues found.")
+    if not total:
+        append("\nNo security issues found.")
 
     return "\n".join(report)
 
 
+def write_json(result: dict[str, Any], out: TextIO) -> None:
+    """Write result to out as indented JSON followed by a newline."""
+    if orjson is not None:
+        out.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE).decode())
+        return
+    json.dump(result, out, indent=2)
+    out.write("\n")
+
+
 if __name__ == "__main__":
     context = sys.argv[1] if len(sys.argv) > 1 else ""
 
     result = audit_rbac(context)
-    print(json.dumps(result, indent=2))
+    write_json(result, sys.stdout)
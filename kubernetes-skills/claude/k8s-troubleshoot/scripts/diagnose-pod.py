@@ -10,7 +10,23 @@ Usage within Claude Code:
 
 import json
 import sys
-from typing import Any
+from typing import Any, TextIO
+
+# orjson is optional; it serializes large results several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# (name, tool, description) of each check, in the order of the params built per call
+_CHECKS = (
+    ("pod_status", "get_pods", "Get pod status and phase"),
+    ("pod_details", "describe_pod", "Get detailed pod description"),
+    ("pod_logs", "get_pod_logs", "Get logs (including previous container)"),
+    ("pod_events", "get_events", "Get events related to this pod"),
+    ("pod_metrics", "get_pod_metrics", "Get resource usage metrics"),
+)
 
 
 def diagnose_pod(name: str, namespace: str, context: str = "") -> dict[str, Any]:
@@ -37,42 +53,82 @@ def diagnose_pod(name: str, namespace: str, context: str = "") -> dict[str, Any]
     # Note: In actual usage, Claude will call the MCP tools directly.
     # This script structure shows what diagnostics to collect.
 
+    params = (
+        {"namespace": namespace, "context": context},
+        {"name": name, "namespace": namespace, "context": context},
+        {"name": name, "namespace": namespace, "previous": True, "context": context},
+        {"namespace": namespace, "field_selector": f"involvedObject.name={name}", "context": context},
+        {"name": name, "namespace": namespace, "context": context},
+    )
     diagnostics["checks"] = [
-        {
-            "name": "pod_status",
-            "tool": "get_pods",
-            "params": {"namespace": namespace, "context": context},
-            "description": "Get pod status and phase"
-        },
-        {
-            "name": "pod_details",
-            "tool": "describe_pod",
-            "params": {"name": name, "namespace": namespace, "context": context},
-            "description": "Get detailed pod description"
-        },
-        {
-            "name": "pod_logs",
-            "tool": "get_pod_logs",
-            "params": {"name": name, "namespace": namespace, "previous": True, "context": context},
-            "description": "Get logs (including previous container)"
-        },
-        {
-            "name": "pod_events",
-            "tool": "get_events",
-            "params": {"namespace": namespace, "field_selector": f"involvedObject.name={name}", "context": context},
-            "description": "Get events related to this pod"
-        },
-        {
-            "name": "pod_metrics",
-            "tool": "get_pod_metrics",
-            "params": {"name": name, "namespace": namespace, "context": context},
-            "description": "Get resource usage metrics"
-        }
+        {"name": check, "tool": tool, "params": check_params, "description": description}
+        for (check, tool, description), check_params in zip(_CHECKS, params)
     ]
 
     return diagnostics
 
 
+# Known pod states, matched case-insensitively against the status text
+_STATE_PATTERNS = {
+    "CrashLoopBackOff": {
+        "issue": "Container is crashing repeatedly",
+        "checks": [
+            "Check logs with get_pod_logs(previous=True)",
+            "Check exit code in describe output",
+            "Verify resource limits aren't too restrictive"
+        ],
+        "common_causes": [
+            "Application error - check logs",
+            "OOMKilled - increase memory limit",
+            "Missing dependencies - check init containers"
+        ]
+    },
+    "ImagePullBackOff": {
+        "issue": "Cannot pull container image",
+        "checks": [
+            "Verify image name and tag",
+            "Check imagePullSecrets",
+            "Test registry accessibility"
+        ],
+        "common_causes": [
+            "Wrong image name or tag",
+            "Private registry without credentials",
+            "Registry rate limiting"
+        ]
+    },
+    "Pending": {
+        "issue": "Pod cannot be scheduled",
+        "checks": [
+            "Check node resources",
+            "Verify node selectors",
+            "Check for taints/tolerations"
+        ],
+        "common_causes": [
+            "Insufficient CPU/memory on nodes",
+            "No nodes match selectors",
+            "PVC not bound"
+        ]
+    },
+    "ContainerCreating": {
+        "issue": "Container stuck creating",
+        "checks": [
+            "Check events for mount errors",
+            "Verify PVCs are bound",
+            "Check image pull status"
+        ],
+        "common_causes": [
+            "Volume mount failure",
+            "Slow image pull",
+            "Network plugin issue"
+        ]
+    }
+}
+
+# Lower-cased keys; no pattern is a substring of another, so an exact hit is
+# also the first substring hit
+_STATE_PATTERNS_LC = {pattern.lower(): info for pattern, info in _STATE_PATTERNS.items()}
+
+
 def analyze_pod_state(status: str) -> dict[str, Any]:
     """
     Analyze pod state and provide recommendations.
@@ -88,72 +144,28 @@ def analyze_pod_state(status: str) -> dict[str, Any]:
         "recommendations": []
     }
 
-    # Common patterns
-    patterns = {
-        "CrashLoopBackOff": {
-            "issue": "Container is crashing repeatedly",
-            "checks": [
-                "Check logs with get_pod_logs(previous=True)",
-                "Check exit code in describe output",
-                "Verify resource limits aren't too restrictive"
-            ],
-            "common_causes": [
-                "Application error - check logs",
-                "OOMKilled - increase memory limit",
-                "Missing dependencies - check init containers"
-            ]
-        },
-        "ImagePullBackOff": {
-            "issue": "Cannot pull container image",
-            "checks": [
-                "Verify image name and tag",
-                "Check imagePullSecrets",
-                "Test registry accessibility"
-            ],
-            "common_causes": [
-                "Wrong image name or tag",
-                "Private registry without credentials",
-                "Registry rate limiting"
-            ]
-        },
-        "Pending": {
-            "issue": "Pod cannot be scheduled",
-            "checks": [
-                "Check node resources",
-                "Verify node selectors",
-                "Check for taints/tolerations"
-            ],
-            "common_causes": [
-                "Insufficient CPU/memory on nodes",
-                "No nodes match selectors",
-                "PVC not bound"
-            ]
-        },
-        "ContainerCreating": {
-            "issue": "Container stuck creating",
-            "checks": [
-                "Check events for mount errors",
-                "Verify PVCs are bound",
-                "Check image pull status"
-            ],
-            "common_causes": [
-                "Volume mount failure",
-                "Slow image pull",
-                "Network plugin issue"
-            ]
-        }
-    }
+    status_lc = status.lower()
+    info = _STATE_PATTERNS_LC.get(status_lc)
+    if info is None:
+        info = next((known for pattern, known in _STATE_PATTERNS_LC.items() if pattern in status_lc), None)
 
-    for pattern, info in patterns.items():
-        if pattern.lower() in status.lower():
-            analysis["issues"].append(info["issue"])
-            analysis["recommendations"].extend(info["checks"])
-            analysis["common_causes"] = info["common_causes"]
-            break
+    if info is not None:
+        analysis["issues"].append(info["issue"])
+        analysis["recommendations"].extend(info["checks"])
+        analysis["common_causes"] = list(info["common_causes"])
 
     return analysis
 
 
+def write_json(result: dict[str, Any], out: TextIO) -> None:
+    """Write result to out as indented JSON followed by a newline."""
+    if orjson is not None:
+        out.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE).decode())
+        return
+    json.dump(result, out, indent=2)
+    out.write("\n")
+
+
 if __name__ == "__main__":
     if len(sys.argv) < 3:
         print("Usage: diagnose-pod.py <pod-name> <namespace> [context]")
@@ -164,4 +176,4 @@ if __name__ == "__main__":
     context = sys.argv[3] if len(sys.argv) > 3 else ""
 
     result = diagnose_pod(pod_name, namespace, context)
-    print(json.dumps(result, indent=2))
+    write_json(result, sys.stdout)
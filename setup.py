@@ -47,7 +47,9 @@ setup(
     ],
     extras_require={
         "ui": ["mcp-ui-server>=0.5.0"],  # Optional: MCP-UI interactive dashboards
-        "all": ["mcp-ui-server>=0.5.0"],
+        "perf": ["ijson>=3.2", "markupsafe>=2.0", "orjson>=3.9"],  # Optional: streaming JSON parsing, fast escaping and encoding
+        "screenshots": ["playwright>=1.40"],  # Optional: in-process UI screenshots
+        "all": ["mcp-ui-server>=0.5.0", "ijson>=3.2", "markupsafe>=2.0", "orjson>=3.9", "playwright>=1.40"],
     },
     entry_points={
         "console_scripts": [
@@ -10,6 +10,18 @@ from typing import Dict, Any, List
 from datetime import datetime
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Keep cached API list results and screenshots from leaking between tests."""
+    from kubectl_mcp_tool.tools.ui import _screenshot_cache
+    from kubectl_mcp_tool.tools.utils import list_cache
+    list_cache.invalidate()
+    _screenshot_cache.clear()
+    yield
+    list_cache.invalidate()
+    _screenshot_cache.clear()
+
+
 @pytest.fixture
 def mock_kube_config():
     """Mock kubernetes config loading."""
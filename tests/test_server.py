@@ -73,6 +73,63 @@ class TestServerInitialization:
         assert hasattr(server, 'server')
         assert server.server is not None
 
+    @pytest.mark.unit
+    def test_serialize_tool_result(self):
+        """Test that tool results serialize to JSON with or without orjson."""
+        import json
+        from kubectl_mcp_tool import mcp_server
+
+        result = {"success": True, "items": [{"name": "a", 1: "b"}]}
+        assert json.loads(mcp_server._serialize_tool_result(result)) == {
+            "success": True, "items": [{"name": "a", "1": "b"}]
+        }
+        with patch.object(mcp_server, "orjson", None):
+            assert json.loads(mcp_server._serialize_tool_result(result))["success"] is True
+
+    @pytest.mark.unit
+    def test_fastmcp_without_tool_serializer_falls_back(self):
+        """Test that a FastMCP rejecting tool_serializer still builds the server."""
+        from kubectl_mcp_tool import mcp_server
+
+        real_fastmcp = mcp_server.FastMCP
+
+        def fastmcp(**kwargs):
+            if "tool_serializer" in kwargs:
+                raise TypeError("unexpected keyword argument 'tool_serializer'")
+            return real_fastmcp(**kwargs)
+
+        with patch("kubectl_mcp_tool.mcp_server.MCPServer._check_dependencies", return_value=True), \
+                patch("kubernetes.config.load_kube_config"), \
+                patch.object(mcp_server, "orjson", MagicMock()), \
+                patch.object(mcp_server, "FastMCP", side_effect=fastmcp) as factory:
+            server = mcp_server.MCPServer(name="test")
+
+        assert server.server is not None
+        assert "tool_serializer" not in factory.call_args.kwargs
+
+    @pytest.mark.unit
+    def test_only_serializer_deprecations_are_silenced(self):
+        """Test that construction hides FastMCP's serializer notices but not other warnings."""
+        import warnings
+        from kubectl_mcp_tool import mcp_server
+
+        real_fastmcp = mcp_server.FastMCP
+
+        def fastmcp(**kwargs):
+            warnings.warn("some other deprecation", DeprecationWarning)
+            return real_fastmcp(**kwargs)
+
+        with patch("kubectl_mcp_tool.mcp_server.MCPServer._check_dependencies", return_value=True), \
+                patch("kubernetes.config.load_kube_config"), \
+                patch.object(mcp_server, "FastMCP", side_effect=fastmcp), \
+                warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            mcp_server.MCPServer(name="test")
+
+        messages = [str(w.message) for w in caught if issubclass(w.category, DeprecationWarning)]
+        assert "some other deprecation" in messages
+        assert not [m for m in messages if "serializer` parameter is deprecated" in m]
+
 
 class TestToolRegistration:
     """Tests for tool registration."""
@@ -287,6 +344,83 @@ class TestSecretMasking:
         masked = server._mask_secrets(text)
         assert "[MASKED]" in masked
 
+    @pytest.mark.unit
+    def test_masking_long_blank_runs_is_linear(self):
+        """Test that a long run of blank lines after data: does not backtrack quadratically."""
+        import time
+        from kubectl_mcp_tool.mcp_server import MCPServer
+        from kubectl_mcp_tool.utils import mask_secrets
+
+        with patch("kubectl_mcp_tool.mcp_server.MCPServer._check_dependencies", return_value=True):
+            with patch("kubernetes.config.load_kube_config"):
+                server = MCPServer(name="test")
+
+        text = "data:" + "\n" * 50000 + "x"
+        start = time.perf_counter()
+        assert server._mask_secrets(text) == text
+        assert mask_secrets(text) == text
+        assert time.perf_counter() - start < 1.0
+
+    @pytest.mark.unit
+    def test_check_dependencies_reuses_recent_results(self):
+        """Test that dependency checks are cached for the TTL window."""
+        from kubectl_mcp_tool.utils import helpers
+
+        helpers._probe_tool_in_window.cache_clear()
+        try:
+            with patch.object(helpers, "_probe_tool", return_value=True) as probe:
+                assert helpers.check_dependencies(deep=True) is True
+                assert helpers.check_dependencies(deep=True) is True
+                assert helpers.check_tool_availability("kubectl") is True
+                assert sorted(c.args[0] for c in probe.call_args_list) == ["helm", "kubectl"]
+
+                with patch.object(helpers.time, "monotonic", return_value=helpers.time.monotonic() + helpers.TOOL_CHECK_TTL):
+                    helpers.check_tool_availability("kubectl")
+                assert probe.call_count == 3
+        finally:
+            helpers._probe_tool_in_window.cache_clear()
+
+    @pytest.mark.unit
+    def test_get_logger_returns_same_logger(self):
+        """Test that get_logger hands back the named logging logger."""
+        import logging
+        from kubectl_mcp_tool.utils import get_logger
+
+        assert get_logger() is logging.getLogger("mcp-server")
+        assert get_logger("vind") is get_logger("vind")
+
+    @pytest.mark.unit
+    def test_check_dependencies_default_skips_version_exec(self):
+        """Test that the default dependency check only looks tools up on PATH."""
+        from kubectl_mcp_tool.utils import helpers
+
+        helpers._on_path_in_window.cache_clear()
+        try:
+            with patch.object(helpers.shutil, "which", return_value="/usr/bin/tool"):
+                with patch.object(helpers.subprocess, "check_output") as version:
+                    assert helpers.check_dependencies() is True
+                    assert helpers.check_kubectl_availability() is True
+            version.assert_not_called()
+        finally:
+            helpers._on_path_in_window.cache_clear()
+
+    @pytest.mark.unit
+    def test_check_tool_on_path_rechecks_after_ttl(self):
+        """Test that a tool installed after a failed lookup is found once the TTL passes."""
+        from kubectl_mcp_tool.utils import helpers
+
+        helpers._on_path_in_window.cache_clear()
+        try:
+            with patch.object(helpers.shutil, "which", return_value=None):
+                assert helpers.check_tool_on_path("kubectl") is False
+            with patch.object(helpers.shutil, "which", return_value="/usr/bin/kubectl"):
+                assert helpers.check_tool_on_path("kubectl") is False
+                later = helpers.time.monotonic() + helpers.TOOL_CHECK_TTL
+                with patch.object(helpers.time, "monotonic", return_value=later):
+                    assert helpers.check_tool_on_path("kubectl") is True
+        finally:
+            helpers._on_path_in_window.cache_clear()
+
 
 class TestTransportMethods:
     """Tests for transport methods."""
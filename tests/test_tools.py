@@ -338,6 +338,50 @@ class TestDeploymentTools:
         with patch("kubectl_mcp_tool.mcp_server.MCPServer._check_dependencies", return_value=True):
             server = MCPServer(name="test")
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rollout_action_probes_run_off_event_loop(self):
+        """Test that the CRD and plugin probes of a rollout action do not block the event loop."""
+        import threading
+        from kubectl_mcp_tool.tools import rollouts
+
+        loop_thread = threading.current_thread()
+        probe_threads = []
+
+        def probe(*args):
+            probe_threads.append(threading.current_thread())
+            return bool(args)
+
+        with patch.object(rollouts, "crd_exists", side_effect=probe), \
+                patch.object(rollouts, "_argo_rollouts_cli_available", side_effect=probe), \
+                patch.object(rollouts, "run_kubectl", return_value={"success": True}):
+            result = await rollouts.rollout_abort("demo", "default")
+
+        assert result["message"] == "Aborted rollout demo"
+        assert len(probe_threads) == 2
+        assert loop_thread not in probe_threads
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_rollout_promote_full_messages(self):
+        """Test that a full promote only reports "(full)" when the plugin ran."""
+        from kubectl_mcp_tool.tools import rollouts
+
+        with patch.object(rollouts, "crd_exists", return_value=True), \
+                patch.object(rollouts, "_argo_rollouts_cli_available", return_value=False), \
+                patch.object(rollouts, "run_kubectl", return_value={"success": True}):
+            result = await rollouts.rollout_promote("demo", "default", full=True)
+        assert result["message"] == "Promoted rollout demo"
+
+        async def plugin_ok(cmd, timeout=30):
+            return {"success": True, "output": ""}
+
+        with patch.object(rollouts, "crd_exists", return_value=True), \
+                patch.object(rollouts, "_argo_rollouts_cli_available", return_value=True), \
+                patch.object(rollouts, "_run_cli_async", side_effect=plugin_ok):
+            result = await rollouts.rollout_promote("demo", "default", full=True)
+        assert result["message"] == "Promoted rollout demo (full)"
+
 
 class TestServiceTools:
     """Tests for service-related tools."""
@@ -520,6 +564,72 @@ class TestSecurityTools:
         with patch("kubectl_mcp_tool.mcp_server.MCPServer._check_dependencies", return_value=True):
             server = MCPServer(name="test")
 
+    @staticmethod
+    def _security_tools():
+        from kubectl_mcp_tool.tools import security
+
+        server = MagicMock()
+        tools = {}
+        server.tool.return_value = lambda fn: tools.setdefault(fn.__name__, fn)
+        security.register_security_tools(server, non_destructive=False)
+        return tools
+
+    @pytest.mark.unit
+    def test_audit_rbac_stops_paging_at_permission_cap(self):
+        """Test that no further binding pages are requested once 100 permissions are found."""
+        from kubectl_mcp_tool.tools import security
+
+        def bindings(start, end, continue_token):
+            items = [{
+                "metadata": {"name": f"b{i}", "namespace": "default"},
+                "roleRef": {"name": "view"},
+                "subjects": [{"name": f"user{i}", "kind": "User"}],
+            } for i in range(start, end)]
+            metadata = {"continue": continue_token} if continue_token else None
+            return TestIterListItems._response(items, metadata)
+
+        def list_pages(limit=None, _continue=None, _preload_content=True):
+            # Five short pages of 60 bindings, one subject each
+            page = int(_continue or 0)
+            return bindings(page * 60, (page + 1) * 60, str(page + 1) if page < 4 else None)
+
+        rbac = MagicMock()
+        rbac.list_cluster_role_binding.side_effect = list_pages
+        rbac.list_role_binding_for_all_namespaces.side_effect = list_pages
+        with patch.object(security, "get_rbac_client", return_value=rbac):
+            result = self._security_tools()["audit_rbac_permissions"]()
+
+        assert len(result["permissions"]) == 100
+        assert [c.kwargs["_continue"] for c in rbac.list_cluster_role_binding.call_args_list] == [None, "1"]
+        assert [c.kwargs["_continue"] for c in rbac.list_role_binding_for_all_namespaces.call_args_list] == [None]
+
+    @pytest.mark.unit
+    def test_issue_cap_reached_exactly_is_not_truncated(self):
+        """Test that exactly 50 offending pods or secrets are not reported as truncated."""
+        from kubectl_mcp_tool.tools import security
+
+        def items(count, item):
+            return lambda *args, **kwargs: iter([item(i) for i in range(count)])
+
+        def pod(i):
+            return {"metadata": {"name": f"p{i}"}, "spec": {"hostNetwork": True}}
+
+        def secret(i):
+            return {"metadata": {"name": f"s{i}"}, "type": "Opaque"}
+
+        tools = self._security_tools()
+        with patch.object(security, "get_k8s_client"):
+            for count, truncated in ((50, False), (51, True)):
+                with patch.object(security, "iter_list_items", side_effect=items(count, pod)):
+                    result = tools["analyze_pod_security"]()
+                assert result["podsWithIssues"] == 50
+                assert result["issuesTruncated"] is truncated
+
+                with patch.object(security, "iter_list_items", side_effect=items(count, secret)):
+                    result = tools["check_secrets_security"]()
+                assert result["secretsWithIssues"] == 50
+                assert result["findingsTruncated"] is truncated
+
 
 class TestNetworkTools:
     """Tests for network-related tools."""
@@ -598,6 +708,18 @@ class TestStorageTools:
                 with patch("kubectl_mcp_tool.mcp_server.MCPServer._check_dependencies", return_value=True):
                     server = MCPServer(name="test")
 
+    @pytest.mark.unit
+    def test_get_pv_source_maps_camel_case_sources(self):
+        """Test that multi-word PV sources resolve to their snake_case attributes."""
+        from kubernetes.client import V1GCEPersistentDiskVolumeSource, V1PersistentVolumeSpec
+        from kubectl_mcp_tool.tools.storage import _get_pv_source
+
+        spec = V1PersistentVolumeSpec(
+            gce_persistent_disk=V1GCEPersistentDiskVolumeSource(pd_name="disk-1")
+        )
+        assert _get_pv_source(spec)["type"] == "gcePersistentDisk"
+        assert _get_pv_source(V1PersistentVolumeSpec()) == {"type": "unknown"}
+
     @pytest.mark.unit
     def test_get_storage_classes(self, mock_all_kubernetes_apis, mock_kubectl_subprocess):
         """Test getting storage classes."""
@@ -756,3 +878,878 @@ class TestMaskSecrets:
                 text = 'token: "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"'
                 masked = server._mask_secrets(text)
                 assert "[MASKED]" in masked
+
+
+class TestIterListItems:
+    """Tests for raw list streaming used by the security tools."""
+
+    @staticmethod
+    def _response(items, metadata=None):
+        import io
+
+        class _Response(io.BytesIO):
+            pass
+
+        body = json.dumps({"metadata": metadata or {}, "items": items}).encode()
+        resp = _Response(body)
+        resp.data = body
+        resp.release_conn = MagicMock()
+        resp.close = MagicMock()
+        return resp
+
+    @pytest.mark.unit
+    def test_yields_plain_dicts(self):
+        """Test that items come back as camelCase dicts from the raw body."""
+        from kubectl_mcp_tool.tools.utils import iter_list_items
+        resp = self._response([{"metadata": {"name": "a"}, "spec": {"hostNetwork": True}}])
+        list_fn = MagicMock(return_value=resp)
+
+        items = list(iter_list_items(list_fn, "default"))
+
+        assert items == [{"metadata": {"name": "a"}, "spec": {"hostNetwork": True}}]
+        list_fn.assert_called_once_with("default", _preload_content=False)
+        resp.release_conn.assert_called_once()
+
+    @pytest.mark.unit
+    def test_early_exit_closes_response(self):
+        """Test that abandoning the iterator closes rather than pools the connection."""
+        from kubectl_mcp_tool.tools.utils import iter_list_items
+        resp = self._response([{"metadata": {"name": "a"}}, {"metadata": {"name": "b"}}])
+
+        items = iter_list_items(MagicMock(return_value=resp))
+        next(items)
+        items.close()
+
+        resp.close.assert_called_once()
+        resp.release_conn.assert_not_called()
+
+    @pytest.mark.unit
+    def test_pages_with_continue_token(self):
+        """Test that page_size drives limit/continue and pages are fetched lazily."""
+        import itertools
+        from kubectl_mcp_tool.tools.utils import iter_list_items
+
+        def list_fn(limit=None, _continue=None, _preload_content=True):
+            start = int(_continue or 0)
+            end = min(start + limit, 5)
+            items = [{"metadata": {"name": str(i)}} for i in range(start, end)]
+            return self._response(items, {"continue": str(end)} if end < 5 else None)
+
+        list_fn = MagicMock(side_effect=list_fn)
+        names = [i["metadata"]["name"] for i in iter_list_items(list_fn, page_size=2)]
+        assert names == ["0", "1", "2", "3", "4"]
+        assert [c.kwargs["_continue"] for c in list_fn.call_args_list] == [None, "2", "4"]
+
+        list_fn.reset_mock()
+        list(itertools.islice(iter_list_items(list_fn, page_size=2), 2))
+        assert list_fn.call_count == 1
+
+
+class TestInformers:
+    """Tests for the opt-in list/watch cache behind the storage tools."""
+
+    @staticmethod
+    def _obj(uid, name):
+        obj = MagicMock()
+        obj.metadata.uid = uid
+        obj.metadata.name = name
+        obj.metadata.namespace = None
+        return obj
+
+    @pytest.mark.unit
+    def test_cached_list_disabled_by_default(self):
+        """Test that callers fall back to a direct list when informers are off."""
+        from kubectl_mcp_tool import informers
+
+        with patch.object(informers, "INFORMERS_ENABLED", False):
+            assert informers.cached_list("", MagicMock()) is None
+
+    @pytest.mark.unit
+    def test_informer_applies_watch_events(self):
+        """Test that the store reflects the initial list plus watch deltas."""
+        import threading
+        from kubectl_mcp_tool import informers
+
+        resp = MagicMock()
+        resp.items = [self._obj("1", "a"), self._obj("2", "b")]
+        resp.metadata._continue = None
+        resp.metadata.resource_version = "10"
+        list_fn = MagicMock(return_value=resp, __name__="list_persistent_volume")
+
+        done = threading.Event()
+        informer = informers.Informer(list_fn)
+
+        def stream(*args, **kwargs):
+            assert kwargs["resource_version"] == "10"
+            yield {"type": "DELETED", "object": self._obj("1", "a")}
+            yield {"type": "ADDED", "object": self._obj("3", "c")}
+            yield {"type": "BOOKMARK", "object": {}}
+            informer.stop()
+            done.set()
+
+        with patch.object(informers.watch, "Watch") as watch_cls:
+            watch_cls.return_value.stream.side_effect = stream
+            informer.start()
+            assert done.wait(5)
+            informer._thread.join(5)
+
+        assert [o.metadata.name for o in informer.items()] == ["b", "c"]
+
+    @pytest.mark.unit
+    def test_cached_list_stops_least_recently_used_informer(self):
+        """Test that the informer map is bounded by MAX_INFORMERS."""
+        from kubectl_mcp_tool import informers
+
+        started = []
+
+        def fake_informer(list_fn, *args):
+            informer = MagicMock()
+            informer.items.return_value = [args]
+            started.append(informer)
+            return informer
+
+        with patch.object(informers, "INFORMERS_ENABLED", True), \
+                patch.object(informers, "is_stateless_mode", return_value=False), \
+                patch.object(informers, "on_config_change"), \
+                patch.object(informers, "Informer", side_effect=fake_informer), \
+                patch.object(informers, "MAX_INFORMERS", 2), \
+                patch.object(informers, "_informers", informers.OrderedDict()):
+            list_fn = MagicMock(__name__="list_namespaced_persistent_volume_claim")
+            informers.cached_list("", list_fn, "a")
+            informers.cached_list("", list_fn, "b")
+            informers.cached_list("", list_fn, "a")
+            informers.cached_list("", list_fn, "c")
+
+            assert list(informers._informers) == [
+                ("default", list_fn.__name__, ("a",)),
+                ("default", list_fn.__name__, ("c",)),
+            ]
+        started[1].stop.assert_called_once()
+        started[0].stop.assert_not_called()
+
+    @pytest.mark.unit
+    def test_namespaced_pvcs_filter_cluster_wide_informer(self):
+        """Test that a namespaced PVC list reuses the cluster-wide informer."""
+        from kubectl_mcp_tool.tools import storage
+
+        def pvc(namespace):
+            obj = MagicMock()
+            obj.metadata.namespace = namespace
+            obj.spec.resources.requests = {}
+            return obj
+
+        server = MagicMock()
+        tools = {}
+        server.tool.return_value = lambda fn: tools.setdefault(fn.__name__, fn)
+        storage.register_storage_tools(server, non_destructive=False)
+
+        v1 = MagicMock()
+        with patch.object(storage, "get_k8s_client", return_value=v1), \
+                patch.object(storage, "cached_list", return_value=[pvc("a"), pvc("b")]) as informer:
+            result = tools["get_pvcs"](namespace="a")
+
+        informer.assert_called_once_with("", v1.list_persistent_volume_claim_for_all_namespaces)
+        v1.list_namespaced_persistent_volume_claim.assert_not_called()
+        assert [claim["namespace"] for claim in result["pvcs"]] == ["a"]
+
+
+class TestToJsonl:
+    """Tests for newline-delimited JSON tool output."""
+
+    @pytest.mark.unit
+    def test_envelope_then_items(self):
+        """Test that the envelope is the first line and each item follows."""
+        from kubectl_mcp_tool.tools import utils
+
+        for encoder in (utils.orjson, None):
+            with patch.object(utils, "orjson", encoder):
+                items = ({"name": str(i)} for i in range(3))
+                lines = utils.to_jsonl({"success": True}, items).split("\n")
+
+            assert json.loads(lines[0]) == {"success": True}
+            assert [json.loads(line) for line in lines[1:]] == [
+                {"name": "0"}, {"name": "1"}, {"name": "2"}
+            ]
+
+
+class TestGetResources:
+    """Tests for listing resources in-process instead of through kubectl."""
+
+    @pytest.mark.unit
+    def test_custom_resources_listed_through_api(self):
+        """Test that plural.group kinds use the custom objects API with the CRD's version."""
+        from kubectl_mcp_tool.tools import utils
+
+        api = MagicMock()
+        items = [{"metadata": {"name": "b1"}}]
+        with patch.object(utils, "_custom_resource_target",
+                          return_value=("velero.io", "v1", "backups", True)), \
+                patch.object(utils, "get_custom_objects_client", return_value=api), \
+                patch.object(utils, "iter_list_items", return_value=iter(items)) as iter_items, \
+                patch.object(utils.subprocess, "run") as run:
+            result = utils.get_resources("backups.velero.io", "velero", label_selector="app=x")
+
+        assert result == items
+        iter_items.assert_called_once_with(
+            api.list_namespaced_custom_object, "velero.io", "v1", "velero", "backups",
+            label_selector="app=x",
+        )
+        run.assert_not_called()
+
+    @pytest.mark.unit
+    def test_falls_back_to_kubectl_when_crd_unresolved(self):
+        """Test that kinds the API client cannot resolve still go through kubectl."""
+        from kubectl_mcp_tool.tools import utils
+
+        with patch.object(utils, "_custom_resource_target", side_effect=RuntimeError("no crd")), \
+                patch.object(utils, "run_kubectl",
+                             return_value={"success": True, "output": '{"items": [{"kind": "X"}]}'}) as run:
+            assert utils.get_resources("widgets.example.com") == [{"kind": "X"}]
+
+        assert run.call_args.args[0] == ["get", "widgets.example.com", "-o", "json", "-A"]
+
+    @pytest.mark.unit
+    def test_malformed_kubectl_output_returns_empty(self):
+        """Test that unparseable kubectl output yields no items with either JSON decoder."""
+        from kubectl_mcp_tool.tools import utils
+
+        with patch.object(utils, "_list_call", return_value=None), \
+                patch.object(utils, "run_kubectl", return_value={"success": True, "output": "{not json"}):
+            assert utils.get_resources("widgets") == []
+
+    @pytest.mark.unit
+    def test_fields_parsed_from_jsonpath_lines(self):
+        """Test that get_resources_fields requests a jsonpath template and splits its lines."""
+        from kubectl_mcp_tool.tools import utils
+
+        output = "web-1\tdefault\nweb-2\t\n"
+        with patch.object(utils, "run_kubectl", return_value={"success": True, "output": output}) as run:
+            result = utils.get_resources_fields("pods", ["metadata.name", "metadata.namespace"])
+
+        assert result == [
+            {"metadata.name": "web-1", "metadata.namespace": "default"},
+            {"metadata.name": "web-2", "metadata.namespace": ""},
+        ]
+        assert run.call_args.args[0] == [
+            "get", "pods", "-o",
+            'jsonpath={range .items[*]}{.metadata.name}{"\\t"}{.metadata.namespace}{"\\n"}{end}',
+            "-A",
+        ]
+
+
+class TestListCache:
+    """Tests for the stale-while-revalidate list cache."""
+
+    @pytest.mark.unit
+    def test_fresh_entries_skip_loader(self):
+        """Test that a fresh entry is served without calling the loader again."""
+        from kubectl_mcp_tool.tools import utils
+
+        cache = utils._K8sCache()
+        loader = MagicMock(return_value="v1")
+        assert cache.get(("pods",), 60, loader) == "v1"
+        assert cache.get(("pods",), 60, loader) == "v1"
+        loader.assert_called_once()
+
+    @pytest.mark.unit
+    def test_stale_entry_served_while_refreshing(self):
+        """Test that a stale entry is returned immediately and refreshed in the background."""
+        import threading
+        from kubectl_mcp_tool.tools import utils
+
+        cache = utils._K8sCache()
+        cache.get(("pods",), 60, lambda: "old")
+        refreshed = threading.Event()
+
+        def loader():
+            refreshed.set()
+            return "new"
+
+        assert cache.get(("pods",), 0, loader) == "old"
+        assert refreshed.wait(5)
+        cache._executor.shutdown(wait=True)
+        assert cache.get(("pods",), 60, loader) == "new"
+
+    @pytest.mark.unit
+    def test_invalidate_by_prefix(self):
+        """Test that invalidate drops only keys under the prefix."""
+        from kubectl_mcp_tool.tools import utils
+
+        cache = utils._K8sCache()
+        cache.get(("pods", "a"), 60, lambda: 1)
+        cache.get(("events", "a"), 60, lambda: 2)
+        cache.invalidate(("pods",))
+
+        assert cache.get(("pods", "a"), 60, lambda: 3) == 3
+        assert cache.get(("events", "a"), 60, lambda: 4) == 2
+
+
+class TestUIListItems:
+    """Tests for choosing between informers and the list cache in the UI tools."""
+
+    @pytest.mark.unit
+    def test_unfiltered_lists_use_informer_snapshot(self):
+        """Test that a synced informer snapshot is returned without calling the API."""
+        from kubectl_mcp_tool.tools import ui
+
+        list_fn = MagicMock()
+        with patch.object(ui, "cached_list", return_value=["pod"]) as informer:
+            assert ui._list_items(("pods", None, None), list_fn) == ["pod"]
+
+        informer.assert_called_once_with("", list_fn)
+        list_fn.assert_not_called()
+
+    @pytest.mark.unit
+    def test_filtered_lists_skip_informer(self):
+        """Test that field-selected lists go to the API through the list cache."""
+        from kubectl_mcp_tool.tools import ui
+
+        list_fn = MagicMock()
+        list_fn.return_value.items = ["warning"]
+        with patch.object(ui, "cached_list") as informer:
+            items = ui._list_items(("events", None, "Warning"), list_fn, field_selector="type=Warning")
+
+        assert items == ["warning"]
+        informer.assert_not_called()
+        assert list_fn.call_args.kwargs["field_selector"] == "type=Warning"
+
+    @pytest.mark.unit
+    def test_namespaced_lists_skip_informer(self):
+        """Test that per-namespace lists never start an informer."""
+        from kubectl_mcp_tool.tools import ui
+
+        list_fn = MagicMock()
+        list_fn.return_value.items = ["pod"]
+        with patch.object(ui, "cached_list") as informer:
+            items = ui._list_items(("pods", "team-a", None), list_fn, "team-a")
+
+        assert items == ["pod"]
+        informer.assert_not_called()
+        assert list_fn.call_args.args == ("team-a",)
+
+    @pytest.mark.unit
+    def test_informer_keyed_by_context(self):
+        """Test that the caller's context reaches the informer cache key."""
+        from kubectl_mcp_tool.tools import ui
+
+        list_fn = MagicMock()
+        with patch.object(ui, "cached_list", return_value=["node"]) as informer:
+            assert ui._list_items(("nodes",), list_fn, context="prod") == ["node"]
+
+        informer.assert_called_once_with("prod", list_fn)
+
+    @pytest.mark.unit
+    def test_cluster_overview_lists_run_concurrently(self):
+        """Test that the four overview lists are in flight at the same time."""
+        import asyncio
+        import threading
+        from kubectl_mcp_tool.tools import ui
+
+        # Only passes once all four calls wait on the barrier together
+        barrier = threading.Barrier(4, timeout=5)
+
+        def list_items(cache_key, list_fn):
+            barrier.wait()
+            return [cache_key[0]]
+
+        with patch.object(ui, "_list_items", side_effect=list_items):
+            result = asyncio.run(ui._list_cluster_overview(MagicMock()))
+
+        assert result == [["nodes"], ["namespaces"], ["pods"], ["services"]]
+
+    @pytest.mark.unit
+    def test_api_calls_run_on_shared_pool(self):
+        """Test that blocking API calls from async tools run on the k8s-api pool."""
+        import asyncio
+        import threading
+        from kubectl_mcp_tool.tools import ui
+
+        async def thread_name():
+            return await ui._on_k8s_pool(lambda: threading.current_thread().name)
+
+        assert asyncio.run(thread_name()).startswith("k8s-api")
+
+
+class TestUIScreenshots:
+    """Tests for UI screenshot rendering backends."""
+
+    @pytest.mark.unit
+    def test_playwright_session_used_when_available(self):
+        """Test that screenshots go through the shared browser session."""
+        import base64
+        from kubectl_mcp_tool.tools import ui
+
+        session = MagicMock()
+        session.render.return_value = b"png"
+        with patch.object(ui, "_CAN_RENDER", True), \
+                patch.object(ui, "PLAYWRIGHT_AVAILABLE", True), \
+                patch.object(ui, "_get_browser_session", return_value=session), \
+                patch.object(ui, "_render_with_agent_browser") as agent_browser:
+            result = ui._render_html_to_screenshot("<html></html>", 800, 600)
+
+        assert result == base64.b64encode(b"png").decode()
+        session.render.assert_called_once_with("<html></html>", 800, 600)
+        agent_browser.assert_not_called()
+
+    @pytest.mark.unit
+    def test_screenshots_disabled_without_backend(self):
+        """Test that rendering is skipped when no browser backend exists."""
+        from kubectl_mcp_tool.tools import ui
+
+        with patch.object(ui, "_CAN_RENDER", False), \
+                patch.object(ui, "_render_with_agent_browser") as agent_browser:
+            assert ui._render_html_to_screenshot("<html></html>") is None
+        agent_browser.assert_not_called()
+
+    @pytest.mark.unit
+    def test_async_render_awaits_browser_future(self):
+        """Test that async rendering waits on the pooled browser without blocking."""
+        import base64
+        import concurrent.futures
+        from kubectl_mcp_tool.tools import ui
+
+        future = concurrent.futures.Future()
+        future.set_result(b"png")
+        session = MagicMock()
+        session.submit.return_value = future
+        with patch.object(ui, "_CAN_RENDER", True), \
+                patch.object(ui, "PLAYWRIGHT_AVAILABLE", True), \
+                patch.object(ui, "_get_browser_session", return_value=session):
+            result = asyncio.run(ui._render_html_to_screenshot_async("<html></html>"))
+
+        assert result == base64.b64encode(b"png").decode()
+        session.submit.assert_called_once_with("<html></html>", 1200, 800)
+
+    @pytest.mark.unit
+    def test_screenshot_log_lines_clipped(self):
+        """Test that blank log lines are dropped and long ones are clipped for screenshots."""
+        from kubectl_mcp_tool.tools import ui
+
+        long_line = "x" * (ui.SCREENSHOT_LOG_LINE_CHARS + 10)
+        lines = list(ui._screenshot_log_lines(["first", "", "  \t", long_line]))
+
+        assert lines == ["first", "x" * ui.SCREENSHOT_LOG_LINE_CHARS + "…"]
+
+    @pytest.mark.unit
+    def test_identical_pages_reuse_recent_screenshot(self):
+        """Test that a repeated page and viewport skip the browser until the entry expires."""
+        from kubectl_mcp_tool.tools import ui
+
+        session = MagicMock()
+        session.render.return_value = b"png"
+        with patch.object(ui, "_CAN_RENDER", True), \
+                patch.object(ui, "PLAYWRIGHT_AVAILABLE", True), \
+                patch.object(ui, "_get_browser_session", return_value=session):
+            first = ui._render_html_to_screenshot("<p>a</p>")
+            assert ui._render_html_to_screenshot("<p>a</p>") == first
+            assert session.render.call_count == 1
+
+            ui._render_html_to_screenshot("<p>a</p>", 800, 600)
+            ui._render_html_to_screenshot("<p>b</p>")
+            assert session.render.call_count == 3
+
+            with patch.object(ui.time, "monotonic", return_value=ui.time.monotonic() + ui.SCREENSHOT_CACHE_TTL):
+                ui._render_html_to_screenshot("<p>a</p>")
+            assert session.render.call_count == 4
+
+    @pytest.mark.unit
+    def test_agent_browser_skips_repeat_viewport_resize(self):
+        """Test that agent-browser renders run open+screenshot and resize only on change."""
+        from kubectl_mcp_tool.tools import ui
+
+        def run(cmd, **kwargs):
+            if cmd[1] == "screenshot":
+                with open(cmd[2], "wb") as f:
+                    f.write(b"png")
+            return MagicMock(returncode=0)
+
+        with patch.object(ui, "_agent_browser_viewport", None), \
+                patch.object(ui.subprocess, "run", side_effect=run) as mock_run:
+            assert ui._render_with_agent_browser("<p>a</p>", 800, 600)
+            assert ui._render_with_agent_browser("<p>b</p>", 800, 600)
+
+        verbs = [c.args[0][1] for c in mock_run.call_args_list]
+        assert verbs == ["set", "open", "screenshot", "open", "screenshot"]
+
+    @pytest.mark.unit
+    def test_idle_browser_closed_after_timeout(self):
+        """Test that a pooled browser is closed once renders stop and relaunched on demand."""
+        import time
+        from kubectl_mcp_tool.tools import ui
+
+        session = ui._BrowserSession()
+        browser = MagicMock()
+        session._browser, session._page, session._playwright = browser, MagicMock(), MagicMock()
+        try:
+            with patch.object(ui, "BROWSER_IDLE_TIMEOUT", 0.05):
+                session.render("<html></html>", 800, 600)
+                deadline = time.monotonic() + 5
+                while session._browser is not None and time.monotonic() < deadline:
+                    time.sleep(0.01)
+        finally:
+            session.close()
+
+        browser.close.assert_called_once()
+        assert session._browser is None and session._page is None
+
+    @pytest.mark.unit
+    def test_register_prewarms_browser_pool(self):
+        """Test that registering the UI tools launches pooled browsers only when rendering is possible."""
+        from kubectl_mcp_tool.tools import ui
+
+        server = MagicMock()
+        with patch.object(ui, "_prewarm_browser_pool") as prewarm:
+            with patch.object(ui, "_CAN_RENDER", False):
+                ui.register_ui_tools(server, non_destructive=False)
+            prewarm.assert_not_called()
+            with patch.object(ui, "_CAN_RENDER", True), \
+                    patch.object(ui, "PLAYWRIGHT_AVAILABLE", True):
+                ui.register_ui_tools(server, non_destructive=False)
+            prewarm.assert_called_once()
+
+    @pytest.mark.unit
+    def test_agent_browser_scratch_files_are_reused(self):
+        """Test that renders reuse scratch paths and return the slot after a failure."""
+        from kubectl_mcp_tool.tools import ui
+
+        pages = []
+
+        def run(cmd, **kwargs):
+            if cmd[1] == "open":
+                pages.append(cmd[2])
+                raise OSError("boom")
+            return MagicMock(returncode=0)
+
+        with patch.object(ui, "SCRATCH_SLOTS", 1), \
+                patch.object(ui, "_scratch_dir", None), \
+                patch.object(ui, "_scratch_slots", ui.queue.Queue()), \
+                patch.object(ui.subprocess, "run", side_effect=run):
+            assert ui._render_with_agent_browser("<p>a</p>", 800, 600) is None
+            assert ui._render_with_agent_browser("<p>b</p>", 800, 600) is None
+            assert ui._scratch_slots.qsize() == 1
+
+        assert len(pages) == 2 and pages[0] == pages[1]
+
+    @pytest.mark.unit
+    def test_parse_frame_sizes(self):
+        """Test that pixel sizes are parsed and percentages use the default viewport."""
+        from kubectl_mcp_tool.tools import ui
+
+        assert ui._parse_frame(("1000px", "700px")) == (1000, 700)
+        assert ui._parse_frame(("100%", "600px")) == (1200, 600)
+        assert ui._parse_frame(("auto", "50%")) == ui.DEFAULT_VIEWPORT
+
+
+class TestUIResourceYaml:
+    """Tests for reading resource YAML directly from the API server."""
+
+    @pytest.mark.unit
+    def test_reads_yaml_without_managed_fields(self):
+        """Test that known kinds are read as YAML and managedFields are dropped."""
+        from kubectl_mcp_tool.tools import ui
+
+        body = (
+            "kind: Deployment\nmetadata:\n  managedFields:\n  - manager: kubectl\n"
+            "    operation: Update\n  name: web\nspec:\n  replicas: 2\n"
+        )
+        apps = MagicMock()
+        apps.read_namespaced_deployment.return_value.data = body.encode()
+        with patch.dict(ui._YAML_READERS, {"deploy": (lambda: apps, "read_namespaced_deployment")}):
+            yaml_content = ui._read_resource_yaml("Deploy", "web", "prod")
+
+        assert yaml_content == "kind: Deployment\nmetadata:\n  name: web\nspec:\n  replicas: 2\n"
+        apps.read_namespaced_deployment.assert_called_once_with(
+            "web", "prod", _preload_content=False, _headers={"Accept": "application/yaml"}
+        )
+
+    @pytest.mark.unit
+    def test_unknown_kind_falls_back(self):
+        """Test that kinds without a direct reader return None for the kubectl fallback."""
+        from kubectl_mcp_tool.tools import ui
+
+        assert ui._read_resource_yaml("certificates.cert-manager.io", "x", "default") is None
+
+
+class TestUIPodLogs:
+    """Tests for streaming pod logs in the UI tools."""
+
+    @pytest.mark.unit
+    def test_read_log_lines_joins_chunks(self):
+        """Test that lines split across chunks are reassembled and the connection released."""
+        from kubectl_mcp_tool.tools import ui
+
+        v1 = MagicMock()
+        resp = v1.read_namespaced_pod_log.return_value
+        resp.stream.return_value = iter([b"INFO start\nWA", b"RN x\nlast"])
+
+        assert ui._read_log_lines(v1, "web", "default", None, 10) == ["INFO start", "WARN x", "last"]
+        assert v1.read_namespaced_pod_log.call_args.kwargs["_preload_content"] is False
+        resp.release_conn.assert_called_once()
+
+    @pytest.mark.unit
+    def test_log_classifier_keeps_keyword_precedence(self):
+        """Test that error outranks warn and warn outranks info wherever they appear."""
+        from kubectl_mcp_tool.tools import ui
+
+        def classify(line):
+            match = ui._LOG_CLASSIFIER.match(line)
+            return ui._LOG_LINE_CLASS[match.lastgroup] if match else "log-line"
+
+        assert classify("INFO retrying after Error") == "log-line log-error"
+        assert classify("info: Warning: disk") == "log-line log-warn"
+        assert classify("INFO started") == "log-line log-info"
+        assert classify("GET /healthz 200") == "log-line"
+
+
+class TestUIPageCompression:
+    """Tests for gzip-compressing large UI pages."""
+
+    @pytest.mark.unit
+    def test_small_page_is_left_as_is(self):
+        """Test that pages under the threshold are not compressed."""
+        from kubectl_mcp_tool.tools import ui
+
+        page = "<p>hi</p>"
+        assert ui._compress_page(page) is page
+
+    @pytest.mark.unit
+    def test_typical_dashboard_page_is_left_as_is(self):
+        """Test that a themed page with a few dozen rows is sent as plain HTML."""
+        from kubectl_mcp_tool.tools import ui
+
+        page = ui._render_page("<tr><td>pod</td><td>Running</td></tr>" * 50)
+        assert ui._compress_page(page) is page
+
+    @pytest.mark.unit
+    def test_large_page_round_trips(self):
+        """Test that large pages are embedded as a smaller gzip+base64 payload."""
+        import base64
+        import gzip
+        import re
+        from kubectl_mcp_tool.tools import ui
+
+        page = ui._render_page("<tr><td>pod</td></tr>" * 5000)
+        compressed = ui._compress_page(page)
+
+        assert len(compressed) < len(page) // 2
+        payload = re.search(r'atob\("([^"]+)"\)', compressed).group(1)
+        assert gzip.decompress(base64.b64decode(payload)).decode("utf-8") == page
+
+
+class TestUIListFilters:
+    """Tests for server-side filtering in the UI list tools."""
+
+    @staticmethod
+    def _ui_tools():
+        from kubectl_mcp_tool.tools import ui
+
+        tools = {}
+
+        class _Server:
+            def tool(self, **kwargs):
+                def decorator(fn):
+                    tools[fn.__name__] = fn
+                    return fn
+                return decorator
+
+        ui.register_ui_tools(_Server(), non_destructive=False)
+        return ui, tools
+
+    @pytest.mark.unit
+    def test_events_type_filter_sent_to_api_server(self):
+        """Test that event_type becomes a field selector with a request timeout."""
+        ui, tools = self._ui_tools()
+        v1 = MagicMock()
+        v1.list_event_for_all_namespaces.return_value.items = []
+
+        with patch.object(ui, "get_k8s_client", return_value=v1):
+            result = tools["show_events_timeline_ui"](event_type="Warning")
+
+        assert result["success"] is True
+        kwargs = v1.list_event_for_all_namespaces.call_args.kwargs
+        assert kwargs["field_selector"] == "type=Warning"
+        assert kwargs["_request_timeout"] == ui.LIST_REQUEST_TIMEOUT
+
+    @pytest.mark.unit
+    def test_pods_dashboard_without_status_lists_everything(self):
+        """Test that no field selector is sent unless a phase is requested."""
+        ui, tools = self._ui_tools()
+        v1 = MagicMock()
+        v1.list_namespaced_pod.return_value.items = []
+
+        with patch.object(ui, "get_k8s_client", return_value=v1):
+            tools["show_pods_dashboard_ui"](namespace="default")
+            assert "field_selector" not in v1.list_namespaced_pod.call_args.kwargs
+            tools["show_pods_dashboard_ui"](namespace="default", status="Running")
+            assert v1.list_namespaced_pod.call_args.kwargs["field_selector"] == "status.phase=Running"
+
+    @pytest.mark.unit
+    def test_events_timeline_orders_mixed_timestamps(self):
+        """Test that events without timestamps sort last instead of raising."""
+        from datetime import timezone
+
+        ui, tools = self._ui_tools()
+
+        def event(name, ts):
+            e = MagicMock()
+            e.type = "Normal"
+            e.message = name
+            e.last_timestamp = ts
+            e.metadata.creation_timestamp = None
+            return e
+
+        old = event("old", datetime(2024, 1, 1, tzinfo=timezone.utc))
+        new = event("new", datetime(2024, 6, 1, tzinfo=timezone.utc))
+        undated = event("undated", None)
+        v1 = MagicMock()
+        v1.list_namespaced_event.return_value.items = [undated, old, new]
+
+        with patch.object(ui, "get_k8s_client", return_value=v1):
+            result = tools["show_events_timeline_ui"](namespace="default", limit=2)
+
+        assert result["success"] is True
+        assert [e["message"] for e in result["events"]] == ["new", "old"]
+        assert result["events"][0] == {
+            "type": "Normal",
+            "reason": new.reason,
+            "message": "new",
+            "object": f"{new.involved_object.kind}/{new.involved_object.name}",
+        }
+
+
+class TestUIEscape:
+    """Tests for HTML escaping in UI pages."""
+
+    @pytest.mark.unit
+    def test_escape_round_trips_markup(self):
+        """Test that markup characters are escaped and falsy values render empty."""
+        import html
+        from kubectl_mcp_tool.tools import ui
+
+        text = """<a href="x">&'"""
+        escaped = ui._escape(text)
+        assert "<" not in escaped and '"' not in escaped and "'" not in escaped
+        assert html.unescape(escaped) == text
+        assert ui._escape(3) == "3"
+        assert ui._escape(None) == ""
+
+    @pytest.mark.unit
+    def test_logs_script_encodes_params_as_js(self):
+        """Test that refresh parameters are JSON-encoded and cannot close the script tag."""
+        from kubectl_mcp_tool.tools import ui
+
+        script = ui._logs_script("web'</script>", "default", 50)
+        first_line = script.split("\n", 1)[0]
+
+        assert first_line.count("</script>") == 1
+        assert '"pod_name": "web\'<\\/script>"' in first_line
+        assert '"tail": 50' in first_line
+        assert script.endswith(ui._LOGS_SCRIPT)
+
+    @pytest.mark.unit
+    def test_pod_row_logs_button_passes_js_strings(self):
+        """Test that the Logs button passes JSON string literals, attribute-escaped."""
+        import html
+        import re
+        from kubectl_mcp_tool.tools import ui
+
+        pod = MagicMock()
+        pod.metadata.name = "it's"
+        pod.metadata.namespace = "default"
+        pod.status.phase = "Running"
+        pod.status.container_statuses = None
+        pod.status.pod_ip = None
+
+        onclick = re.search(r'onclick="([^"]*)"', ui._pod_row(pod)).group(1)
+        assert html.unescape(onclick) == """viewLogs("it's", "default")"""
+
+    @pytest.mark.unit
+    def test_event_card_tagged_with_type_for_filtering(self):
+        """Test that event cards carry the type attribute the filter stylesheet matches."""
+        from kubectl_mcp_tool.tools import ui
+
+        event = MagicMock()
+        event.type = "Warning"
+        event.last_timestamp = None
+        event.metadata.creation_timestamp = None
+
+        assert 'data-event-type="Warning"' in ui._event_card(event, True)
+        assert 'data-event-type="Warning"' in ui._EVENTS_SCRIPT
+        assert "innerHTML" not in ui._EVENTS_SCRIPT
+
+
+class TestUIPageShell:
+    """Tests for the shared page shell."""
+
+    @pytest.mark.unit
+    def test_minify_css_keeps_rules(self):
+        """Test that minifying drops layout whitespace but keeps values intact."""
+        from kubectl_mcp_tool.tools import ui
+
+        css = """
+body {
+    font-family: 'Segoe UI', sans-serif;
+    margin: 0 auto;
+}
+.a:hover > .b { color: red; }
+"""
+        assert ui._minify_css(css) == "body{font-family:'Segoe UI',sans-serif;margin:0 auto;}.a:hover>.b{color:red;}"
+        assert "\n" not in ui._PAGE_HEAD.split("<style>")[1].split("</style>")[0]
+
+class TestUIJsonOnly:
+    """Tests for skipping HTML rendering on JSON-only hosts."""
+
+    @pytest.mark.unit
+    def test_json_only_hosts_skip_html(self):
+        """Test that tools return their JSON data without rendering HTML when MCP-UI is unavailable."""
+        from kubectl_mcp_tool.tools import ui
+
+        v1 = MagicMock()
+        v1.list_namespaced_event.return_value.items = []
+
+        with patch.object(ui, "get_k8s_client", return_value=v1), \
+                patch.object(ui, "_create_ui_or_fallback") as create_ui:
+            with patch.object(ui, "_JSON_ONLY", True):
+                result = ui.show_events_timeline_ui(namespace="default")
+            create_ui.assert_not_called()
+            assert result == {"success": True, "totalEvents": 0, "warnings": 0, "normal": 0, "events": []}
+
+            with patch.object(ui, "_JSON_ONLY", False):
+                ui.show_events_timeline_ui(namespace="default")
+            assert "Events Timeline" in create_ui.call_args.kwargs["html_content"]
+
+    @pytest.mark.unit
+    def test_fallback_built_only_when_returned(self):
+        """Test that the JSON fallback is not built when the MCP-UI resource is returned."""
+        from kubectl_mcp_tool.tools import ui
+
+        fallback = MagicMock(return_value={"success": True})
+        with patch.object(ui, "MCP_UI_AVAILABLE", True), \
+                patch.object(ui, "UIMetadataKey", create=True), \
+                patch.object(ui, "create_ui_resource", create=True, return_value="resource"):
+            assert ui._create_ui_or_fallback("ui://x", "<p></p>", fallback) == ["resource"]
+        fallback.assert_not_called()
+
+        with patch.object(ui, "MCP_UI_AVAILABLE", False):
+            assert ui._create_ui_or_fallback("ui://x", "<p></p>", fallback) == {"success": True}
+        fallback.assert_called_once()
+
+
+class TestRunKubectl:
+    """Tests for the kubectl subprocess helper."""
+
+    @pytest.mark.unit
+    def test_context_args_are_memoized(self):
+        """Test that context arguments are computed once per context and prepended."""
+        from kubectl_mcp_tool.tools import utils
+
+        utils._kubectl_context_args.cache_clear()
+        with patch.object(utils, "_get_kubectl_context_args", return_value=["--context", "dev"]) as ctx_args, \
+                patch.object(utils.subprocess, "run", return_value=MagicMock(returncode=0, stdout=b"ok")) as run:
+            utils.run_kubectl(["get", "pods"], context="dev")
+            result = utils.run_kubectl(["get", "svc"], context="dev")
+        utils._kubectl_context_args.cache_clear()
+
+        assert result == {"success": True, "output": "ok"}
+        ctx_args.assert_called_once_with("dev")
+        assert run.call_args.args[0][1:] == ["--context", "dev", "get", "svc"]
@@ -10,6 +10,19 @@ from unittest.mock import patch, MagicMock
 import subprocess
 
 
+@pytest.fixture(autouse=True)
+def vcluster_on_path():
+    """Report vcluster as on PATH and start each test with no cached CLI probes or outputs."""
+    from kubectl_mcp_tool.tools.vind import _invalidate_vcluster_results, invalidate_vcluster_cache
+
+    invalidate_vcluster_cache()
+    _invalidate_vcluster_results()
+    with patch("kubectl_mcp_tool.tools.vind.shutil.which", return_value="/usr/local/bin/vcluster") as which:
+        yield which
+    invalidate_vcluster_cache()
+    _invalidate_vcluster_results()
+
+
 class TestVindHelpers:
     """Tests for vind helper functions."""
 
@@ -61,19 +74,46 @@ class TestVindHelpers:
         from kubectl_mcp_tool.tools.vind import _vcluster_available
 
         with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
             result = _vcluster_available()
             assert result is True
+            mock_run.assert_not_called()
 
     @pytest.mark.unit
-    def test_vcluster_available_when_not_installed(self):
+    def test_vcluster_available_when_not_installed(self, vcluster_on_path):
         """Test _vcluster_available returns False when CLI is not installed."""
         from kubectl_mcp_tool.tools.vind import _vcluster_available
 
+        vcluster_on_path.return_value = None
+        result = _vcluster_available()
+        assert result is False
+
+    @pytest.mark.unit
+    def test_vcluster_probes_cached(self):
+        """Test that availability and version probes are reused within the TTL."""
+        from kubectl_mcp_tool.tools import vind
+
         with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError()
-            result = _vcluster_available()
-            assert result is False
+            mock_run.return_value = MagicMock(returncode=0, stdout=b"vcluster version v0.19.0")
+            assert vind._get_vcluster_version() == "v0.19.0"
+            assert vind._get_vcluster_version() == "v0.19.0"
+            assert mock_run.call_count == 1
+
+            with patch.object(vind.time, "monotonic", return_value=vind.time.monotonic() + vind.VCLUSTER_PROBE_TTL):
+                vind._get_vcluster_version()
+            assert mock_run.call_count == 2
+
+    @pytest.mark.unit
+    def test_missing_binary_invalidates_probe_cache(self, vcluster_on_path):
+        """Test that a vanished CLI is reported as unavailable and re-probed next time."""
+        from kubectl_mcp_tool.tools.vind import _run_vcluster, _vcluster_available
+
+        assert _vcluster_available() is True
+        with patch("subprocess.run", side_effect=FileNotFoundError()):
+            result = _run_vcluster(["list"])
+        assert "not available" in result["error"]
+
+        vcluster_on_path.return_value = None
+        assert _vcluster_available() is False
 
     @pytest.mark.unit
     def test_get_vcluster_version(self):
@@ -83,11 +123,26 @@ class TestVindHelpers:
         with patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(
                 returncode=0,
-                stdout="vcluster version v0.19.0"
+                stdout=b"vcluster version v0.19.0"
             )
             result = _get_vcluster_version()
             assert result == "v0.19.0"
 
+    @pytest.mark.unit
+    def test_version_probe_reads_stdout_bytes_only(self):
+        """Test that the version probe runs the resolved CLI and discards stderr."""
+        import subprocess
+        from kubectl_mcp_tool.tools.vind import _get_vcluster_version
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=b"v0.20.1\n")
+            assert _get_vcluster_version() == "v0.20.1"
+
+        args, kwargs = mock_run.call_args
+        assert args[0] == ["/usr/local/bin/vcluster", "version"]
+        assert kwargs["stderr"] is subprocess.DEVNULL
+        assert "text" not in kwargs
+
     @pytest.mark.unit
     def test_get_vcluster_version_not_installed(self):
         """Test _get_vcluster_version returns None when not installed."""
@@ -115,7 +170,6 @@ class TestVindHelpers:
         from kubectl_mcp_tool.tools.vind import _run_vcluster
 
         with patch("subprocess.run") as mock_run:
-            # First call for availability check
             mock_run.return_value = MagicMock(
                 returncode=0,
                 stdout="test output",
@@ -131,11 +185,7 @@ class TestVindHelpers:
         from kubectl_mcp_tool.tools.vind import _run_vcluster
 
         with patch("subprocess.run") as mock_run:
-            # First call succeeds (availability check), second times out
-            mock_run.side_effect = [
-                MagicMock(returncode=0),  # availability check
-                subprocess.TimeoutExpired(cmd="vcluster", timeout=120)
-            ]
+            mock_run.side_effect = subprocess.TimeoutExpired(cmd="vcluster", timeout=120)
             result = _run_vcluster(["create", "test"])
             assert result["success"] is False
             assert "timed out" in result["error"]
@@ -155,6 +205,88 @@ class TestVindHelpers:
             assert result["success"] is True
             assert result["data"] == [{"Name": "test", "Status": "Running"}]
 
+    @pytest.mark.unit
+    def test_run_vcluster_json_parsed_from_bytes(self):
+        """Test that JSON output is captured as bytes and parsed without decoding."""
+        from kubectl_mcp_tool.tools.vind import _run_vcluster
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=b'[{"Name": "dev"}]\n', stderr=b"")
+            assert _run_vcluster(["list"], json_output=True) == {"success": True, "data": [{"Name": "dev"}]}
+            assert mock_run.call_args.kwargs["text"] is False
+
+            mock_run.return_value = MagicMock(returncode=0, stdout=b"no clusters\n", stderr=b"")
+            assert _run_vcluster(["list"], json_output=True) == {"success": True, "output": "no clusters"}
+
+            mock_run.return_value = MagicMock(returncode=1, stdout=b"", stderr=b"boom\n")
+            assert _run_vcluster(["list"], json_output=True) == {"success": False, "error": "boom"}
+
+    @pytest.mark.unit
+    def test_run_vcluster_execs_resolved_path(self, vcluster_on_path):
+        """Test that commands exec the cached absolute CLI path."""
+        from kubectl_mcp_tool.tools.vind import _run_vcluster
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="ok", stderr="")
+            _run_vcluster(["describe", "dev"])
+            _run_vcluster(["logs", "dev"])
+
+        assert [c.args[0][0] for c in mock_run.call_args_list] == ["/usr/local/bin/vcluster"] * 2
+        vcluster_on_path.assert_called_once_with("vcluster")
+
+    @pytest.mark.unit
+    def test_dumps_is_compact_unless_debugging(self):
+        """Test that tool output is compact JSON, and json.dumps(indent=2) with MCP_DEBUG."""
+        from kubectl_mcp_tool.tools import vind
+
+        data = {"success": True, "clusters": [{"name": "dev", "connected": False, "age": None}], "empty": []}
+        with patch.object(vind, "PRETTY_JSON", False):
+            assert vind._dumps(data) == json.dumps(data, separators=(",", ":"))
+        with patch.object(vind, "PRETTY_JSON", True):
+            assert vind._dumps(data) == json.dumps(data, indent=2)
+
+
+class TestSetValues:
+    """Tests for parsing comma-separated set_values."""
+
+    @pytest.mark.unit
+    def test_split_set_values_strips_and_drops_empty(self):
+        """Test that values are stripped and blank entries dropped."""
+        from kubectl_mcp_tool.tools.vind import _split_set_values
+
+        assert _split_set_values(" a=1 ,b=2,, ,c=3 ") == ["a=1", "b=2", "c=3"]
+        assert _split_set_values("") is None
+        assert _split_set_values(" , ") is None
+
+
+class TestCommandArgs:
+    """Tests for building vcluster command arguments."""
+
+    @pytest.mark.unit
+    def test_option_args_skip_empty_values(self):
+        """Test that only flags with a value are emitted, in order."""
+        from kubectl_mcp_tool.tools.vind import _option_args
+
+        assert _option_args(("--namespace", ""), ("--port", 0), ("--tail", 50), ("--set", "a=1")) == [
+            "--tail", "50", "--set", "a=1",
+        ]
+
+    @pytest.mark.unit
+    def test_create_cluster_builds_full_command(self):
+        """Test that every create option reaches the vcluster command."""
+        from kubectl_mcp_tool.tools.vind import vind_create_cluster
+
+        with patch("kubectl_mcp_tool.tools.vind._run_vcluster", return_value={"success": True, "output": ""}) as run:
+            result = vind_create_cluster(
+                "dev", namespace="ns", kubernetes_version="v1.29.0", set_values=["a=1", "b=2"], connect=False
+            )
+
+        assert run.call_args.args[0] == [
+            "create", "dev", "--namespace", "ns", "--kubernetes-version", "v1.29.0",
+            "--set", "a=1", "--set", "b=2", "--connect=false",
+        ]
+        assert result["connected"] is False
+
 
 class TestVindDetect:
     """Tests for vind_detect function."""
@@ -167,7 +299,7 @@ class TestVindDetect:
         with patch("subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(
                 returncode=0,
-                stdout="vcluster version v0.19.0"
+                stdout=b"vcluster version v0.19.0"
             )
             result = vind_detect()
             assert result["installed"] is True
@@ -188,6 +320,20 @@ class TestVindDetect:
             assert result["version"] is None
             assert result["install_instructions"] is not None
 
+    @pytest.mark.unit
+    def test_not_available_results_are_copies(self, vcluster_on_path):
+        """Test that mutating a returned error or detection result does not leak into the next call."""
+        from kubectl_mcp_tool.tools.vind import _run_vcluster, vind_detect
+
+        vcluster_on_path.return_value = None
+        error = _run_vcluster(["list"])
+        error["error"] = "changed"
+        assert "not available" in _run_vcluster(["list"])["error"]
+
+        detection = vind_detect()
+        detection["installed"] = True
+        assert vind_detect()["installed"] is False
+
 
 class TestVindListClusters:
     """Tests for vind_list_clusters function."""
@@ -238,6 +384,209 @@ class TestVindListClusters:
                 assert result["success"] is True
                 assert result["total"] == 0
 
+    @pytest.mark.unit
+    def test_vind_list_clusters_plain_output_parsed_once(self):
+        """Test that non-JSON list output is returned as is after a single parse attempt."""
+        from kubectl_mcp_tool.tools import vind
+
+        with patch("kubectl_mcp_tool.tools.vind.subprocess.run") as mock_run, \
+                patch.object(vind, "_json_loads", side_effect=ValueError) as loads:
+            mock_run.return_value = MagicMock(returncode=0, stdout=b"No vclusters found", stderr=b"")
+            result = vind.vind_list_clusters()
+
+        assert result == {"success": True, "output": "No vclusters found", "clusters": []}
+        loads.assert_called_once()
+
+    @pytest.mark.unit
+    def test_list_and_status_share_recent_list(self):
+        """Test that status reuses a list result from the last few seconds."""
+        from kubectl_mcp_tool.tools.vind import vind_list_clusters, vind_status
+
+        clusters = [{"Name": "dev", "Namespace": "vcluster", "Status": "Running"}]
+        with patch("kubectl_mcp_tool.tools.vind.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(clusters), stderr="")
+            assert vind_list_clusters()["total"] == 1
+            assert vind_status("dev")["cluster"]["status"] == "Running"
+            assert mock_run.call_count == 1
+
+    @pytest.mark.unit
+    def test_cluster_keys_accepted_in_either_case(self):
+        """Test that list and status read capitalized and lower-case cluster keys alike."""
+        from kubectl_mcp_tool.tools.vind import vind_list_clusters, vind_status
+
+        clusters = [
+            {"Name": "dev", "Namespace": "vcluster", "Connected": True, "Pro": True},
+            {"name": "qa", "namespace": "vcluster", "status": "Paused"},
+        ]
+        with patch("kubectl_mcp_tool.tools.vind.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(clusters), stderr="")
+            listed = vind_list_clusters()["clusters"]
+            dev = vind_status("dev")["cluster"]
+            qa = vind_status("qa")["cluster"]
+
+        assert [c["name"] for c in listed] == ["dev", "qa"]
+        assert listed[0]["connected"] is True and "pro" not in listed[0]
+        assert dev["pro"] is True and dev["status"] == ""
+        assert qa["status"] == "Paused" and qa["pro"] is False
+
+    @pytest.mark.unit
+    def test_status_many_uses_one_list(self):
+        """Test that batched status runs vcluster list once and reports missing clusters as None."""
+        from kubectl_mcp_tool.tools.vind import vind_status_many
+
+        clusters = [
+            {"Name": "dev", "Namespace": "vcluster", "Status": "Running"},
+            {"Name": "qa", "Namespace": "other", "Status": "Paused"},
+        ]
+        with patch("kubectl_mcp_tool.tools.vind.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=json.dumps(clusters), stderr="")
+            result = vind_status_many(["dev", "qa", "gone"])
+            assert mock_run.call_count == 1
+
+        assert result["success"] is True
+        assert result["clusters"]["dev"]["status"] == "Running"
+        assert result["clusters"]["qa"] is None
+        assert result["clusters"]["gone"] is None
+
+        with patch("kubectl_mcp_tool.tools.vind.subprocess.run") as mock_run:
+            assert vind_status_many(["qa"], namespace="")["clusters"]["qa"]["status"] == "Paused"
+            mock_run.assert_not_called()
+
+    @pytest.mark.unit
+    def test_failed_list_not_cached(self):
+        """Test that a failed vcluster list is retried on the next call."""
+        from kubectl_mcp_tool.tools.vind import vind_list_clusters
+
+        with patch("kubectl_mcp_tool.tools.vind.subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                MagicMock(returncode=1, stdout="", stderr="no kube context"),
+                MagicMock(returncode=0, stdout="[]", stderr=""),
+            ]
+            assert vind_list_clusters() == {"success": False, "error": "no kube context"}
+            assert vind_list_clusters()["success"] is True
+
+    @pytest.mark.unit
+    def test_expired_list_reloaded_synchronously(self):
+        """Test that a 10s-old vcluster list is reloaded, not served stale."""
+        from kubectl_mcp_tool.tools import vind
+
+        vind.list_cache._entries[("vcluster", "list")] = (
+            vind.time.monotonic() - 10, {"success": True, "output": [{"Name": "gone"}]}
+        )
+        with patch("kubectl_mcp_tool.tools.vind.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="[]", stderr="")
+            result = vind.vind_list_clusters()
+            assert mock_run.call_count == 1
+
+        assert result["success"] is True
+        assert result["clusters"] == []
+
+class TestVindToolOutputCache:
+    """Tests for reusing read-only vind tool outputs."""
+
+    @staticmethod
+    async def _tool(name):
+        from kubectl_mcp_tool.tools.vind import register_vind_tools
+
+        try:
+            from fastmcp import FastMCP
+        except ImportError:
+            from mcp.server.fastmcp import FastMCP
+
+        mcp = FastMCP(name="test")
+        register_vind_tools(mcp)
+        return (await mcp.get_tool(name)).fn
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_identical_calls_reuse_output(self):
+        """Test that a repeated describe with the same arguments skips the CLI."""
+        describe = await self._tool("vind_describe_tool")
+        with patch("kubectl_mcp_tool.tools.vind.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="Name: dev", stderr="")
+            first = describe(name="dev")
+            assert describe(name="dev") == first
+            describe(name="prod")
+            assert mock_run.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_calls_not_reused(self):
+        """Test that an error result is recomputed on the next call."""
+        describe = await self._tool("vind_describe_tool")
+        with patch("kubectl_mcp_tool.tools.vind.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="not found")
+            describe(name="dev")
+            describe(name="dev")
+            assert mock_run.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_changes_drop_cached_lists(self):
+        """Test that a pause makes the next list run the CLI again."""
+        from kubectl_mcp_tool.tools.vind import vind_pause
+
+        list_clusters = await self._tool("vind_list_clusters_tool")
+        with patch("kubectl_mcp_tool.tools.vind.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="[]", stderr="")
+            list_clusters()
+            vind_pause("dev")
+            list_clusters()
+            assert [c.args[0][1] for c in mock_run.call_args_list] == ["list", "pause", "list"]
+
+
+class TestVindLogs:
+    """Tests for reading vcluster logs through a bounded buffer."""
+
+    @staticmethod
+    def _fake_cli(tmp_path, vcluster_on_path, body):
+        import os
+        import sys
+
+        script = tmp_path / "vcluster"
+        script.write_text(f"#!{sys.executable}\nimport sys, time\n{body}\n")
+        os.chmod(script, 0o755)
+        vcluster_on_path.return_value = str(script)
+
+    @pytest.mark.unit
+    def test_logs_keep_newest_whole_lines(self, tmp_path, vcluster_on_path):
+        """Test that output beyond the byte budget drops the oldest lines."""
+        from kubectl_mcp_tool.tools.vind import _run_vcluster_streaming
+
+        self._fake_cli(tmp_path, vcluster_on_path, "for i in range(5000): print('line', i)")
+        result = _run_vcluster_streaming(["logs", "dev"], max_bytes=1000)
+
+        lines = result["output"].splitlines()
+        assert result["truncated"] is True
+        assert lines[-1] == "line 4999"
+        assert all(line.startswith("line ") for line in lines)
+        assert len(result["output"]) <= 1000
+
+    @pytest.mark.unit
+    def test_logs_small_output_untouched(self, tmp_path, vcluster_on_path):
+        """Test that output within the budget is returned whole."""
+        from kubectl_mcp_tool.tools.vind import vind_logs
+
+        self._fake_cli(tmp_path, vcluster_on_path, "print(' '.join(sys.argv[1:]))")
+        assert vind_logs("dev", tail=5) == {"success": True, "output": "logs dev --namespace vcluster --tail 5"}
+
+    @pytest.mark.unit
+    def test_logs_failure_reports_stderr(self, tmp_path, vcluster_on_path):
+        """Test that a failing command returns its stderr."""
+        from kubectl_mcp_tool.tools.vind import vind_logs
+
+        self._fake_cli(tmp_path, vcluster_on_path, "sys.stderr.write('not found\\n'); sys.exit(1)")
+        assert vind_logs("dev") == {"success": False, "error": "not found"}
+
+    @pytest.mark.unit
+    def test_logs_timeout(self, tmp_path, vcluster_on_path):
+        """Test that a command outliving the timeout is killed."""
+        from kubectl_mcp_tool.tools.vind import _run_vcluster_streaming
+
+        self._fake_cli(tmp_path, vcluster_on_path, "time.sleep(30)")
+        result = _run_vcluster_streaming(["logs", "dev"], timeout=0.2)
+        assert result == {"success": False, "error": "Command timed out after 0.2 seconds"}
+
 
 class TestVindCreateCluster:
     """Tests for vind_create_cluster function."""
@@ -381,6 +730,7 @@ class TestVindToolsRegistration:
             "vind_upgrade_tool",
             "vind_describe_tool",
             "vind_platform_start_tool",
+            "vind_status_many_tool",
         ]
         for tool in vind_tools:
             assert tool in tool_names, f"vind tool '{tool}' not registered"
@@ -397,7 +747,29 @@ class TestVindToolsRegistration:
         tools = await server.server.list_tools()
         tool_names = {t.name for t in tools}
         vind_tools = [name for name in tool_names if name.startswith("vind_")]
-        assert len(vind_tools) == 14, f"Expected 14 vind tools, got {len(vind_tools)}: {vind_tools}"
+        assert len(vind_tools) == 15, f"Expected 15 vind tools, got {len(vind_tools)}: {vind_tools}"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_only_stand_in_tools_without_cli(self, vcluster_on_path):
+        """Test that only detect and a stand-in tool are registered when vcluster is missing."""
+        from kubectl_mcp_tool.tools.vind import register_vind_tools
+
+        try:
+            from fastmcp import FastMCP
+        except ImportError:
+            from mcp.server.fastmcp import FastMCP
+
+        vcluster_on_path.return_value = None
+        mcp = FastMCP(name="test")
+        register_vind_tools(mcp)
+
+        tools = await mcp.list_tools()
+        assert sorted(t.name for t in tools) == ["vind_detect_tool", "vind_unavailable_tool"]
+        result = json.loads((await mcp.get_tool("vind_unavailable_tool")).fn())
+        assert result["success"] is False
+        assert "not available" in result["error"]
+        assert "Restart the MCP server" in result["error"]
 
     @pytest.mark.unit
     def test_vind_non_destructive_mode(self, mock_all_kubernetes_apis):
@@ -510,3 +882,26 @@ class TestVindNonDestructiveBlocking:
             result = tool.fn()
             result_dict = json.loads(result)
             assert "installed" in result_dict
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_blocked_tools_keep_schema_and_skip_cli(self, mock_all_kubernetes_apis):
+        """Test that blocked write tools expose the same parameters and never run vcluster."""
+        from kubectl_mcp_tool.tools.vind import register_vind_tools
+
+        try:
+            from fastmcp import FastMCP
+        except ImportError:
+            from mcp.server.fastmcp import FastMCP
+
+        schemas = []
+        for non_destructive in (False, True):
+            mcp = FastMCP(name="test")
+            register_vind_tools(mcp, non_destructive=non_destructive)
+            schemas.append((await mcp.get_tool("vind_upgrade_tool")).parameters)
+        assert schemas[0] == schemas[1]
+
+        with patch("kubectl_mcp_tool.tools.vind.subprocess.run") as mock_run:
+            result = json.loads((await mcp.get_tool("vind_upgrade_tool")).fn(name="dev", set_values="a=1"))
+        assert result == {"success": False, "error": "Operation blocked: non-destructive mode"}
+        mock_run.assert_not_called()